@@ -3,8 +3,13 @@ import json
 import logging
 import sys
 from datetime import datetime, timedelta
-from flask import Flask, jsonify, request, render_template
+from flask import Flask, Response, jsonify, request, render_template
 from mlb_prediction_api import MLBPredictionAPI
+from cache_engine import get_cache_engine
+from http_client import get_http_client
+from response_cache import get_response_cache
+from prediction_events import get_prediction_broadcaster, stream_events, busy_stream
+from cache_snapshot import export_snapshot, import_snapshot, import_snapshot_from
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
@@ -26,6 +31,69 @@ app = Flask(__name__, static_folder='static', template_folder='templates')
 # Initialize MLB prediction API
 mlb_prediction_api = MLBPredictionAPI()
 
+# Snapshot (file path or URL) loaded into the cache at boot, so a fresh
+# instance on an empty disk starts warm
+CACHE_SNAPSHOT = os.environ.get('MLB_CACHE_SNAPSHOT')
+
+# Token required by the snapshot endpoints (both are disabled without one)
+SNAPSHOT_TOKEN = os.environ.get('MLB_SNAPSHOT_TOKEN')
+
+# Environment shown by /api/debug: the app's own settings and the platform
+# basics. Secrets (and the snapshot URL, which may embed credentials) are
+# only reported as set or not.
+DEBUG_ENV_PREFIXES = ('MLB_',)
+DEBUG_ENV_NAMES = ('PORT', 'RENDER', 'RENDER_CACHE_DIR')
+DEBUG_ENV_REDACTED = ('MLB_SNAPSHOT_TOKEN', 'MLB_CACHE_SNAPSHOT')
+
+boot_snapshot = None
+if CACHE_SNAPSHOT:
+    try:
+        boot_snapshot = import_snapshot_from(CACHE_SNAPSHOT, token=SNAPSHOT_TOKEN)
+        logger.info(f"Imported {boot_snapshot['imported']} cache entries from {CACHE_SNAPSHOT}")
+    except Exception as e:
+        logger.error(f"Error importing cache snapshot from {CACHE_SNAPSHOT}: {e}")
+
+# Keep games, pitcher ERAs, team stats and predictions warm off the request
+# path, starting with every advertised date at boot
+if os.environ.get('MLB_DISABLE_SCHEDULER', 'false').lower() != 'true':
+    mlb_prediction_api.warmer.start()
+    mlb_prediction_api.scheduler.start()
+else:
+    mlb_prediction_api.warmer.disable()
+
+# Seconds browsers may reuse a predictions response before revalidating it
+# with If-None-Match
+RESPONSE_MAX_AGE = int(os.environ.get('MLB_RESPONSE_MAX_AGE', 60))
+
+def encoded_response(key, data, last_modified=None, version=None):
+    """
+    Serve a payload from its precomputed encodings
+    
+    The payload is serialized and compressed once per content version (see
+    response_cache.py); requests carrying a matching If-None-Match or
+    If-Modified-Since get a 304 with no body.
+    
+    Args:
+        key: Response cache slot of the payload
+        data: Payload to serve
+        last_modified: Optional Unix timestamp of when the payload was built
+            (no Last-Modified header is sent without one)
+        version: Optional value identifying the payload's content
+    """
+    encoded = get_response_cache().get(key, data, last_modified, version)
+    body, encoding = encoded.negotiate(request.accept_encodings)
+    
+    response = Response(body, mimetype='application/json')
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    response.set_etag(encoded.etag, weak=True)
+    if encoded.last_modified is not None:
+        response.last_modified = encoded.last_modified
+    response.cache_control.public = True
+    response.cache_control.max_age = RESPONSE_MAX_AGE
+    return response.make_conditional(request)
+
 @app.route('/')
 def index():
     """Render the main page"""
@@ -60,61 +128,58 @@ def get_predictions():
         formatted_date = target_date.strftime('%Y-%m-%d')
         logger.info(f"Formatted date: {formatted_date}")
         
-        # Get predictions for the specified date
-        predictions = mlb_prediction_api.get_all_predictions(force_refresh, target_date=formatted_date)
+        # Get predictions for the specified date, or a neighbouring date with games
+        predictions = mlb_prediction_api.get_predictions_with_fallback(formatted_date, force_refresh)
         
-        # Check if predictions are empty
-        if not predictions or len(predictions) == 0:
-            logger.warning(f"No predictions returned for date {formatted_date}")
-            
-            # Try to get predictions for a different date (yesterday or tomorrow)
-            yesterday = (target_date - timedelta(days=1)).strftime('%Y-%m-%d')
-            tomorrow = (target_date + timedelta(days=1)).strftime('%Y-%m-%d')
-            
-            logger.info(f"Trying to get predictions for yesterday: {yesterday}")
-            yesterday_predictions = mlb_prediction_api.get_all_predictions(force_refresh, target_date=yesterday)
-            
-            if yesterday_predictions and len(yesterday_predictions) > 0:
-                logger.info(f"Found {len(yesterday_predictions)} predictions for yesterday")
-                return jsonify(yesterday_predictions)
-            
-            logger.info(f"Trying to get predictions for tomorrow: {tomorrow}")
-            tomorrow_predictions = mlb_prediction_api.get_all_predictions(force_refresh, target_date=tomorrow)
-            
-            if tomorrow_predictions and len(tomorrow_predictions) > 0:
-                logger.info(f"Found {len(tomorrow_predictions)} predictions for tomorrow")
-                return jsonify(tomorrow_predictions)
-            
-            # If still no predictions, use hardcoded sample data as last resort
-            logger.warning("No predictions found for yesterday or tomorrow, using sample data")
+        if not predictions:
+            # If no nearby date has games, use hardcoded sample data as last resort
+            logger.warning(f"No predictions found for {formatted_date} or neighbouring dates, using sample data")
             sample_predictions = get_sample_predictions(formatted_date)
             return jsonify(sample_predictions)
         
-        logger.info(f"Returning {len(predictions)} predictions for date {formatted_date}")
-        return jsonify(predictions)
+        metadata = predictions.get('metadata', {})
+        logger.info(f"Returning {len(predictions.get('games', []))} predictions for {metadata.get('date', formatted_date)}")
+        # A slate build is identified by its timestamp; stale copies of it are marked in metadata
+        version = (metadata['timestamp'], metadata.get('stale')) if metadata.get('timestamp') else None
+        return encoded_response(('predictions', metadata.get('date', formatted_date)), predictions,
+                                metadata.get('timestamp'), version)
     except Exception as e:
         logger.error(f"Error in get_predictions: {e}")
         # Return sample predictions as fallback
         sample_predictions = get_sample_predictions(datetime.now().strftime('%Y-%m-%d'))
         return jsonify(sample_predictions)
 
+@app.route('/api/predictions/stream', methods=['GET'])
+def stream_predictions():
+    """Stream changed game predictions as Server-Sent Events"""
+    date_str = request.args.get('date')
+    last_event_id = request.headers.get('Last-Event-ID')
+    try:
+        last_event_id = int(last_event_id) if last_event_id else None
+    except ValueError:
+        last_event_id = None
+    
+    logger.info(f"Opening prediction stream for date={date_str or 'all'}")
+    subscription = get_prediction_broadcaster().subscribe(date_str, last_event_id)
+    if subscription is None:
+        # Every stream holds a worker thread; keep some for normal requests.
+        # EventSource gives up on error statuses, so the client is sent a
+        # reconnect hint (and polls meanwhile) instead.
+        logger.info("Prediction streams are full; asking the client to retry later")
+        events = busy_stream()
+    else:
+        events = stream_events(subscription)
+    
+    response = Response(events, mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
 @app.route('/api/dates', methods=['GET'])
 def get_available_dates():
     """Get available dates for MLB games"""
     try:
-        # Get today's date
-        today = datetime.now()
-        logger.info(f"Getting available dates starting from {today}")
-        
-        # Generate dates for the next 7 days
-        dates = []
-        for i in range(7):
-            date = today + timedelta(days=i)
-            dates.append({
-                'date': date.strftime('%Y-%m-%d'),
-                'display': date.strftime('%A, %B %d, %Y')
-            })
-        
+        dates = mlb_prediction_api.get_available_dates()
         logger.info(f"Returning {len(dates)} available dates")
         return jsonify({'dates': dates})
     except Exception as e:
@@ -130,17 +195,28 @@ def get_available_dates():
             })
         return jsonify({'dates': dates})
 
+@app.route('/api/live', methods=['GET'])
+def get_liveness():
+    """Liveness probe: 200 whenever the worker is serving requests (the platform health check)"""
+    return jsonify({'alive': True})
+
+@app.route('/api/ready', methods=['GET'])
+def get_readiness():
+    """Readiness probe: 200 once this worker has warmed today's slate, 503 before"""
+    warmup = mlb_prediction_api.warmer.get_status()
+    return jsonify({'ready': warmup['ready'], 'warmup': warmup}), 200 if warmup['ready'] else 503
+
 @app.route('/api/prediction/<game_id>', methods=['GET'])
 def get_prediction(game_id):
     """Get prediction for a specific game"""
     try:
         logger.info(f"Getting prediction for game_id={game_id}")
         force_refresh = request.args.get('refresh', 'false').lower() == 'true'
-        prediction = mlb_prediction_api.get_prediction_for_game_id(game_id, force_refresh)
+        prediction, version = mlb_prediction_api.get_versioned_prediction(game_id, force_refresh)
         
         if prediction:
             logger.info(f"Found prediction for game_id={game_id}")
-            return jsonify(prediction)
+            return encoded_response(('prediction', str(game_id)), prediction, version=version)
         else:
             logger.warning(f"Prediction not found for game_id={game_id}")
             return jsonify({'error': f'Prediction not found for game ID {game_id}'}), 404
@@ -148,6 +224,29 @@ def get_prediction(game_id):
         logger.error(f"Error in get_prediction: {e}")
         return jsonify({'error': f'Error getting prediction: {str(e)}'}), 500
 
+@app.route('/api/markets', methods=['GET'])
+def get_markets():
+    """Get over/under run lines for any thresholds and inning windows"""
+    try:
+        force_refresh = request.args.get('refresh', 'false').lower() == 'true'
+        date_str = request.args.get('date') or datetime.now().strftime('%Y-%m-%d')
+        try:
+            datetime.strptime(date_str, '%Y-%m-%d')
+            thresholds = [float(value) for value in request.args.get('thresholds', '0.5,2.5,3.5').split(',') if value.strip()]
+        except ValueError as e:
+            return jsonify({'error': f'Invalid parameter: {str(e)}'}), 400
+        windows = [value.strip() for value in request.args.get('windows', '').split(',') if value.strip()]
+        
+        logger.info(f"Getting markets for date={date_str}, thresholds={thresholds}, windows={windows or 'all'}")
+        try:
+            markets = mlb_prediction_api.get_markets(date_str, thresholds, windows, force_refresh)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        return jsonify(markets)
+    except Exception as e:
+        logger.error(f"Error in get_markets: {e}")
+        return jsonify({'error': f'Error getting markets: {str(e)}'}), 500
+
 @app.route('/api/status', methods=['GET'])
 def get_status():
     """Get API status"""
@@ -159,6 +258,7 @@ def get_status():
             'version': '2.3.0',
             'data_source': 'MLB Stats API (Official)',
             'last_refresh': datetime.fromtimestamp(mlb_prediction_api.last_refresh_time).strftime("%Y-%m-%d %H:%M:%S") if mlb_prediction_api.last_refresh_time > 0 else 'Never',
+            'scheduler': mlb_prediction_api.scheduler.get_status(),
             'environment': os.environ.get('RENDER', 'local')
         })
     except Exception as e:
@@ -171,15 +271,17 @@ def get_status():
 
 @app.route('/api/refresh', methods=['POST'])
 def refresh_data():
-    """Force refresh of all data"""
+    """Start a background refresh of all data (joining one already running)"""
     try:
-        logger.info("Forcing data refresh")
-        mlb_prediction_api.refresh_data_if_needed(force_refresh=True)
+        logger.info("Requesting data refresh")
+        job = mlb_prediction_api.start_refresh()
         return jsonify({
-            'status': 'success',
-            'message': 'Data refreshed successfully',
+            'status': 'accepted',
+            'job_id': job['job_id'],
+            'job': job,
+            'status_url': f"/api/refresh/{job['job_id']}",
             'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        })
+        }), 202
     except Exception as e:
         logger.error(f"Error in refresh_data: {e}")
         return jsonify({
@@ -188,6 +290,38 @@ def refresh_data():
             'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }), 500
 
+@app.route('/api/refresh/<job_id>', methods=['GET'])
+def get_refresh_status(job_id):
+    """Get the stage-level progress of a refresh job"""
+    job = mlb_prediction_api.get_refresh_status(job_id)
+    if job is None:
+        return jsonify({'error': f'Refresh job {job_id} not found'}), 404
+    return jsonify(job)
+
+@app.route('/api/cache/snapshot', methods=['GET'])
+def get_cache_snapshot():
+    """Download the cache as a compressed snapshot"""
+    if not SNAPSHOT_TOKEN or request.headers.get('X-Snapshot-Token') != SNAPSHOT_TOKEN:
+        return jsonify({'error': 'Snapshot export requires MLB_SNAPSHOT_TOKEN'}), 403
+    
+    logger.info("Exporting cache snapshot")
+    response = Response(export_snapshot(), mimetype='application/gzip')
+    response.headers['Content-Disposition'] = 'attachment; filename=mlb-cache-snapshot.json.gz'
+    return response
+
+@app.route('/api/cache/snapshot', methods=['POST'])
+def post_cache_snapshot():
+    """Load a compressed snapshot (the request body) into the cache"""
+    if not SNAPSHOT_TOKEN or request.headers.get('X-Snapshot-Token') != SNAPSHOT_TOKEN:
+        return jsonify({'error': 'Snapshot import requires MLB_SNAPSHOT_TOKEN'}), 403
+    
+    try:
+        result = import_snapshot(request.get_data())
+    except (ValueError, OSError, EOFError) as e:
+        return jsonify({'error': f'Invalid snapshot: {str(e)}'}), 400
+    logger.info(f"Imported {result['imported']} cache entries from an uploaded snapshot")
+    return jsonify(result)
+
 @app.route('/api/debug', methods=['GET'])
 def get_debug_info():
     """Get debug information"""
@@ -195,7 +329,11 @@ def get_debug_info():
         logger.info("Getting debug information")
         
         # Get environment variables
-        env_vars = {key: value for key, value in os.environ.items() if not key.startswith('AWS_') and not key.startswith('GOOGLE_')}
+        env_vars = {
+            key: '<redacted>' if key in DEBUG_ENV_REDACTED else value
+            for key, value in os.environ.items()
+            if key.startswith(DEBUG_ENV_PREFIXES) or key in DEBUG_ENV_NAMES
+        }
         
         # Get cache directory information
         cache_dir = os.environ.get('RENDER_CACHE_DIR', '/tmp')
@@ -206,13 +344,18 @@ def get_debug_info():
             'cache_path': cache_path,
             'exists': os.path.exists(cache_path),
             'is_dir': os.path.isdir(cache_path) if os.path.exists(cache_path) else False,
-            'writable': os.access(cache_path, os.W_OK) if os.path.exists(cache_path) else False
+            'writable': os.access(cache_path, os.W_OK) if os.path.exists(cache_path) else False,
+            'stats': get_cache_engine().get_stats()
         }
         
         # Get API information
         api_info = {
             'last_refresh_time': mlb_prediction_api.last_refresh_time,
-            'last_refresh_formatted': datetime.fromtimestamp(mlb_prediction_api.last_refresh_time).strftime("%Y-%m-%d %H:%M:%S") if mlb_prediction_api.last_refresh_time > 0 else 'Never'
+            'last_refresh_formatted': datetime.fromtimestamp(mlb_prediction_api.last_refresh_time).strftime("%Y-%m-%d %H:%M:%S") if mlb_prediction_api.last_refresh_time > 0 else 'Never',
+            'upstream': get_http_client().get_stats(),
+            'responses': get_response_cache().get_stats(),
+            'stream': get_prediction_broadcaster().get_stats(),
+            'boot_snapshot': boot_snapshot
         }
         
         return jsonify({
@@ -1,8 +1,10 @@
-import requests
 import json
 import os
 from datetime import datetime
 from bs4 import BeautifulSoup
+from cache_engine import get_cache_engine
+from http_client import get_http_client
+from team_registry import get_team
 
 class BaseballReferenceAPI:
     """
@@ -13,42 +15,17 @@ class BaseballReferenceAPI:
         """Initialize the Baseball Reference API client"""
         self.base_url = "https://www.baseball-reference.com"
         self.cache_dir = 'cache/bbref'
-        self.cache_expiry = 3600 * 3  # Cache expiry in seconds (3 hours)
-        os.makedirs(self.cache_dir, exist_ok=True)
+        self.cache = get_cache_engine().namespace('bbref', self.cache_dir, layout='envelope')
+        self.http = get_http_client()
+        self.cache_expiry = self.cache.ttl  # Cache expiry in seconds
     
     def get_cached_data(self, cache_key):
         """Get data from cache if available and not expired"""
-        cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-        
-        if os.path.exists(cache_file):
-            try:
-                with open(cache_file, 'r') as f:
-                    cached_data = json.load(f)
-                
-                # Check if cache is expired
-                cache_time = cached_data.get('cache_time', 0)
-                if (datetime.now() - datetime.fromtimestamp(cache_time)).total_seconds() < self.cache_expiry:
-                    return cached_data.get('data')
-            except Exception as e:
-                print(f"Error reading Baseball Reference cache: {e}")
-        
-        return None
+        return self.cache.get(cache_key)
     
     def save_to_cache(self, cache_key, data):
         """Save data to cache"""
-        cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-        
-        try:
-            with open(cache_file, 'w') as f:
-                json.dump({
-                    'data': data,
-                    'cache_time': datetime.now().timestamp()
-                }, f)
-            
-            return True
-        except Exception as e:
-            print(f"Error saving Baseball Reference data to cache: {e}")
-            return False
+        return self.cache.set(cache_key, data)
     
     def scrape_pitcher_stats(self, team_abbr, pitcher_name):
         """
@@ -63,7 +40,7 @@ class BaseballReferenceAPI:
         try:
             # Get team page
             team_url = f"{self.base_url}/teams/{team_abbr}/2025.shtml"
-            response = requests.get(team_url, headers={'User-Agent': 'Mozilla/5.0'})
+            response = self.http.get(team_url, headers={'User-Agent': 'Mozilla/5.0'})
             soup = BeautifulSoup(response.text, 'html.parser')
             
             # Find pitcher in roster
@@ -93,7 +70,7 @@ class BaseballReferenceAPI:
             
             # Get pitcher stats page
             full_pitcher_url = f"{self.base_url}{pitcher_url}"
-            response = requests.get(full_pitcher_url, headers={'User-Agent': 'Mozilla/5.0'})
+            response = self.http.get(full_pitcher_url, headers={'User-Agent': 'Mozilla/5.0'})
             soup = BeautifulSoup(response.text, 'html.parser')
             
             # Find stats in standard pitching table
@@ -168,47 +145,9 @@ class BaseballReferenceAPI:
         """
         Get Baseball Reference team abbreviation from team name
         """
-        team_map = {
-            'Arizona Diamondbacks': 'ARI',
-            'Atlanta Braves': 'ATL',
-            'Baltimore Orioles': 'BAL',
-            'Boston Red Sox': 'BOS',
-            'Chicago Cubs': 'CHC',
-            'Chicago White Sox': 'CHW',
-            'Cincinnati Reds': 'CIN',
-            'Cleveland Guardians': 'CLE',
-            'Colorado Rockies': 'COL',
-            'Detroit Tigers': 'DET',
-            'Houston Astros': 'HOU',
-            'Kansas City Royals': 'KCR',
-            'Los Angeles Angels': 'LAA',
-            'Los Angeles Dodgers': 'LAD',
-            'Miami Marlins': 'MIA',
-            'Milwaukee Brewers': 'MIL',
-            'Minnesota Twins': 'MIN',
-            'New York Mets': 'NYM',
-            'New York Yankees': 'NYY',
-            'Oakland Athletics': 'OAK',
-            'Philadelphia Phillies': 'PHI',
-            'Pittsburgh Pirates': 'PIT',
-            'San Diego Padres': 'SDP',
-            'Seattle Mariners': 'SEA',
-            'San Francisco Giants': 'SFG',
-            'St. Louis Cardinals': 'STL',
-            'Tampa Bay Rays': 'TBR',
-            'Texas Rangers': 'TEX',
-            'Toronto Blue Jays': 'TOR',
-            'Washington Nationals': 'WSN'
-        }
-        
-        # Try exact match first
-        if team_name in team_map:
-            return team_map[team_name]
-        
-        # Try partial match
-        for full_name, abbr in team_map.items():
-            if team_name in full_name:
-                return abbr
+        team = get_team(team_name)
+        if team:
+            return team.bbref_id
         
         # Return default if no match
         return None
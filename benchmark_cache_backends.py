@@ -0,0 +1,81 @@
+"""
+Benchmark the file and SQLite cache backends
+
+Writes, cold-reads (memory tier bypassed) and clears a slate-sized set of
+entries with each backend and prints the timings.
+
+Usage:
+    python benchmark_cache_backends.py [entries]
+"""
+import sys
+import time
+import shutil
+import tempfile
+from cache_engine import CacheEngine
+
+
+def sample_entry(i):
+    """Build an entry roughly the size of a cached per-game prediction"""
+    return {
+        'game_id': i,
+        'home_team': 'New York Yankees',
+        'away_team': 'Boston Red Sox',
+        'predictions': {
+            'nrfi': {'prediction': 'YES', 'confidence': 62.5},
+            'over_under': {'prediction': 'OVER', 'line': 8.5, 'confidence': 55.0},
+            'moneyline': {'prediction': 'HOME', 'confidence': 58.0}
+        },
+        'factors': [{'name': f'factor_{j}', 'value': j * 0.1} for j in range(10)]
+    }
+
+
+def run_benchmark(backend, entries, work_dir):
+    engine = CacheEngine(memory_entries=entries * 2, backend=backend, db_path=f"{work_dir}/cache.sqlite3")
+    cache = engine.namespace('predictions', f"{work_dir}/{backend}")
+    data = {f"game_predictions_{i}": sample_entry(i) for i in range(entries)}
+    timings = {}
+
+    start = time.perf_counter()
+    for key, value in data.items():
+        cache.set(key, value)
+    timings['write'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    cache.set_many(data)
+    timings['bulk_write'] = time.perf_counter() - start
+
+    engine.memory_clear(cache.cache_dir)
+    start = time.perf_counter()
+    for key in data:
+        cache.get(key)
+    timings['cold_read'] = time.perf_counter() - start
+
+    engine.memory_clear(cache.cache_dir)
+    start = time.perf_counter()
+    cache.get_many(list(data))
+    timings['bulk_read'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    cache.delete()
+    timings['clear'] = time.perf_counter() - start
+
+    return timings
+
+
+def main():
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    work_dir = tempfile.mkdtemp(prefix='mlb_cache_bench_')
+
+    try:
+        print(f"Benchmarking cache backends with {entries} entries")
+        print(f"{'backend':<8} {'write':>9} {'bulk_write':>11} {'cold_read':>10} {'bulk_read':>10} {'clear':>9}")
+        for backend in ('file', 'sqlite'):
+            t = run_benchmark(backend, entries, work_dir)
+            print(f"{backend:<8} {t['write']:>8.3f}s {t['bulk_write']:>10.3f}s "
+                  f"{t['cold_read']:>9.3f}s {t['bulk_read']:>9.3f}s {t['clear']:>8.3f}s")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
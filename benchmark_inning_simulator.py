@@ -0,0 +1,57 @@
+"""
+Benchmark the Monte Carlo inning simulator
+
+Simulates a 15-game slate on one core and split across several worker
+processes and prints game trials simulated per second.
+
+Usage:
+    python benchmark_inning_simulator.py [trials] [workers]
+"""
+import os
+import sys
+import time
+import random
+from concurrent.futures import ProcessPoolExecutor
+from inning_simulator import simulate_slate
+
+SLATE_SIZE = 15
+
+
+def simulate_chunk(args):
+    home_eras, away_eras, game_keys, trials = args
+    simulate_slate(home_eras, away_eras, game_keys=game_keys, trials=trials)
+    return len(game_keys)
+
+
+def trials_per_second(home_eras, away_eras, trials, workers):
+    game_keys = list(range(len(home_eras)))
+    chunks = [
+        (home_eras[i::workers], away_eras[i::workers], game_keys[i::workers], trials)
+        for i in range(workers)
+    ]
+
+    start = time.perf_counter()
+    if workers == 1:
+        simulate_chunk(chunks[0])
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(simulate_chunk, chunks))
+    return len(game_keys) * trials / (time.perf_counter() - start)
+
+
+def main():
+    trials = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    rng = random.Random(2025)
+    home_eras = [round(rng.uniform(1.5, 7.0), 2) for _ in range(SLATE_SIZE)]
+    away_eras = [round(rng.uniform(1.5, 7.0), 2) for _ in range(SLATE_SIZE)]
+
+    print(f"Simulating {SLATE_SIZE} games x {trials} trials (9 innings)")
+    print(f"{'workers':>7} {'trials/s':>12}")
+    for count in sorted({1, workers}):
+        rate = trials_per_second(home_eras, away_eras, trials, count)
+        print(f"{count:>7} {rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark the vectorized slate scorer against the scalar probability calculators
+
+Scores the pitcher-score markets (the run lines come from the inning
+simulator) for a 15-game slate and a full-season batch (2,430 games)
+with each implementation and prints games scored per second.
+
+Usage:
+    python benchmark_slate_scoring.py [repeats]
+"""
+import sys
+import time
+import random
+from mlb_prediction_api import MLBPredictionAPI
+from slate_scoring import score_slate
+
+BATCH_SIZES = {'slate': 15, 'season': 2430}
+
+
+def scalar_scores(api, home_eras, away_eras):
+    results = []
+    for home_era, away_era in zip(home_eras, away_eras):
+        nrfi = api.calculate_first_inning_no_run_probability(home_era, away_era, 'Home', 'Away')
+        results.append(api.get_rating(nrfi))
+    return results
+
+
+def games_per_second(fn, games, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return games * repeats / (time.perf_counter() - start)
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    # The scalar calculators don't touch instance state
+    api = MLBPredictionAPI.__new__(MLBPredictionAPI)
+    rng = random.Random(2025)
+
+    print(f"{'batch':<8} {'games':>6} {'scalar games/s':>16} {'vectorized games/s':>20} {'speedup':>8}")
+    for name, games in BATCH_SIZES.items():
+        home_eras = [str(round(rng.uniform(1.5, 7.0), 2)) for _ in range(games)]
+        away_eras = [str(round(rng.uniform(1.5, 7.0), 2)) for _ in range(games)]
+
+        scalar = games_per_second(lambda: scalar_scores(api, home_eras, away_eras), games, repeats)
+        vectorized = games_per_second(lambda: score_slate(home_eras, away_eras), games, repeats)
+        print(f"{name:<8} {games:>6} {scalar:>16,.0f} {vectorized:>20,.0f} {vectorized / scalar:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1274 @@
+import os
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from urllib.parse import quote, unquote
+from ttl_policy import NAMESPACE_POLICIES
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+logger = logging.getLogger('cache_engine')
+
+# Default time-to-live (in seconds) for every cache namespace in the app.
+# This is the single place to tune how long each kind of data is kept;
+# namespaces with a TTL policy (see ttl_policy.NAMESPACE_POLICIES) override
+# it per entry for final games, other dates and season aggregates.
+NAMESPACE_TTLS = {
+    'mlb_stats': 15 * 60,
+    'predictions': 15 * 60,
+    'game_index': 3600 * 24 * 7,
+    'mlb_data': 15 * 60,
+    'integrated_espn': 15 * 60,
+    'espn_live': 30 * 60,
+    'espn_direct': 3600 * 1,
+    'espn': 3600 * 3,
+    'bbref': 3600 * 3,
+    'mlb_direct': 3600 * 3,
+    'weather': 3600 * 3,
+    'first_inning': 3600 * 12,
+    'scheduler': 3600 * 24
+}
+
+# Number of entries held by the in-process LRU tier
+DEFAULT_MEMORY_ENTRIES = int(os.environ.get('MLB_CACHE_MEMORY_ENTRIES', 2048))
+
+# Disk tier backend: 'file' (one JSON file per entry) or 'sqlite' (one
+# SQLite database shared by every namespace, see sqlite_cache.py)
+DEFAULT_BACKEND = os.environ.get('MLB_CACHE_BACKEND', 'file')
+
+# Longest time (in seconds) a worker waits on another worker's fill lease
+# before giving up and computing the value itself
+DEFAULT_LEASE_TIMEOUT = int(os.environ.get('MLB_CACHE_LEASE_TIMEOUT', 120))
+
+# Re-check interval (in seconds) of a negative result (a lookup that found
+# no real value) after its first miss; it doubles with every consecutive
+# miss, up to the maximum
+DEFAULT_NEGATIVE_TTL = int(os.environ.get('MLB_NEGATIVE_CACHE_TTL', 5 * 60))
+DEFAULT_NEGATIVE_MAX_TTL = int(os.environ.get('MLB_NEGATIVE_CACHE_MAX_TTL', 6 * 3600))
+
+# How long (in seconds) expired entries are kept for stale serving before a
+# purge deletes them (matches the hard expiry of stale predictions), and how
+# long entries that never expire are kept at all
+PURGE_GRACE = int(os.environ.get('MLB_PREDICTIONS_HARD_EXPIRY', 6 * 3600))
+PURGE_RETENTION = int(os.environ.get('MLB_CACHE_RETENTION', 30 * 24 * 3600))
+
+
+@contextmanager
+def file_lease(lock_path, timeout):
+    """
+    Hold an exclusive cross-process lock on a file for the duration of a block
+
+    The lock is an flock(), so it is released by the kernel if the holding
+    worker dies. Waiters give up after the timeout and proceed unlocked.
+    The holder deletes the lock file on release, so per-key leases don't
+    leave files behind; a waiter that locked a file deleted in the meantime
+    retries on the new one.
+
+    Args:
+        lock_path: Path of the lock file
+        timeout: Maximum number of seconds to wait for the lock
+
+    Yields:
+        True if the lock was acquired, False if the wait timed out
+    """
+    if fcntl is None:
+        yield True
+        return
+
+    lock_file = None
+    acquired = False
+    try:
+        deadline = time.time() + timeout
+        while True:
+            lock_file = open(lock_path, 'a+')
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                if _is_current_lock_file(lock_file, lock_path):
+                    acquired = True
+                    break
+            except BlockingIOError:
+                pass
+            # Locked by someone else, or locked after its holder deleted it
+            lock_file.close()
+            lock_file = None
+            if time.time() >= deadline:
+                logger.warning(f"Timed out waiting for cache lease {lock_path}")
+                break
+            time.sleep(0.05)
+        yield acquired
+    finally:
+        if acquired:
+            try:
+                os.remove(lock_path)
+            except FileNotFoundError:
+                pass
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        if lock_file is not None:
+            lock_file.close()
+
+
+def _is_current_lock_file(lock_file, lock_path):
+    try:
+        path_stat = os.stat(lock_path)
+    except FileNotFoundError:
+        return False
+    file_stat = os.fstat(lock_file.fileno())
+    return (file_stat.st_dev, file_stat.st_ino) == (path_stat.st_dev, path_stat.st_ino)
+
+
+def remove_idle_lock_files(cache_dir):
+    """
+    Delete lock files left in a cache directory that nobody holds (e.g. by a
+    worker that died holding a lease)
+
+    Args:
+        cache_dir: Cache directory
+    """
+    for file in os.listdir(cache_dir):
+        if not file.endswith('.lock'):
+            continue
+        with file_lease(os.path.join(cache_dir, file), 0):
+            pass
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key within a process
+
+    The first caller for a key runs the function; callers that arrive while it
+    is running wait for it and receive the same result (or exception).
+    """
+
+    class _Call:
+        def __init__(self):
+            self.event = threading.Event()
+            self.result = None
+            self.error = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def in_flight(self, key):
+        """Check whether a call for key is currently running"""
+        with self._lock:
+            return key in self._calls
+
+    def do(self, key, fn):
+        """
+        Run fn once for all concurrent callers of key
+
+        Args:
+            key: Hashable key identifying the call
+            fn: Zero-argument callable producing the result
+
+        Returns:
+            Result of fn
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+
+class FileBackend:
+    """
+    Disk tier that stores one JSON file per cache key
+
+    Two on-disk layouts are supported so existing cache directories keep working:
+    'raw' files hold the data itself and use the file mtime as the store time,
+    'envelope' files hold {'data': ..., 'cache_time': ...}.
+    """
+
+    kind = 'file'
+
+    def __init__(self, cache_dir, layout='raw'):
+        """
+        Initialize the file backend
+
+        Args:
+            cache_dir: Directory to store cache files
+            layout: On-disk layout, either 'raw' or 'envelope'
+        """
+        if layout not in ('raw', 'envelope'):
+            raise ValueError(f"Unknown cache layout: {layout}")
+
+        self.cache_dir = cache_dir
+        self.layout = layout
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def path_for(self, cache_key):
+        """Get the file path for a cache key"""
+        return os.path.join(self.cache_dir, f"{cache_key}.json")
+
+    def lock_path_for(self, cache_key):
+        """Get the fill-lease lock file path for a cache key"""
+        return os.path.join(self.cache_dir, f"{cache_key}.lock")
+
+    def keys(self):
+        """List every key stored in the cache directory"""
+        return [
+            file[:-len('.json')] for file in os.listdir(self.cache_dir)
+            if file.endswith('.json') and not file.startswith('_')
+        ]
+
+    def read(self, cache_key):
+        """
+        Read an entry from disk
+
+        Args:
+            cache_key: Key to identify the cache file
+
+        Returns:
+            Tuple of (data, stored_at) or None if the entry does not exist
+        """
+        cache_file = self.path_for(cache_key)
+
+        try:
+            with open(cache_file, 'r') as f:
+                if self.layout == 'raw':
+                    stored_at = os.fstat(f.fileno()).st_mtime
+                    return json.load(f), stored_at
+
+                cached_data = json.load(f)
+                return cached_data.get('data'), cached_data.get('cache_time', 0)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Error reading cache file {cache_file}: {e}")
+            return None
+
+    def read_many(self, cache_keys):
+        """
+        Read several entries from disk
+
+        Args:
+            cache_keys: Keys to read
+
+        Returns:
+            Dictionary mapping each found key to (data, stored_at)
+        """
+        entries = {}
+        for cache_key in cache_keys:
+            entry = self.read(cache_key)
+            if entry is not None:
+                entries[cache_key] = entry
+        return entries
+
+    def write(self, cache_key, data, stored_at, expires_at=None):
+        """
+        Write an entry to disk atomically
+
+        Args:
+            cache_key: Key to identify the cache file
+            data: Data to save
+            stored_at: Timestamp the data was stored at
+            expires_at: Timestamp the data expires at (unused by the file layout)
+        """
+        cache_file = self.path_for(cache_key)
+        tmp_file = f"{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+        payload = data if self.layout == 'raw' else {'data': data, 'cache_time': stored_at}
+
+        with open(tmp_file, 'w') as f:
+            json.dump(payload, f)
+        if self.layout == 'raw':
+            # The raw layout reads the store time back from the mtime
+            os.utime(tmp_file, (stored_at, stored_at))
+        os.replace(tmp_file, cache_file)
+
+    def write_many(self, entries, stored_at, expires_at=None):
+        """
+        Write several entries to disk
+
+        Args:
+            entries: Dictionary mapping cache key to data
+            stored_at: Timestamp the data was stored at
+            expires_at: Timestamp the data expires at (unused by the file layout)
+        """
+        for cache_key, data in entries.items():
+            self.write(cache_key, data, stored_at, expires_at)
+
+    def delete(self, cache_key):
+        """Delete a single entry from disk"""
+        try:
+            os.remove(self.path_for(cache_key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        """Delete every entry in the cache directory"""
+        for file in os.listdir(self.cache_dir):
+            if file.endswith('.json'):
+                os.remove(os.path.join(self.cache_dir, file))
+        remove_idle_lock_files(self.cache_dir)
+
+
+class DependencyIndex:
+    """
+    Sharded on-disk multimap from a namespace's cache keys to dependency ids
+
+    Each namespace keeps two of these (see CacheNamespace): one from its
+    inputs to the entries derived from them, and one from its derived
+    entries to their inputs, so a dependent's edges can be dropped again
+    when it is evicted. Dependency ids look like "<namespace>:<cache_key>"
+    (see CacheNamespace.dependency_id). Every key is a small JSON file, so a
+    write only costs the edges of the keys it touches and other workers see
+    it without reloading a whole index.
+    """
+
+    def __init__(self, index_dir):
+        """
+        Initialize the dependency index
+
+        Args:
+            index_dir: Directory holding one file per cache key
+        """
+        self.index_dir = index_dir
+        self.lock_path = f"{index_dir}.lock"
+        self._lock = threading.Lock()
+
+    def _path(self, cache_key):
+        return os.path.join(self.index_dir, f"{quote(cache_key, safe='')}.json")
+
+    def _read(self, cache_key):
+        try:
+            with open(self._path(cache_key), 'r') as f:
+                return set(json.load(f))
+        except FileNotFoundError:
+            return set()
+        except Exception as e:
+            logger.error(f"Error reading dependency index {self._path(cache_key)}: {e}")
+            return set()
+
+    def _write(self, cache_key, ids):
+        path = self._path(cache_key)
+        if not ids:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            return
+
+        os.makedirs(self.index_dir, exist_ok=True)
+        tmp_file = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump(sorted(ids), f)
+        os.replace(tmp_file, path)
+
+    @contextmanager
+    def _locked(self):
+        with self._lock, file_lease(self.lock_path, DEFAULT_LEASE_TIMEOUT):
+            yield
+
+    def keys(self):
+        """Get every cache key with recorded dependency ids"""
+        try:
+            files = os.listdir(self.index_dir)
+        except FileNotFoundError:
+            return []
+        return [unquote(file[:-len('.json')]) for file in files if file.endswith('.json')]
+
+    def get(self, cache_key):
+        """Get the dependency ids recorded for a cache key"""
+        return self._read(cache_key)
+
+    def has(self, cache_key):
+        """Check whether any dependency id is recorded for a cache key"""
+        return os.path.exists(self._path(cache_key))
+
+    def add(self, cache_key, ids):
+        """
+        Record dependency ids for a cache key
+
+        Args:
+            cache_key: Cache key
+            ids: Iterable of dependency ids
+        """
+        with self._locked():
+            self._write(cache_key, self._read(cache_key) | set(ids))
+
+    def discard(self, cache_key, ids):
+        """
+        Forget dependency ids of a cache key
+
+        Args:
+            cache_key: Cache key
+            ids: Iterable of dependency ids
+        """
+        with self._locked():
+            current = self._read(cache_key)
+            if current:
+                self._write(cache_key, current - set(ids))
+
+    def replace(self, cache_key, ids):
+        """
+        Replace the dependency ids of a cache key
+
+        Args:
+            cache_key: Cache key
+            ids: Iterable of dependency ids
+
+        Returns:
+            Set of the ids recorded before
+        """
+        with self._locked():
+            previous = self._read(cache_key)
+            self._write(cache_key, set(ids))
+            return previous
+
+    def pop(self, match):
+        """
+        Remove and return the dependency ids of matching cache keys
+
+        Args:
+            match: Callable taking a cache key and returning True to pop it
+
+        Returns:
+            Set of dependency ids
+        """
+        with self._locked():
+            ids = set()
+            for cache_key in self.keys():
+                if match(cache_key):
+                    ids.update(self._read(cache_key))
+                    self._write(cache_key, set())
+            return ids
+
+
+class CacheNamespace:
+    """
+    A named slice of the shared cache with its own disk backend and TTL
+    """
+
+    def __init__(self, engine, name, backend, ttl, policy=None):
+        """
+        Initialize the cache namespace
+
+        Args:
+            engine: Owning CacheEngine
+            name: Namespace name (used for TTL lookup and stats)
+            backend: Disk tier backend
+            ttl: Time-to-live in seconds
+            policy: Optional TTLPolicy picking each entry's TTL, with ttl as
+                the default
+        """
+        self.engine = engine
+        self.name = name
+        self.backend = backend
+        self.ttl = ttl
+        self.policy = policy
+        self.dependents = DependencyIndex(os.path.join(backend.cache_dir, '_dependents'))
+        self.inputs = DependencyIndex(os.path.join(backend.cache_dir, '_inputs'))
+        self.stats = {
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'expired': 0,
+            'writes': 0,
+            'fills': 0,
+            'stale_hits': 0,
+            'invalidations': 0,
+            'negative_hits': 0,
+            'negative_writes': 0,
+            'errors': 0
+        }
+
+    @property
+    def cache_dir(self):
+        return self.backend.cache_dir
+
+    def _memory_key(self, cache_key):
+        return (self.backend.cache_dir, cache_key)
+
+    def ttl_for(self, cache_key, data):
+        """Get an entry's time-to-live in seconds (None if it never expires)"""
+        if self.policy is None:
+            return self.ttl
+        return self.policy.ttl_for(cache_key, data, self.ttl)
+
+    def is_fresh(self, cache_key, data, stored_at, now):
+        """Check whether an entry stored at stored_at is still within its TTL"""
+        ttl = self.ttl_for(cache_key, data)
+        return ttl is None or now - stored_at < ttl
+
+    def expires_at(self, cache_key, data, stored_at):
+        """Get the timestamp an entry expires at (None if it never expires)"""
+        ttl = self.ttl_for(cache_key, data)
+        return stored_at + ttl if ttl is not None else None
+
+    def dependency_id(self, cache_key):
+        """Get the id other entries use to declare a dependency on cache_key"""
+        return f"{self.name}:{cache_key}"
+
+    def get(self, cache_key):
+        """
+        Get data from cache if it exists and is not expired
+
+        The in-process LRU tier is consulted first; on a miss the disk tier is
+        read and the entry is promoted into memory. Returned objects are shared
+        with the cache and must be treated as read-only; callers that need to
+        modify one copy it first.
+
+        Args:
+            cache_key: Key to identify the cache entry
+
+        Returns:
+            Cached data if it exists and is not expired, None otherwise
+        """
+        entry = self.get_entry(cache_key)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, cache_key):
+        """
+        Get an unexpired entry together with the time it was stored
+
+        Reads the tiers as get() does; the store time identifies the entry's
+        content, e.g. as a response version.
+
+        Args:
+            cache_key: Key to identify the cache entry
+
+        Returns:
+            Tuple of (data, stored_at) if the entry exists and is not expired,
+            None otherwise
+        """
+        now = time.time()
+        memory_key = self._memory_key(cache_key)
+
+        entry = self.engine.memory_get(memory_key)
+        if entry is not None:
+            data, stored_at = entry
+            if self.is_fresh(cache_key, data, stored_at, now):
+                self.stats['memory_hits'] += 1
+                return entry
+            self.engine.memory_delete(memory_key)
+
+        entry = self.backend.read(cache_key)
+        if entry is None:
+            self.stats['misses'] += 1
+            return None
+
+        data, stored_at = entry
+        if not self.is_fresh(cache_key, data, stored_at, now):
+            logger.debug(f"Cache expired for {self.name}/{cache_key}")
+            self.stats['expired'] += 1
+            return None
+
+        self.stats['disk_hits'] += 1
+        self.engine.memory_put(memory_key, data, stored_at)
+        return data, stored_at
+
+    def set(self, cache_key, data, depends_on=None):
+        """
+        Save data to both cache tiers
+
+        If entries were derived from this one, they are invalidated unless
+        the entry already held the same value. A missing previous value (e.g.
+        one that was purged, or a lookup that only had a negative result)
+        counts as a change.
+
+        Args:
+            cache_key: Key to identify the cache entry
+            data: JSON-serializable data to save
+            depends_on: Optional list of input ids (see dependency_id) this
+                data was derived from; invalidating any of them evicts it
+
+        Returns:
+            True if the data was written to disk, False otherwise
+        """
+        if self.dependents.has(cache_key):
+            previous = self.peek(cache_key)
+            if previous is None or previous[0] != data:
+                self.engine.invalidate(self.dependency_id(cache_key))
+
+        if depends_on:
+            self.engine.link(self, cache_key, depends_on)
+
+        stored_at = time.time()
+        self.engine.memory_put(self._memory_key(cache_key), data, stored_at)
+
+        try:
+            self.backend.write(cache_key, data, stored_at, self.expires_at(cache_key, data, stored_at))
+            self.stats['writes'] += 1
+            logger.debug(f"Saved data to cache for {self.name}/{cache_key}")
+            return True
+        except Exception as e:
+            self.stats['errors'] += 1
+            logger.error(f"Error saving to cache for {self.name}/{cache_key}: {e}")
+            return False
+
+    def get_many(self, cache_keys):
+        """
+        Get several unexpired entries, reading all memory misses from disk in one batch
+
+        Args:
+            cache_keys: Keys to identify the cache entries
+
+        Returns:
+            Dictionary mapping each found, unexpired key to its data
+        """
+        now = time.time()
+        found = {}
+        missing = []
+        for cache_key in cache_keys:
+            entry = self.engine.memory_get(self._memory_key(cache_key))
+            if entry is not None and self.is_fresh(cache_key, entry[0], entry[1], now):
+                self.stats['memory_hits'] += 1
+                found[cache_key] = entry[0]
+            else:
+                missing.append(cache_key)
+
+        if missing:
+            for cache_key, (data, stored_at) in self.backend.read_many(missing).items():
+                if self.is_fresh(cache_key, data, stored_at, now):
+                    self.stats['disk_hits'] += 1
+                    self.engine.memory_put(self._memory_key(cache_key), data, stored_at)
+                    found[cache_key] = data
+                else:
+                    self.stats['expired'] += 1
+            self.stats['misses'] += len([k for k in missing if k not in found])
+
+        return found
+
+    def set_many(self, entries):
+        """
+        Save several entries in one batch
+
+        Dependency tracking is not applied; use set() for derived entries.
+
+        Args:
+            entries: Dictionary mapping cache key to JSON-serializable data
+
+        Returns:
+            True if the data was written to disk, False otherwise
+        """
+        stored_at = time.time()
+        for cache_key, data in entries.items():
+            self.engine.memory_put(self._memory_key(cache_key), data, stored_at)
+
+        # Backends write one expiry per batch
+        batches = {}
+        for cache_key, data in entries.items():
+            batches.setdefault(self.expires_at(cache_key, data, stored_at), {})[cache_key] = data
+
+        try:
+            for expires_at, batch in batches.items():
+                self.backend.write_many(batch, stored_at, expires_at)
+            self.stats['writes'] += len(entries)
+            return True
+        except Exception as e:
+            self.stats['errors'] += 1
+            logger.error(f"Error saving batch to cache for {self.name}: {e}")
+            return False
+
+    def entries(self):
+        """
+        Read every entry in the namespace, whatever its age
+
+        Returns:
+            Dictionary mapping cache key to (data, stored_at)
+        """
+        return self.backend.read_many(self.backend.keys())
+
+    def load(self, entries, inputs=None):
+        """
+        Bulk-load entries keeping their original store times
+
+        Entries older than the copy already held are skipped, so loading
+        never replaces fresher data. Loading an input doesn't invalidate
+        its dependents.
+
+        Args:
+            entries: Dictionary mapping cache key to (data, stored_at)
+            inputs: Optional dictionary mapping cache key to the input ids
+                (see dependency_id) the entry was derived from; the edges of
+                the entries loaded are recorded as by set()
+
+        Returns:
+            Number of entries loaded
+        """
+        current = self.backend.read_many(list(entries))
+        newer = {
+            cache_key: (data, stored_at) for cache_key, (data, stored_at) in entries.items()
+            if cache_key not in current or current[cache_key][1] < stored_at
+        }
+
+        # Backends write one store time and expiry per batch
+        batches = {}
+        for cache_key, (data, stored_at) in newer.items():
+            batches.setdefault((stored_at, self.expires_at(cache_key, data, stored_at)), {})[cache_key] = data
+            self.engine.memory_put(self._memory_key(cache_key), data, stored_at)
+
+        for (stored_at, expires_at), batch in batches.items():
+            self.backend.write_many(batch, stored_at, expires_at)
+        self.stats['writes'] += len(newer)
+
+        for cache_key in newer:
+            if inputs and inputs.get(cache_key):
+                self.engine.link(self, cache_key, inputs[cache_key])
+        return len(newer)
+
+    def get_or_compute(self, cache_key, compute, force_refresh=False, depends_on=None):
+        """
+        Get data from cache, filling it with compute() exactly once on a miss
+
+        Concurrent misses for the same key are coalesced: within a process
+        followers wait on the leader's result, and across worker processes the
+        leader holds a file lease in the cache directory so other workers wait
+        and then read the freshly written entry instead of recomputing.
+
+        Args:
+            cache_key: Key to identify the cache entry
+            compute: Zero-argument callable producing the data on a miss
+            force_refresh: Skip the cache read and always recompute
+            depends_on: Optional list of input ids the computed data is derived
+                from, or a callable mapping the computed data to that list
+
+        Returns:
+            Cached or freshly computed data
+        """
+        if not force_refresh:
+            data = self.get(cache_key)
+            if data is not None:
+                return data
+
+        def fill():
+            with file_lease(self.backend.lock_path_for(cache_key), self.engine.lease_timeout):
+                if not force_refresh:
+                    # Another worker may have filled the entry while we waited
+                    data = self.get(cache_key)
+                    if data is not None:
+                        return data
+
+                self.stats['fills'] += 1
+                data = compute()
+                self.set(cache_key, data, depends_on(data) if callable(depends_on) else depends_on)
+                return data
+
+        return self.engine.single_flight.do(self._memory_key(cache_key), fill)
+
+    def get_or_compute_many(self, cache_keys, compute, batch_key, force_refresh=False):
+        """
+        Get several entries, filling every miss with one compute() call
+
+        Like get_or_compute, but for work that is cheaper done as one batch.
+        Concurrent fills sharing batch_key are coalesced the same way: one
+        caller computes the misses while the rest wait and then read them.
+
+        Args:
+            cache_keys: Keys to identify the cache entries
+            compute: Callable mapping the list of missing keys to a dictionary
+                of key to data
+            batch_key: Key naming the batch, for coalescing concurrent fills
+            force_refresh: Skip the cache read and recompute every key
+
+        Returns:
+            Dictionary mapping each key to its cached or freshly computed data
+        """
+        cache_keys = list(cache_keys)
+        found = {} if force_refresh else self.get_many(cache_keys)
+        if len(found) == len(cache_keys):
+            return found
+
+        def fill():
+            with file_lease(self.backend.lock_path_for(batch_key), self.engine.lease_timeout):
+                # Another worker may have filled some entries while we waited
+                done = {} if force_refresh else self.get_many(cache_keys)
+                missing = [cache_key for cache_key in cache_keys if cache_key not in done]
+                if missing:
+                    self.stats['fills'] += 1
+                    computed = compute(missing)
+                    self.set_many(computed)
+                    done.update(computed)
+                return done
+
+        return self.engine.single_flight.do(self._memory_key(batch_key), fill)
+
+    def peek(self, cache_key):
+        """
+        Get an entry regardless of its age
+
+        Args:
+            cache_key: Key to identify the cache entry
+
+        Returns:
+            Tuple of (data, stored_at) or None if the entry does not exist
+        """
+        entry = self.engine.memory_get(self._memory_key(cache_key))
+        if entry is None:
+            entry = self.backend.read(cache_key)
+        return entry
+
+    def get_or_revalidate(self, cache_key, compute, hard_ttl, depends_on=None):
+        """
+        Get data from cache, serving expired entries while they are rebuilt
+
+        Fresh entries are returned as-is. Entries past the namespace TTL but
+        younger than hard_ttl are returned immediately and a background thread
+        refills them through get_or_compute. Anything older (or missing) is
+        computed synchronously.
+
+        Args:
+            cache_key: Key to identify the cache entry
+            compute: Zero-argument callable producing the data
+            hard_ttl: Age in seconds after which stale data is no longer served
+            depends_on: Input ids the data is derived from (see get_or_compute)
+
+        Returns:
+            Tuple of (data, is_stale)
+        """
+        data = self.get(cache_key)
+        if data is not None:
+            return data, False
+
+        entry = self.peek(cache_key)
+        if entry is not None:
+            data, stored_at = entry
+            if data is not None and time.time() - stored_at < hard_ttl:
+                self.stats['stale_hits'] += 1
+                self.revalidate(cache_key, compute, depends_on)
+                return data, True
+
+        return self.get_or_compute(cache_key, compute, depends_on=depends_on), False
+
+    def revalidate(self, cache_key, compute, depends_on=None):
+        """
+        Refill an entry on a background thread unless a fill is already running
+
+        Args:
+            cache_key: Key to identify the cache entry
+            compute: Zero-argument callable producing the data
+            depends_on: Input ids the data is derived from (see get_or_compute)
+        """
+        if self.engine.single_flight.in_flight(self._memory_key(cache_key)):
+            return
+
+        def refresh():
+            try:
+                self.get_or_compute(cache_key, compute, depends_on=depends_on)
+            except Exception as e:
+                self.stats['errors'] += 1
+                logger.error(f"Error revalidating cache for {self.name}/{cache_key}: {e}")
+
+        threading.Thread(target=refresh, name=f"revalidate-{cache_key}", daemon=True).start()
+
+    def negative_key(self, cache_key):
+        """Get the key a lookup's negative result is stored under, apart from real values"""
+        return f"_negative_{cache_key}"
+
+    def negative_ttl(self, misses):
+        """Get the re-check interval in seconds after a number of consecutive misses"""
+        return min(self.engine.negative_ttl * 2 ** (misses - 1), self.engine.negative_max_ttl)
+
+    def get_negative(self, cache_key):
+        """
+        Get the negative result recorded for a lookup, until it is due for a re-check
+
+        Negative results are never returned by get(), so a placeholder can't
+        be mistaken for real data.
+
+        Args:
+            cache_key: Key of the real entry
+
+        Returns:
+            Tuple of (placeholder data, consecutive misses), or None if no
+            negative result is recorded or the lookup should be retried
+        """
+        entry = self.peek(self.negative_key(cache_key))
+        if entry is None:
+            return None
+
+        record, stored_at = entry
+        if time.time() - stored_at >= self.negative_ttl(record['misses']):
+            return None
+
+        self.stats['negative_hits'] += 1
+        return record['data'], record['misses']
+
+    def set_negative(self, cache_key, data):
+        """
+        Record that a lookup found no real value
+
+        The lookup is skipped for negative_ttl(misses) seconds, doubling with
+        each consecutive miss, until a real value clears the record (see
+        clear_negative). The real entry is left untouched.
+
+        Args:
+            cache_key: Key of the real entry
+            data: JSON-serializable placeholder served in the meantime (e.g. a default value)
+
+        Returns:
+            Number of consecutive misses recorded
+        """
+        negative_key = self.negative_key(cache_key)
+        previous = self.peek(negative_key)
+        misses = previous[0]['misses'] + 1 if previous is not None else 1
+        record = {'misses': misses, 'data': data}
+
+        stored_at = time.time()
+        self.engine.memory_put(self._memory_key(negative_key), record, stored_at)
+        try:
+            self.backend.write(negative_key, record, stored_at, stored_at + self.negative_ttl(misses))
+            self.stats['negative_writes'] += 1
+        except Exception as e:
+            self.stats['errors'] += 1
+            logger.error(f"Error saving negative result for {self.name}/{cache_key}: {e}")
+        return misses
+
+    def clear_negative(self, cache_key):
+        """
+        Drop a lookup's negative result, resetting its backoff
+
+        Args:
+            cache_key: Key of the real entry
+        """
+        negative_key = self.negative_key(cache_key)
+        self.engine.memory_delete(self._memory_key(negative_key))
+        self.backend.delete(negative_key)
+
+    def delete(self, cache_key=None):
+        """
+        Clear cache for a specific key or the whole namespace
+
+        Entries derived from the cleared data (in any namespace) are cleared
+        too, as is a key's negative result.
+
+        Args:
+            cache_key: Key to identify the cache entry, or None to clear the namespace
+        """
+        try:
+            if cache_key:
+                self.engine.memory_delete(self._memory_key(cache_key))
+                self.backend.delete(cache_key)
+                self.clear_negative(cache_key)
+                self.engine.unlink(self, cache_key)
+                logger.info(f"Cleared cache for {self.name}/{cache_key}")
+                self.engine.invalidate(self.dependency_id(cache_key))
+            else:
+                self.engine.memory_clear(self.backend.cache_dir)
+                self.backend.clear()
+                for cache_key in self.inputs.keys():
+                    self.engine.unlink(self, cache_key)
+                logger.info(f"Cleared all cache for {self.name}")
+                self.engine.invalidate(f"{self.name}:", prefix=True)
+        except Exception as e:
+            self.stats['errors'] += 1
+            logger.error(f"Error clearing cache for {self.name}: {e}")
+
+    def evict(self, cache_key):
+        """
+        Drop a single entry from both tiers without cascading
+
+        Args:
+            cache_key: Key to identify the cache entry
+        """
+        self.engine.memory_delete(self._memory_key(cache_key))
+        self.backend.delete(cache_key)
+        self.engine.unlink(self, cache_key)
+        self.stats['invalidations'] += 1
+
+    def prune_dependencies(self, grace):
+        """
+        Drop the dependency edges of entries that are gone or long expired
+
+        Args:
+            grace: Seconds past expiry an entry is kept for stale serving
+
+        Returns:
+            Number of entries whose edges were dropped
+        """
+        cache_keys = self.inputs.keys()
+        if not cache_keys:
+            return 0
+
+        now = time.time()
+        current = self.backend.read_many(cache_keys)
+        pruned = 0
+        for cache_key in cache_keys:
+            entry = current.get(cache_key)
+            if entry is None or not self.is_fresh(cache_key, entry[0], entry[1], now - grace):
+                self.engine.unlink(self, cache_key)
+                pruned += 1
+        return pruned
+
+
+class CacheEngine:
+    """
+    Shared two-tier cache: an in-process LRU in front of per-namespace disk backends
+    """
+
+    def __init__(self, memory_entries=DEFAULT_MEMORY_ENTRIES, lease_timeout=DEFAULT_LEASE_TIMEOUT,
+                 backend=DEFAULT_BACKEND, db_path=None, negative_ttl=DEFAULT_NEGATIVE_TTL,
+                 negative_max_ttl=DEFAULT_NEGATIVE_MAX_TTL):
+        """
+        Initialize the cache engine
+
+        Args:
+            memory_entries: Maximum number of entries kept in the memory tier
+            lease_timeout: Seconds to wait on another worker's fill lease
+            backend: Disk tier backend, either 'file' or 'sqlite'
+            db_path: SQLite database path (sqlite backend only)
+            negative_ttl: Re-check interval of a negative result after its first miss
+            negative_max_ttl: Longest re-check interval of a negative result
+        """
+        if backend not in ('file', 'sqlite'):
+            raise ValueError(f"Unknown cache backend: {backend}")
+
+        self.memory_entries = memory_entries
+        self.lease_timeout = lease_timeout
+        self.negative_ttl = negative_ttl
+        self.negative_max_ttl = negative_max_ttl
+        self.backend = backend
+        self.db_path = db_path
+        self._store = None
+        self.single_flight = SingleFlight()
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._namespaces = {}
+
+    def namespace(self, name, cache_dir, layout='raw', ttl=None, policy=None):
+        """
+        Get or create a cache namespace
+
+        Args:
+            name: Namespace name, used to look up the default TTL and policy
+            cache_dir: Directory backing the namespace on disk
+            layout: On-disk layout, either 'raw' or 'envelope'
+            ttl: Time-to-live in seconds (defaults to NAMESPACE_TTLS[name])
+            policy: TTLPolicy picking each entry's TTL (defaults to
+                NAMESPACE_POLICIES[name] unless a fixed ttl is given)
+
+        Returns:
+            CacheNamespace instance
+        """
+        if ttl is None:
+            ttl = NAMESPACE_TTLS.get(name, 15 * 60)
+            if policy is None:
+                policy = NAMESPACE_POLICIES.get(name)
+
+        key = (name, os.path.abspath(cache_dir))
+        with self._lock:
+            namespace = self._namespaces.get(key)
+            if namespace is None:
+                namespace = CacheNamespace(self, name, self._create_backend(cache_dir, layout), ttl, policy)
+                if namespace.backend.kind == 'sqlite':
+                    namespace.backend.migrate_from_files(namespace.expires_at)
+                self._namespaces[key] = namespace
+        return namespace
+
+    def namespaces(self, name=None):
+        """
+        Get the namespaces created so far
+
+        Args:
+            name: Optional namespace name to filter on
+
+        Returns:
+            List of CacheNamespace instances
+        """
+        with self._lock:
+            return [namespace for namespace in self._namespaces.values() if name is None or namespace.name == name]
+
+    def _create_backend(self, cache_dir, layout):
+        if self.backend == 'file':
+            return FileBackend(cache_dir, layout)
+
+        # Imported lazily so the file backend has no sqlite3 dependency
+        from sqlite_cache import SQLiteStore, SQLiteBackend
+
+        if self._store is None:
+            self._store = SQLiteStore(self.db_path)
+        return SQLiteBackend(self._store, cache_dir, layout)
+
+    def purge_expired(self, grace=PURGE_GRACE, retention=PURGE_RETENTION):
+        """
+        Delete expired entries from the SQLite disk tier, and drop the
+        dependency edges of entries that are gone or expired past the grace
+
+        The file backend keeps no expiry on disk and is not purged.
+
+        Args:
+            grace: Seconds past expiry an entry is kept for stale serving
+            retention: Seconds entries that never expire are kept
+
+        Returns:
+            Number of entries deleted
+        """
+        deleted = 0
+        if self._store is not None:
+            deleted = self._store.purge_expired(grace, retention)
+            if deleted:
+                logger.info(f"Purged {deleted} expired cache entries")
+
+        pruned = sum(namespace.prune_dependencies(grace) for namespace in self.namespaces())
+        if pruned:
+            logger.info(f"Dropped dependency edges of {pruned} expired cache entries")
+        return deleted
+
+    def _resolve(self, dependency):
+        """Split a dependency id into the namespaces it names and its cache key"""
+        name, _, cache_key = dependency.partition(':')
+        return self.namespaces(name), cache_key
+
+    def link(self, namespace, cache_key, depends_on):
+        """
+        Record that an entry was derived from each input in depends_on
+
+        The edges are kept by the namespace owning each input, so writing an
+        input only checks its own namespace. They replace the entry's
+        previous inputs.
+
+        Args:
+            namespace: CacheNamespace holding the derived entry
+            cache_key: Key of the derived entry
+            depends_on: Iterable of input ids (see CacheNamespace.dependency_id)
+        """
+        dependent = namespace.dependency_id(cache_key)
+        depends_on = set(depends_on)
+        previous = namespace.inputs.replace(cache_key, depends_on)
+
+        for dependency in previous - depends_on:
+            owners, input_key = self._resolve(dependency)
+            for owner in owners:
+                owner.dependents.discard(input_key, [dependent])
+
+        for dependency in depends_on:
+            owners, input_key = self._resolve(dependency)
+            if not owners:
+                logger.warning(f"Not tracking {dependent} on {dependency}: no such namespace loaded")
+            for owner in owners:
+                owner.dependents.add(input_key, [dependent])
+
+    def unlink(self, namespace, cache_key):
+        """
+        Drop every dependency edge of a derived entry
+
+        Args:
+            namespace: CacheNamespace holding the derived entry
+            cache_key: Key of the derived entry
+        """
+        dependent = namespace.dependency_id(cache_key)
+        for dependency in namespace.inputs.replace(cache_key, ()):
+            owners, input_key = self._resolve(dependency)
+            for owner in owners:
+                owner.dependents.discard(input_key, [dependent])
+
+    def invalidate(self, dependency, prefix=False):
+        """
+        Evict every entry derived from an input, cascading to entries derived from those
+
+        Args:
+            dependency: Input id (see CacheNamespace.dependency_id)
+            prefix: Treat the cache key part of dependency as a prefix and
+                match every input of the namespace starting with it
+
+        Returns:
+            Number of entries evicted
+        """
+        evicted = 0
+        pending = [(dependency, prefix)]
+        seen = set()
+        while pending:
+            current, is_prefix = pending.pop()
+            if (current, is_prefix) in seen:
+                continue
+            seen.add((current, is_prefix))
+
+            owners, input_key = self._resolve(current)
+            for owner in owners:
+                if is_prefix:
+                    dependents = owner.dependents.pop(lambda key, input_key=input_key: key.startswith(input_key))
+                else:
+                    dependents = owner.dependents.replace(input_key, ())
+
+                for dependent in dependents:
+                    namespaces, cache_key = self._resolve(dependent)
+                    for namespace in namespaces:
+                        namespace.evict(cache_key)
+                        evicted += 1
+                        logger.info(f"Invalidated {namespace.name}/{cache_key} (derived from {current})")
+                    pending.append((dependent, False))
+
+        return evicted
+
+    def memory_get(self, memory_key):
+        with self._lock:
+            entry = self._memory.get(memory_key)
+            if entry is not None:
+                self._memory.move_to_end(memory_key)
+            return entry
+
+    def memory_put(self, memory_key, data, stored_at):
+        with self._lock:
+            self._memory[memory_key] = (data, stored_at)
+            self._memory.move_to_end(memory_key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def memory_delete(self, memory_key):
+        with self._lock:
+            self._memory.pop(memory_key, None)
+
+    def memory_clear(self, cache_dir):
+        with self._lock:
+            for memory_key in [k for k in self._memory if k[0] == cache_dir]:
+                del self._memory[memory_key]
+
+    def get_stats(self):
+        """
+        Get hit/miss statistics for every namespace
+
+        Returns:
+            Dictionary with memory tier size and per-namespace counters
+        """
+        with self._lock:
+            namespaces = list(self._namespaces.values())
+            memory_size = len(self._memory)
+
+        stats = {
+            'backend': self.backend,
+            'memory_entries': memory_size,
+            'memory_capacity': self.memory_entries,
+            'namespaces': {}
+        }
+        for namespace in namespaces:
+            entry = dict(namespace.stats)
+            entry['ttl'] = namespace.ttl
+            entry['ttl_policy'] = namespace.policy is not None
+            entry['cache_dir'] = namespace.cache_dir
+            stats['namespaces'][f"{namespace.name}:{namespace.cache_dir}"] = entry
+        return stats
+
+
+_default_engine = CacheEngine()
+
+
+def get_cache_engine():
+    """Get the process-wide shared cache engine"""
+    return _default_engine
@@ -0,0 +1,194 @@
+"""
+Export and import the cache as a single compressed snapshot
+
+A fresh instance (e.g. after a deploy wiped /tmp) loads a snapshot at boot
+instead of refetching everything from upstream.
+
+Usage:
+    python cache_snapshot.py export PATH
+    python cache_snapshot.py import PATH_OR_URL
+"""
+import os
+import sys
+import gzip
+import json
+import time
+from cache_engine import get_cache_engine
+from http_client import get_http_client
+
+SNAPSHOT_FORMAT = 'mlb-cache-snapshot'
+SNAPSHOT_VERSION = 2
+
+# Version 1 snapshots carry no dependency edges but load the same way
+SUPPORTED_VERSIONS = (1, 2)
+
+# Namespaces carried in a snapshot: schedule, pitcher and team stats
+# (mlb_stats), predictions and the game index. Scheduler job state belongs
+# to the instance that wrote it and is left out.
+SNAPSHOT_NAMESPACES = ('mlb_stats', 'predictions', 'game_index')
+
+# Entries older than this (in seconds) are not imported; matches the hard
+# expiry of stale predictions
+DEFAULT_MAX_AGE = int(os.environ.get('MLB_PREDICTIONS_HARD_EXPIRY', 6 * 3600))
+
+
+def export_snapshot(engine=None, namespaces=SNAPSHOT_NAMESPACES):
+    """
+    Serialize the cache to a gzip-compressed snapshot
+
+    Args:
+        engine: CacheEngine to export (defaults to the shared engine)
+        namespaces: Names of the namespaces to include
+
+    Returns:
+        Snapshot bytes. Each namespace holds [cache_key, stored_at, data,
+        inputs] rows, inputs being the ids the entry was derived from, so an
+        importing instance keeps invalidating it.
+    """
+    engine = engine or get_cache_engine()
+    snapshot = {
+        'format': SNAPSHOT_FORMAT,
+        'version': SNAPSHOT_VERSION,
+        'created_at': time.time(),
+        'namespaces': {}
+    }
+    for name in namespaces:
+        rows = snapshot['namespaces'].setdefault(name, [])
+        for namespace in engine.namespaces(name):
+            rows.extend(
+                [cache_key, stored_at, data, sorted(namespace.inputs.get(cache_key))]
+                for cache_key, (data, stored_at) in namespace.entries().items()
+            )
+
+    return gzip.compress(json.dumps(snapshot, separators=(',', ':')).encode('utf-8'), mtime=0)
+
+
+def validate_snapshot(snapshot):
+    """
+    Check a decoded snapshot's format, version and row shapes
+
+    Args:
+        snapshot: Decoded snapshot
+
+    Raises:
+        ValueError: If the snapshot can't be loaded
+    """
+    if not isinstance(snapshot, dict):
+        raise ValueError("Snapshot is not an object")
+    if snapshot.get('format') != SNAPSHOT_FORMAT or snapshot.get('version') not in SUPPORTED_VERSIONS:
+        raise ValueError(f"Unsupported snapshot: {snapshot.get('format')} v{snapshot.get('version')}")
+
+    namespaces = snapshot.get('namespaces', {})
+    if not isinstance(namespaces, dict):
+        raise ValueError("Snapshot namespaces are not an object")
+    for name, rows in namespaces.items():
+        if not isinstance(rows, list):
+            raise ValueError(f"Rows of {name} are not a list")
+        for row in rows:
+            if not isinstance(row, list) or len(row) not in (3, 4) or not isinstance(row[0], str) or \
+                    isinstance(row[1], bool) or not isinstance(row[1], (int, float)):
+                raise ValueError(f"Malformed row in {name}: {str(row)[:100]}")
+            if len(row) == 4 and not (isinstance(row[3], list) and all(isinstance(dep, str) for dep in row[3])):
+                raise ValueError(f"Malformed inputs of {name}/{row[0]}")
+
+
+def import_snapshot(content, engine=None, max_age=DEFAULT_MAX_AGE):
+    """
+    Load a snapshot into the cache
+
+    Entries go into the engine's namespaces of the same name (which must
+    already exist), keeping their original store times so TTLs carry over,
+    and with their dependency edges. Entries older than max_age or than the
+    copy already cached are skipped. Nothing is loaded from a malformed
+    snapshot.
+
+    Args:
+        content: Snapshot bytes (see export_snapshot)
+        engine: CacheEngine to load into (defaults to the shared engine)
+        max_age: Maximum age in seconds of imported entries
+
+    Returns:
+        Dictionary with 'imported' and 'skipped' counts and the snapshot's 'created_at'
+
+    Raises:
+        ValueError: If the snapshot is malformed or of an unsupported version
+    """
+    engine = engine or get_cache_engine()
+    snapshot = json.loads(gzip.decompress(content))
+    validate_snapshot(snapshot)
+
+    now = time.time()
+    imported = skipped = 0
+    for name, rows in snapshot.get('namespaces', {}).items():
+        entries, inputs = {}, {}
+        for row in rows:
+            cache_key, stored_at, data = row[:3]
+            if now - stored_at < max_age:
+                entries[cache_key] = (data, stored_at)
+                if len(row) == 4:
+                    inputs[cache_key] = row[3]
+        skipped += len(rows) - len(entries)
+        targets = engine.namespaces(name)
+        if not targets:
+            skipped += len(entries)
+            continue
+        for namespace in targets:
+            loaded = namespace.load(entries, inputs)
+            imported += loaded
+            skipped += len(entries) - loaded
+
+    return {'imported': imported, 'skipped': skipped, 'created_at': snapshot.get('created_at')}
+
+
+def import_snapshot_from(source, engine=None, max_age=DEFAULT_MAX_AGE, token=None):
+    """
+    Load a snapshot from a file path or an http(s) URL
+
+    A URL can point at another instance's /api/cache/snapshot, which
+    requires that instance's snapshot token.
+
+    Args:
+        source: Snapshot file path or URL
+        engine: CacheEngine to load into (defaults to the shared engine)
+        max_age: Maximum age in seconds of imported entries
+        token: Optional snapshot token sent as X-Snapshot-Token with URLs
+
+    Returns:
+        Import result (see import_snapshot)
+    """
+    if source.startswith(('http://', 'https://')):
+        headers = {'X-Snapshot-Token': token} if token else {}
+        response = get_http_client().get(source, headers=headers, timeout=(3.05, 30))
+        if response.status_code != 200:
+            raise ValueError(f"HTTP {response.status_code} fetching snapshot")
+        content = response.content
+    else:
+        with open(source, 'rb') as f:
+            content = f.read()
+    return import_snapshot(content, engine, max_age)
+
+
+def main():
+    if len(sys.argv) != 3 or sys.argv[1] not in ('export', 'import'):
+        print(__doc__.strip())
+        sys.exit(2)
+
+    # Creating the API registers every namespace a snapshot carries
+    from mlb_prediction_api import MLBPredictionAPI
+    MLBPredictionAPI()
+
+    command, path = sys.argv[1], sys.argv[2]
+    start = time.perf_counter()
+    if command == 'export':
+        content = export_snapshot()
+        with open(path, 'wb') as f:
+            f.write(content)
+        print(f"Exported {len(content):,} bytes to {path} in {time.perf_counter() - start:.3f}s")
+    else:
+        result = import_snapshot_from(path, token=os.environ.get('MLB_SNAPSHOT_TOKEN'))
+        print(f"Imported {result['imported']} entries ({result['skipped']} skipped) "
+              f"from {path} in {time.perf_counter() - start:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
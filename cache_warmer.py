@@ -0,0 +1,138 @@
+import os
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger('cache_warmer')
+
+# Slates built at once while warming
+DEFAULT_WARM_CONCURRENCY = int(os.environ.get('MLB_WARM_CONCURRENCY', 3))
+
+
+class CacheWarmer:
+    """
+    Precomputes games and predictions for every date the app advertises
+
+    Runs once at worker boot (on a background thread) and again after each
+    refresh. The worker reports ready as soon as today's slate (the first
+    advertised date) has been warmed, so the load balancer routes traffic to
+    it without waiting on the rest of the week; a failed date is reported in
+    the status but only today's holds readiness back.
+    """
+
+    def __init__(self, prediction_api, concurrency=DEFAULT_WARM_CONCURRENCY):
+        """
+        Initialize the cache warmer
+
+        Args:
+            prediction_api: MLBPredictionAPI instance
+            concurrency: Maximum number of slates built at once
+        """
+        self.prediction_api = prediction_api
+        self.concurrency = concurrency
+        self._lock = threading.Lock()
+        self._warming = threading.Lock()
+        self.status = {
+            'state': 'pending',
+            'ready': False,
+            'passes': 0,
+            'started_at': None,
+            'finished_at': None,
+            'duration': None,
+            'ready_date': None,
+            'failed_dates': [],
+            'dates': {}
+        }
+
+    def start(self):
+        """Warm the cache on a background thread"""
+        threading.Thread(target=self.warm, name='cache-warmer', daemon=True).start()
+
+    def disable(self):
+        """Report ready without warming (when background warming is turned off)"""
+        with self._lock:
+            self.status.update({'state': 'disabled', 'ready': True})
+
+    def warm(self):
+        """
+        Build games and predictions for every advertised date
+
+        A pass already in progress is not started again.
+
+        Returns:
+            True if every date was warmed, False if any failed or a pass was
+            already running
+        """
+        if not self._warming.acquire(blocking=False):
+            logger.info("Cache warm-up already in progress")
+            return False
+
+        try:
+            dates = [entry['date'] for entry in self.prediction_api.get_available_dates()]
+            start_time = time.time()
+            with self._lock:
+                self.status.update({'state': 'warming', 'started_at': start_time, 'finished_at': None, 'duration': None,
+                                    'ready_date': dates[0] if dates else None})
+                for date in dates:
+                    self.status['dates'][date] = dict(self.status['dates'].get(date, {}), state='pending')
+
+            with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='cache-warmer') as executor:
+                results = list(executor.map(self.warm_date, dates))
+
+            finished_at = time.time()
+            with self._lock:
+                # Dates no longer advertised are dropped from the report
+                self.status['dates'] = {date: self.status['dates'][date] for date in dates}
+                failed = [date for date, ok in zip(dates, results) if not ok]
+                self.status.update({
+                    'state': 'partial' if failed else 'ready',
+                    'ready': self.status['ready'] or not dates,
+                    'failed_dates': failed,
+                    'passes': self.status['passes'] + 1,
+                    'finished_at': finished_at,
+                    'duration': round(finished_at - start_time, 3)
+                })
+            logger.info(f"Warmed {sum(results)}/{len(dates)} dates in {finished_at - start_time:.1f}s")
+            return all(results)
+        finally:
+            self._warming.release()
+
+    def warm_date(self, target_date):
+        """
+        Build (or confirm cached) the predictions for one date
+
+        Args:
+            target_date: Date string in format YYYY-MM-DD
+
+        Returns:
+            True if the date was warmed, False otherwise
+        """
+        start_time = time.time()
+        self._update_date(target_date, state='warming')
+        try:
+            predictions = self.prediction_api.get_all_predictions(target_date=target_date)
+            self._update_date(target_date, state='warm', game_count=len(predictions.get('games', [])),
+                              duration=round(time.time() - start_time, 3), error=None)
+            with self._lock:
+                if target_date == self.status['ready_date']:
+                    self.status['ready'] = True
+            return True
+        except Exception as e:
+            logger.error(f"Error warming predictions for {target_date}: {e}")
+            self._update_date(target_date, state='failed', duration=round(time.time() - start_time, 3), error=str(e))
+            return False
+
+    def _update_date(self, target_date, **fields):
+        with self._lock:
+            self.status['dates'][target_date] = dict(self.status['dates'].get(target_date, {}), **fields)
+
+    def is_ready(self):
+        with self._lock:
+            return self.status['ready']
+
+    def get_status(self):
+        """Get the warm-up state, readiness and per-date results"""
+        with self._lock:
+            return dict(self.status, failed_dates=list(self.status['failed_dates']),
+                        dates={date: dict(info) for date, info in self.status['dates'].items()})
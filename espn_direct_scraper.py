@@ -1,4 +1,3 @@
-import requests
 from bs4 import BeautifulSoup
 import time
 import random
@@ -7,6 +6,9 @@ import os
 import re
 from datetime import datetime
 import logging
+from cache_engine import get_cache_engine
+from http_client import get_http_client
+from team_registry import TEAMS, get_team
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
@@ -23,8 +25,9 @@ class ESPNDirectScraper:
         """Initialize the ESPN direct scraper"""
         self.base_url = "https://www.espn.com/mlb"
         self.cache_dir = 'cache/espn_direct'
-        self.cache_expiry = 3600 * 1  # Cache expiry in seconds (1 hour)
-        os.makedirs(self.cache_dir, exist_ok=True)
+        self.cache = get_cache_engine().namespace('espn_direct', self.cache_dir, layout='envelope')
+        self.http = get_http_client()
+        self.cache_expiry = self.cache.ttl  # Cache expiry in seconds
         
         # User agents to rotate for avoiding scraping detection
         self.user_agents = [
@@ -35,38 +38,7 @@ class ESPNDirectScraper:
         ]
         
         # Team name to ESPN team ID mapping
-        self.team_id_map = {
-            'Arizona Diamondbacks': 'ari',
-            'Atlanta Braves': 'atl',
-            'Baltimore Orioles': 'bal',
-            'Boston Red Sox': 'bos',
-            'Chicago Cubs': 'chc',
-            'Chicago White Sox': 'chw',
-            'Cincinnati Reds': 'cin',
-            'Cleveland Guardians': 'cle',
-            'Colorado Rockies': 'col',
-            'Detroit Tigers': 'det',
-            'Houston Astros': 'hou',
-            'Kansas City Royals': 'kc',
-            'Los Angeles Angels': 'laa',
-            'Los Angeles Dodgers': 'lad',
-            'Miami Marlins': 'mia',
-            'Milwaukee Brewers': 'mil',
-            'Minnesota Twins': 'min',
-            'New York Mets': 'nym',
-            'New York Yankees': 'nyy',
-            'Oakland Athletics': 'oak',
-            'Philadelphia Phillies': 'phi',
-            'Pittsburgh Pirates': 'pit',
-            'San Diego Padres': 'sd',
-            'Seattle Mariners': 'sea',
-            'San Francisco Giants': 'sf',
-            'St. Louis Cardinals': 'stl',
-            'Tampa Bay Rays': 'tb',
-            'Texas Rangers': 'tex',
-            'Toronto Blue Jays': 'tor',
-            'Washington Nationals': 'wsh'
-        }
+        self.team_id_map = {team.name: team.espn_id for team in TEAMS}
     
     def get_random_user_agent(self):
         """Get a random user agent to avoid detection"""
@@ -74,69 +46,21 @@ class ESPNDirectScraper:
     
     def get_cached_data(self, cache_key):
         """Get data from cache if available and not expired"""
-        cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-        
-        if os.path.exists(cache_file):
-            try:
-                with open(cache_file, 'r') as f:
-                    cached_data = json.load(f)
-                
-                # Check if cache is expired
-                cache_time = cached_data.get('cache_time', 0)
-                if (datetime.now() - datetime.fromtimestamp(cache_time)).total_seconds() < self.cache_expiry:
-                    logger.info(f"Using cached data for {cache_key}")
-                    return cached_data.get('data')
-            except Exception as e:
-                logger.error(f"Error reading cache: {e}")
-        
-        return None
+        return self.cache.get(cache_key)
     
     def save_to_cache(self, cache_key, data):
         """Save data to cache"""
-        cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-        
-        try:
-            with open(cache_file, 'w') as f:
-                json.dump({
-                    'data': data,
-                    'cache_time': datetime.now().timestamp()
-                }, f)
-            
-            logger.info(f"Saved data to cache for {cache_key}")
-            return True
-        except Exception as e:
-            logger.error(f"Error saving data to cache: {e}")
-            return False
+        return self.cache.set(cache_key, data)
     
     def clear_cache(self, cache_key=None):
         """Clear cache for a specific key or all cache"""
-        if cache_key:
-            cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-            if os.path.exists(cache_file):
-                try:
-                    os.remove(cache_file)
-                    logger.info(f"Cleared cache for {cache_key}")
-                except Exception as e:
-                    logger.error(f"Error clearing cache for {cache_key}: {e}")
-        else:
-            try:
-                for file in os.listdir(self.cache_dir):
-                    if file.endswith('.json'):
-                        os.remove(os.path.join(self.cache_dir, file))
-                logger.info("Cleared all cache")
-            except Exception as e:
-                logger.error(f"Error clearing all cache: {e}")
+        self.cache.delete(cache_key)
     
     def get_team_id(self, team_name):
         """Get ESPN team ID from team name"""
-        # Try exact match first
-        if team_name in self.team_id_map:
-            return self.team_id_map[team_name]
-        
-        # Try partial match
-        for full_name, team_id in self.team_id_map.items():
-            if team_name.lower() in full_name.lower() or full_name.lower() in team_name.lower():
-                return team_id
+        team = get_team(team_name)
+        if team:
+            return team.espn_id
         
         # Return default if no match
         logger.warning(f"Team ID not found for {team_name}")
@@ -161,7 +85,7 @@ class ESPNDirectScraper:
             headers = {'User-Agent': self.get_random_user_agent()}
             
             logger.info(f"Fetching team roster from {url}")
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.http.get(url, headers=headers, timeout=10)
             
             if response.status_code != 200:
                 logger.error(f"Error fetching team roster: {response.status_code}")
@@ -242,7 +166,7 @@ class ESPNDirectScraper:
             headers = {'User-Agent': self.get_random_user_agent()}
             
             logger.info(f"Fetching player page from {player_link}")
-            response = requests.get(player_link, headers=headers, timeout=10)
+            response = self.http.get(player_link, headers=headers, timeout=10)
             
             if response.status_code != 200:
                 logger.error(f"Error fetching player page: {response.status_code}")
@@ -354,7 +278,7 @@ class ESPNDirectScraper:
             headers = {'User-Agent': self.get_random_user_agent()}
             
             logger.info(f"Searching for pitcher at {search_url}")
-            response = requests.get(search_url, headers=headers, timeout=10)
+            response = self.http.get(search_url, headers=headers, timeout=10)
             
             if response.status_code != 200:
                 logger.error(f"Error searching for pitcher: {response.status_code}")
@@ -403,7 +327,7 @@ class ESPNDirectScraper:
             headers = {'User-Agent': self.get_random_user_agent()}
             
             logger.info(f"Searching for pitcher on stats page: {search_url}")
-            response = requests.get(search_url, headers=headers, timeout=10)
+            response = self.http.get(search_url, headers=headers, timeout=10)
             
             if response.status_code != 200:
                 logger.error(f"Error accessing stats page: {response.status_code}")
@@ -482,7 +406,7 @@ class ESPNDirectScraper:
             headers = {'User-Agent': self.get_random_user_agent()}
             
             logger.info(f"Fetching team stats from {url}")
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.http.get(url, headers=headers, timeout=10)
             
             if response.status_code != 200:
                 logger.error(f"Error fetching team stats: {response.status_code}")
@@ -1,10 +1,11 @@
-import requests
 import json
 import os
 import logging
 import time
 from datetime import datetime, timedelta
 import random
+from cache_engine import get_cache_engine
+from http_client import get_http_client
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -24,62 +25,38 @@ class ESPNLiveDataAPI:
         """
         self.cache_dir = cache_dir
         
-        # Create cache directory if it doesn't exist
-        os.makedirs(self.cache_dir, exist_ok=True)
+        # Shared cache namespace (memory + disk tiers, 30 minute TTL)
+        self.cache = get_cache_engine().namespace('espn_live', self.cache_dir)
+        self.http = get_http_client()
         
         # Base URLs for ESPN API
         self.mlb_api_base = "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb"
         self.espn_api_base = "https://site.api.espn.com/apis/site/v2"
         
         # Cache expiration time (30 minutes)
-        self.cache_expiration = 30 * 60  # seconds
+        self.cache_expiration = self.cache.ttl
     
     def get_cached_data(self, cache_key):
         """
         Get data from cache if it exists and is not expired
         
         Args:
-            cache_key: Key to identify the cache file
+            cache_key: Key to identify the cache entry
             
         Returns:
             Cached data if it exists and is not expired, None otherwise
         """
-        cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-        
-        if os.path.exists(cache_file):
-            # Check if cache is expired
-            file_modified_time = os.path.getmtime(cache_file)
-            current_time = time.time()
-            
-            if current_time - file_modified_time < self.cache_expiration:
-                try:
-                    with open(cache_file, 'r') as f:
-                        data = json.load(f)
-                        logger.info(f"Using cached data for {cache_key}")
-                        return data
-                except Exception as e:
-                    logger.error(f"Error reading cache file: {e}")
-            else:
-                logger.info(f"Cache expired for {cache_key}")
-        
-        return None
+        return self.cache.get(cache_key)
     
     def save_to_cache(self, cache_key, data):
         """
         Save data to cache
         
         Args:
-            cache_key: Key to identify the cache file
+            cache_key: Key to identify the cache entry
             data: Data to save
         """
-        cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-        
-        try:
-            with open(cache_file, 'w') as f:
-                json.dump(data, f)
-                logger.info(f"Saved data to cache for {cache_key}")
-        except Exception as e:
-            logger.error(f"Error saving to cache: {e}")
+        self.cache.set(cache_key, data)
     
     def get_todays_games(self, force_refresh=False):
         """
@@ -104,7 +81,7 @@ class ESPNLiveDataAPI:
             
             # Make request to ESPN API
             url = f"{self.mlb_api_base}/scoreboard?dates={today}"
-            response = requests.get(url)
+            response = self.http.get(url)
             
             if response.status_code == 200:
                 data = response.json()
@@ -189,7 +166,7 @@ class ESPNLiveDataAPI:
         try:
             # Make request to ESPN API
             url = f"{self.espn_api_base}/sports/baseball/mlb/athletes/{pitcher_id}"
-            response = requests.get(url)
+            response = self.http.get(url)
             
             if response.status_code == 200:
                 data = response.json()
@@ -251,7 +228,7 @@ class ESPNLiveDataAPI:
         try:
             # Make request to ESPN API
             url = f"{self.espn_api_base}/sports/baseball/mlb/teams/{team_id}"
-            response = requests.get(url)
+            response = self.http.get(url)
             
             if response.status_code == 200:
                 data = response.json()
@@ -364,7 +341,7 @@ class ESPNLiveDataAPI:
         try:
             # Make request to ESPN API
             url = f"{self.mlb_api_base}/summary?event={game_id}"
-            response = requests.get(url)
+            response = self.http.get(url)
             
             if response.status_code == 200:
                 data = response.json()
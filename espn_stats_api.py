@@ -1,8 +1,9 @@
-import requests
 import json
 import os
 from datetime import datetime
 from bs4 import BeautifulSoup
+from cache_engine import get_cache_engine
+from http_client import get_http_client
 
 class ESPNStatsAPI:
     """
@@ -13,42 +14,17 @@ class ESPNStatsAPI:
         """Initialize the ESPN Stats API client"""
         self.base_url = "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb"
         self.cache_dir = 'cache/espn'
-        self.cache_expiry = 3600 * 3  # Cache expiry in seconds (3 hours)
-        os.makedirs(self.cache_dir, exist_ok=True)
+        self.cache = get_cache_engine().namespace('espn', self.cache_dir, layout='envelope')
+        self.http = get_http_client()
+        self.cache_expiry = self.cache.ttl  # Cache expiry in seconds
     
     def get_cached_data(self, cache_key):
         """Get data from cache if available and not expired"""
-        cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-        
-        if os.path.exists(cache_file):
-            try:
-                with open(cache_file, 'r') as f:
-                    cached_data = json.load(f)
-                
-                # Check if cache is expired
-                cache_time = cached_data.get('cache_time', 0)
-                if (datetime.now() - datetime.fromtimestamp(cache_time)).total_seconds() < self.cache_expiry:
-                    return cached_data.get('data')
-            except Exception as e:
-                print(f"Error reading ESPN cache: {e}")
-        
-        return None
+        return self.cache.get(cache_key)
     
     def save_to_cache(self, cache_key, data):
         """Save data to cache"""
-        cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-        
-        try:
-            with open(cache_file, 'w') as f:
-                json.dump({
-                    'data': data,
-                    'cache_time': datetime.now().timestamp()
-                }, f)
-            
-            return True
-        except Exception as e:
-            print(f"Error saving ESPN data to cache: {e}")
-            return False
+        return self.cache.set(cache_key, data)
     
     def get_schedule(self, date):
         """
@@ -64,7 +40,7 @@ class ESPNStatsAPI:
             # Format date as YYYYMMDD for ESPN API
             formatted_date = date.replace('-', '')
             url = f"{self.base_url}/scoreboard?dates={formatted_date}"
-            response = requests.get(url)
+            response = self.http.get(url)
             data = response.json()
             
             # Save to cache
@@ -87,7 +63,7 @@ class ESPNStatsAPI:
         
         try:
             url = f"{self.base_url}/teams/{team_id}"
-            response = requests.get(url)
+            response = self.http.get(url)
             data = response.json()
             
             # Save to cache
@@ -110,7 +86,7 @@ class ESPNStatsAPI:
         
         try:
             url = f"{self.base_url}/athletes/{player_id}"
-            response = requests.get(url)
+            response = self.http.get(url)
             data = response.json()
             
             # Save to cache
@@ -137,7 +113,7 @@ class ESPNStatsAPI:
             
             # Search for pitcher
             search_url = f"https://www.espn.com/mlb/team/roster/_/name/{team_name_formatted}"
-            response = requests.get(search_url)
+            response = self.http.get(search_url)
             soup = BeautifulSoup(response.text, 'html.parser')
             
             # Find pitcher in roster
@@ -160,7 +136,7 @@ class ESPNStatsAPI:
             
             # Get pitcher stats page
             pitcher_url = f"https://www.espn.com{pitcher_link}"
-            response = requests.get(pitcher_url)
+            response = self.http.get(pitcher_url)
             soup = BeautifulSoup(response.text, 'html.parser')
             
             # Find ERA in stats table
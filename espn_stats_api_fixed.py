@@ -1,10 +1,12 @@
-import requests
 from bs4 import BeautifulSoup
 import time
 import random
 import json
 import os
 from datetime import datetime
+from cache_engine import get_cache_engine
+from http_client import get_http_client
+from team_registry import get_team
 
 class ESPNStatsAPIFixed:
     """
@@ -15,8 +17,9 @@ class ESPNStatsAPIFixed:
         """Initialize the ESPN Stats API client"""
         self.base_url = "https://www.espn.com/mlb"
         self.cache_dir = 'cache/espn'
-        self.cache_expiry = 3600 * 3  # Cache expiry in seconds (3 hours)
-        os.makedirs(self.cache_dir, exist_ok=True)
+        self.cache = get_cache_engine().namespace('espn', self.cache_dir, layout='envelope')
+        self.http = get_http_client()
+        self.cache_expiry = self.cache.ttl  # Cache expiry in seconds
         
         # User agents to rotate for avoiding scraping detection
         self.user_agents = [
@@ -32,83 +35,19 @@ class ESPNStatsAPIFixed:
     
     def get_cached_data(self, cache_key):
         """Get data from cache if available and not expired"""
-        cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-        
-        if os.path.exists(cache_file):
-            try:
-                with open(cache_file, 'r') as f:
-                    cached_data = json.load(f)
-                
-                # Check if cache is expired
-                cache_time = cached_data.get('cache_time', 0)
-                if (datetime.now() - datetime.fromtimestamp(cache_time)).total_seconds() < self.cache_expiry:
-                    return cached_data.get('data')
-            except Exception as e:
-                print(f"Error reading ESPN cache: {e}")
-        
-        return None
+        return self.cache.get(cache_key)
     
     def save_to_cache(self, cache_key, data):
         """Save data to cache"""
-        cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-        
-        try:
-            with open(cache_file, 'w') as f:
-                json.dump({
-                    'data': data,
-                    'cache_time': datetime.now().timestamp()
-                }, f)
-            
-            return True
-        except Exception as e:
-            print(f"Error saving ESPN data to cache: {e}")
-            return False
+        return self.cache.set(cache_key, data)
     
     def get_team_abbreviation(self, team_name):
         """
         Get ESPN team abbreviation from team name
         """
-        team_map = {
-            'Arizona Diamondbacks': 'ari',
-            'Atlanta Braves': 'atl',
-            'Baltimore Orioles': 'bal',
-            'Boston Red Sox': 'bos',
-            'Chicago Cubs': 'chc',
-            'Chicago White Sox': 'chw',
-            'Cincinnati Reds': 'cin',
-            'Cleveland Guardians': 'cle',
-            'Colorado Rockies': 'col',
-            'Detroit Tigers': 'det',
-            'Houston Astros': 'hou',
-            'Kansas City Royals': 'kc',
-            'Los Angeles Angels': 'laa',
-            'Los Angeles Dodgers': 'lad',
-            'Miami Marlins': 'mia',
-            'Milwaukee Brewers': 'mil',
-            'Minnesota Twins': 'min',
-            'New York Mets': 'nym',
-            'New York Yankees': 'nyy',
-            'Oakland Athletics': 'oak',
-            'Philadelphia Phillies': 'phi',
-            'Pittsburgh Pirates': 'pit',
-            'San Diego Padres': 'sd',
-            'Seattle Mariners': 'sea',
-            'San Francisco Giants': 'sf',
-            'St. Louis Cardinals': 'stl',
-            'Tampa Bay Rays': 'tb',
-            'Texas Rangers': 'tex',
-            'Toronto Blue Jays': 'tor',
-            'Washington Nationals': 'wsh'
-        }
-        
-        # Try exact match first
-        if team_name in team_map:
-            return team_map[team_name]
-        
-        # Try partial match
-        for full_name, abbr in team_map.items():
-            if team_name in full_name:
-                return abbr
+        team = get_team(team_name)
+        if team:
+            return team.espn_id
         
         # Return default if no match
         return None
@@ -132,7 +71,7 @@ class ESPNStatsAPIFixed:
             # Get team roster page
             url = f"{self.base_url}/team/roster/_/name/{team_abbr}"
             headers = {'User-Agent': self.get_random_user_agent()}
-            response = requests.get(url, headers=headers)
+            response = self.http.get(url, headers=headers)
             
             if response.status_code != 200:
                 print(f"Error fetching team roster: {response.status_code}")
@@ -206,7 +145,7 @@ class ESPNStatsAPIFixed:
             # Add a small delay to avoid rate limiting
             time.sleep(random.uniform(0.5, 1.5))
             
-            response = requests.get(pitcher_url, headers=headers)
+            response = self.http.get(pitcher_url, headers=headers)
             
             if response.status_code != 200:
                 print(f"Error fetching pitcher page: {response.status_code}")
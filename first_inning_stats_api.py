@@ -2,6 +2,7 @@ import requests
 import json
 import os
 from datetime import datetime
+from cache_engine import get_cache_engine
 
 class FirstInningStatsAPI:
     """
@@ -11,8 +12,8 @@ class FirstInningStatsAPI:
     def __init__(self):
         """Initialize the First Inning Stats API client"""
         self.cache_dir = 'cache/first_inning'
-        self.cache_expiry = 3600 * 12  # Cache expiry in seconds (12 hours)
-        os.makedirs(self.cache_dir, exist_ok=True)
+        self.cache = get_cache_engine().namespace('first_inning', self.cache_dir, layout='envelope')
+        self.cache_expiry = self.cache.ttl  # Cache expiry in seconds
         
         # This would ideally connect to a specialized database of first inning stats
         # For now, we'll use a combination of MLB Stats API data and specialized calculations
@@ -21,37 +22,11 @@ class FirstInningStatsAPI:
     
     def get_cached_data(self, cache_key):
         """Get data from cache if available and not expired"""
-        cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-        
-        if os.path.exists(cache_file):
-            try:
-                with open(cache_file, 'r') as f:
-                    cached_data = json.load(f)
-                
-                # Check if cache is expired
-                cache_time = cached_data.get('cache_time', 0)
-                if (datetime.now() - datetime.fromtimestamp(cache_time)).total_seconds() < self.cache_expiry:
-                    return cached_data.get('data')
-            except Exception as e:
-                print(f"Error reading first inning stats cache: {e}")
-        
-        return None
+        return self.cache.get(cache_key)
     
     def save_to_cache(self, cache_key, data):
         """Save data to cache"""
-        cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-        
-        try:
-            with open(cache_file, 'w') as f:
-                json.dump({
-                    'data': data,
-                    'cache_time': datetime.now().timestamp()
-                }, f)
-            
-            return True
-        except Exception as e:
-            print(f"Error saving first inning stats to cache: {e}")
-            return False
+        return self.cache.set(cache_key, data)
     
     def get_first_inning_stats(self, team_id):
         """
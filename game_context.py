@@ -0,0 +1,176 @@
+from slate_scoring import MARKETS
+
+# Key of each market inside a game's 'predictions' (the names the web UI reads)
+GAME_MARKET_KEYS = {
+    'under_1_run_first_inning': 'under_1_run_first_inning',
+    'over_2.5_runs_first_3_innings': 'over_2_5_runs_first_three_innings',
+    'over_3.5_runs_first_3_innings': 'over_3_5_runs_first_three_innings'
+}
+
+# Game entry fields live dashboards update in place from delta events (see
+# delta_fields); the rest of an entry comes with the slate
+DELTA_FIELDS = ('status', 'game_time', 'home_pitcher', 'away_pitcher', 'home_pitcher_era', 'away_pitcher_era')
+
+
+class GameContext:
+    """
+    Everything a game's market predictions share, built once per game
+
+    Team, pitcher and venue data are gathered here a single time and every
+    market prediction for the game is attached to the same context, instead
+    of each market carrying its own copy.
+    """
+
+    __slots__ = ('game_id', 'status', 'venue', 'game_time', 'home_team', 'away_team',
+                 'home_era_source', 'away_era_source', 'home_team_stats', 'away_team_stats')
+
+    def __init__(self, game, home_team_stats=None, away_team_stats=None):
+        """
+        Initialize the game context
+
+        Args:
+            game: Game record from the schedule
+            home_team_stats: Home team stats data
+            away_team_stats: Away team stats data
+        """
+        self.game_id = game.get('game_id')
+        self.status = game.get('status')
+        self.venue = game.get('venue')
+        self.game_time = game.get('game_time')
+        self.home_team = self.team_summary(game.get('home_team'), game.get('home_pitcher'), game.get('home_era'))
+        self.away_team = self.team_summary(game.get('away_team'), game.get('away_pitcher'), game.get('away_era'))
+        self.home_era_source = game.get('home_era_source')
+        self.away_era_source = game.get('away_era_source')
+        self.home_team_stats = home_team_stats
+        self.away_team_stats = away_team_stats
+
+    @staticmethod
+    def team_summary(team_name, pitcher_name, pitcher_era):
+        """Team and probable pitcher in the shape generate_factor_breakdown reads"""
+        return {
+            'name': team_name,
+            'probable_pitcher': {
+                'name': pitcher_name,
+                'stats': {
+                    'era': pitcher_era
+                }
+            }
+        }
+
+    def pitcher(self, side):
+        """Probable pitcher summary for 'home' or 'away'"""
+        team = self.home_team if side == 'home' else self.away_team
+        return team['probable_pitcher']
+
+    def to_dict(self, predictions, factors):
+        """
+        Serialize the game once, with every market's prediction nested under it
+
+        Args:
+            predictions: Dictionary mapping market to {'probability', 'rating', 'factor_direction'}
+            factors: Factor breakdown shared by every market
+
+        Returns:
+            Game entry of the normalized predictions payload
+        """
+        home_pitcher = self.pitcher('home')
+        away_pitcher = self.pitcher('away')
+        return {
+            'game_id': self.game_id,
+            'status': self.status,
+            'home_team': self.home_team['name'],
+            'away_team': self.away_team['name'],
+            'venue': self.venue,
+            'game_time': self.game_time,
+            'home_pitcher': home_pitcher['name'],
+            'away_pitcher': away_pitcher['name'],
+            'home_pitcher_era': home_pitcher['stats']['era'],
+            'away_pitcher_era': away_pitcher['stats']['era'],
+            'stats_comparison': {
+                'pitchers': {
+                    'home': {'name': home_pitcher['name'], 'era': home_pitcher['stats']['era'],
+                             'era_source': self.home_era_source},
+                    'away': {'name': away_pitcher['name'], 'era': away_pitcher['stats']['era'],
+                             'era_source': self.away_era_source}
+                },
+                'teams': {
+                    'home': self.home_team_stats,
+                    'away': self.away_team_stats
+                }
+            },
+            'factors': factors,
+            'predictions': {
+                GAME_MARKET_KEYS[market]: dict(prediction, recommendation=prediction['rating'])
+                for market, prediction in predictions.items()
+            }
+        }
+
+
+def market_entries(games):
+    """
+    Build each market's ranked list of references into the games list
+
+    Args:
+        games: Normalized game entries (see GameContext.to_dict)
+
+    Returns:
+        Dictionary mapping market to [{'game_id', 'probability', 'rating'}],
+        sorted by probability (descending)
+    """
+    entries = {}
+    for market in MARKETS:
+        game_key = GAME_MARKET_KEYS[market]
+        ranked = [
+            {
+                'game_id': game['game_id'],
+                'probability': game['predictions'][game_key]['probability'],
+                'rating': game['predictions'][game_key]['rating']
+            }
+            for game in games
+        ]
+        entries[market] = sorted(ranked, key=lambda x: x['probability'], reverse=True)
+    return entries
+
+
+def delta_fields(game):
+    """
+    Compact view of the game entry fields carried by delta events
+
+    Args:
+        game: Normalized game entry (see GameContext.to_dict)
+
+    Returns:
+        Dictionary of DELTA_FIELDS plus 'predictions', mapping each market to
+        {'probability', 'rating'}
+    """
+    fields = {field: game.get(field) for field in DELTA_FIELDS}
+    fields['predictions'] = {
+        market: {'probability': prediction['probability'], 'rating': prediction['rating']}
+        for market, prediction in game.get('predictions', {}).items()
+    }
+    return fields
+
+
+def changed_fields(fields, previous=None):
+    """
+    Delta fields that differ from the previous ones
+
+    Args:
+        fields: Current delta fields (see delta_fields)
+        previous: Delta fields last published for the game, if any
+
+    Returns:
+        Dictionary of the changed fields; 'predictions' holds only the
+        changed markets. Every field is changed without previous ones.
+    """
+    if previous is None:
+        return fields
+
+    changed = {field: value for field, value in fields.items() if field != 'predictions' and previous.get(field) != value}
+    markets = {
+        market: prediction for market, prediction in fields['predictions'].items()
+        if previous.get('predictions', {}).get(market) != prediction
+    }
+    if markets:
+        changed['predictions'] = markets
+    return changed
@@ -0,0 +1,190 @@
+import os
+import time
+import logging
+import threading
+from bisect import bisect_left
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger('http_client')
+
+# Default (connect, read) timeout in seconds for calls that don't pass one
+DEFAULT_TIMEOUT = (
+    float(os.environ.get('MLB_HTTP_CONNECT_TIMEOUT', 3.05)),
+    float(os.environ.get('MLB_HTTP_READ_TIMEOUT', 10))
+)
+
+# Retries for idempotent calls on connection errors and transient statuses
+DEFAULT_RETRIES = int(os.environ.get('MLB_HTTP_RETRIES', 2))
+DEFAULT_BACKOFF = float(os.environ.get('MLB_HTTP_BACKOFF', 0.3))
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Keep-alive connections kept open per upstream host
+DEFAULT_POOL_SIZE = int(os.environ.get('MLB_HTTP_POOL_SIZE', 10))
+
+# Upstream hosts that get their own connection pool. Calls to other hosts
+# share the default adapter's pools.
+UPSTREAM_HOSTS = (
+    'https://statsapi.mlb.com',
+    'https://site.api.espn.com',
+    'https://www.espn.com',
+    'https://www.baseball-reference.com',
+    'https://api.openweathermap.org'
+)
+
+# Upper bounds (in milliseconds) of the latency histogram buckets
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class HostStats:
+    """
+    Call counts and a latency histogram for one upstream host
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.status_codes = {}
+        self.total_ms = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def record(self, elapsed_ms, status_code=None, retries=0, error=False):
+        self.requests += 1
+        self.retries += retries
+        self.total_ms += elapsed_ms
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+        if error:
+            self.errors += 1
+        if status_code is not None:
+            self.status_codes[str(status_code)] = self.status_codes.get(str(status_code), 0) + 1
+
+    def to_dict(self):
+        histogram = {f"le_{bound}ms": count for bound, count in zip(LATENCY_BUCKETS_MS, self.buckets)}
+        histogram['inf'] = self.buckets[-1]
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'retries': self.retries,
+            'status_codes': dict(self.status_codes),
+            'avg_ms': round(self.total_ms / self.requests, 1) if self.requests else None,
+            'latency_histogram': histogram
+        }
+
+
+class HTTPClient:
+    """
+    Shared HTTP client for every upstream data source
+
+    Wraps a single requests.Session so connections are kept alive and reused
+    across calls, with a connection pool per upstream host, a default timeout
+    for calls that don't set one, and retries with exponential backoff on
+    connection errors and transient HTTP statuses. Per-host call counts and
+    latency histograms are exposed through get_stats().
+    """
+
+    def __init__(self, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF,
+                 pool_size=DEFAULT_POOL_SIZE, hosts=UPSTREAM_HOSTS):
+        """
+        Initialize the HTTP client
+
+        Args:
+            timeout: Default timeout, in seconds or as a (connect, read) tuple
+            retries: Number of retries for failed calls
+            backoff: Backoff factor in seconds between retries
+            pool_size: Maximum keep-alive connections per host
+            hosts: Host prefixes that get a dedicated connection pool
+        """
+        self.timeout = timeout
+        self.session = requests.Session()
+        self._lock = threading.Lock()
+        self._stats = {}
+
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            backoff_factor=backoff,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            raise_on_status=False
+        )
+        default_adapter = HTTPAdapter(pool_connections=len(hosts) or 1, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount('https://', default_adapter)
+        self.session.mount('http://', default_adapter)
+        for host in hosts:
+            self.session.mount(host, HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry))
+
+    def get(self, url, **kwargs):
+        """
+        Send a GET request through the shared session
+
+        Args:
+            url: URL to fetch
+            **kwargs: Passed to requests.Session.get (timeout defaults to the client timeout)
+
+        Returns:
+            requests.Response
+        """
+        return self.request('GET', url, **kwargs)
+
+    def request(self, method, url, **kwargs):
+        """
+        Send a request through the shared session and record its timing
+
+        Args:
+            method: HTTP method
+            url: URL to fetch
+            **kwargs: Passed to requests.Session.request
+
+        Returns:
+            requests.Response
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        host = urlsplit(url).netloc
+        start = time.perf_counter()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except requests.RequestException:
+            self._record(host, (time.perf_counter() - start) * 1000, error=True)
+            raise
+
+        retry_state = getattr(response.raw, 'retries', None)
+        retries = len(retry_state.history) if retry_state is not None else 0
+        self._record(host, (time.perf_counter() - start) * 1000, response.status_code, retries,
+                     error=response.status_code >= 500)
+        return response
+
+    def _record(self, host, elapsed_ms, status_code=None, retries=0, error=False):
+        with self._lock:
+            stats = self._stats.get(host)
+            if stats is None:
+                stats = self._stats[host] = HostStats()
+            stats.record(elapsed_ms, status_code, retries, error)
+
+    def get_stats(self):
+        """
+        Get call counts and latency histograms for every host called so far
+
+        Returns:
+            Dictionary mapping host to its counters
+        """
+        with self._lock:
+            return {host: stats.to_dict() for host, stats in self._stats.items()}
+
+    def reset_stats(self):
+        """Forget all recorded calls"""
+        with self._lock:
+            self._stats = {}
+
+
+_default_client = HTTPClient()
+
+
+def get_http_client():
+    """Get the process-wide shared HTTP client"""
+    return _default_client
@@ -0,0 +1,314 @@
+import os
+import math
+import numpy as np
+from slate_scoring import to_float_array
+
+# Trials simulated per game and the base seed of the random streams
+DEFAULT_TRIALS = int(os.environ.get('MLB_SIM_TRIALS', 20000))
+DEFAULT_SEED = int(os.environ.get('MLB_SIM_SEED', 2024))
+
+# Inning windows the run distributions are reported for (innings from the
+# first pitch)
+INNING_WINDOWS = {
+    'first_inning': 1,
+    'first_3_innings': 3,
+    'first_5_innings': 5,
+    'full_game': 9
+}
+DEFAULT_WINDOWS = tuple(INNING_WINDOWS.values())
+
+# Innings pitched by the starter before the bullpen takes over
+STARTER_INNINGS = 5
+
+# Plate appearance outcomes, in the column order of the event probability arrays
+EVENTS = ('out', 'walk', 'single', 'double', 'triple', 'home_run')
+OUT, WALK, SINGLE, DOUBLE, TRIPLE, HOME_RUN = range(len(EVENTS))
+
+# League-average rate of each non-out outcome per plate appearance
+# (walks include hit-by-pitch)
+LEAGUE_EVENT_RATES = np.array([0.095, 0.142, 0.045, 0.004, 0.031])
+LEAGUE_ERA = 4.20
+LEAGUE_OPS = 0.720
+
+# How strongly the pitcher's ERA and the lineup's OPS move the on-base rates
+ERA_EXPONENT = 0.6
+OPS_EXPONENT = 1.0
+
+# Cap on the chance a plate appearance doesn't end in an out
+MAX_ON_BASE_RATE = 0.6
+
+# Plate appearances after which a half-inning is ended regardless of outs
+MAX_PLATE_APPEARANCES = 30
+
+# Runners on base are a bitmask: 1 = first, 2 = second, 4 = third
+RUNNERS_ON = np.array([0, 1, 1, 2, 1, 2, 2, 3], dtype=np.int8)
+
+
+def event_probabilities(pitcher_era, batting_ops=None):
+    """
+    Per-plate-appearance outcome probabilities for a lineup facing a pitcher
+
+    Non-out outcomes are scaled from league averages by the pitcher's ERA
+    and the batting team's OPS relative to league average. Missing values
+    (NaN) are treated as league average.
+
+    Args:
+        pitcher_era: Array of pitcher ERAs, one per matchup
+        batting_ops: Optional array of batting team OPS, one per matchup
+
+    Returns:
+        Array of shape (matchups, len(EVENTS)) whose rows sum to 1
+    """
+    era = np.asarray(pitcher_era, dtype=np.float64)
+    era = np.where(np.isnan(era) | (era <= 0), LEAGUE_ERA, era)
+    scale = (era / LEAGUE_ERA) ** ERA_EXPONENT
+
+    if batting_ops is not None:
+        ops = np.asarray(batting_ops, dtype=np.float64)
+        ops = np.where(np.isnan(ops) | (ops <= 0), LEAGUE_OPS, ops)
+        scale = scale * (ops / LEAGUE_OPS) ** OPS_EXPONENT
+
+    on_base = LEAGUE_EVENT_RATES[np.newaxis, :] * scale[:, np.newaxis]
+    total = on_base.sum(axis=1, keepdims=True)
+    on_base = np.where(total > MAX_ON_BASE_RATE, on_base * (MAX_ON_BASE_RATE / total), on_base)
+    return np.concatenate([1 - on_base.sum(axis=1, keepdims=True), on_base], axis=1)
+
+
+def simulate_half_inning(probabilities, trials, rng):
+    """
+    Simulate one half-inning many times for a single matchup
+
+    Runners only advance on hits and walks (no steals, errors or sacrifice
+    flies): a single scores runners from second and third, a double scores
+    everyone but a runner from first (who goes to third), and walks only
+    advance forced runners.
+
+    Args:
+        probabilities: Outcome probabilities of one plate appearance (see event_probabilities)
+        trials: Number of trials
+        rng: numpy Generator
+
+    Returns:
+        Array of runs scored in each trial
+    """
+    thresholds = np.cumsum(probabilities)[:-1]
+    outs = np.zeros(trials, dtype=np.int8)
+    bases = np.zeros(trials, dtype=np.int8)
+    runs = np.zeros(trials, dtype=np.int16)
+    active = np.arange(trials)
+
+    for _ in range(MAX_PLATE_APPEARANCES):
+        if active.size == 0:
+            break
+        events = np.searchsorted(thresholds, rng.random(active.size), side='right')
+        current = bases[active]
+
+        scored = np.select(
+            [events == WALK, events == SINGLE, events == DOUBLE, events == TRIPLE, events == HOME_RUN],
+            [current == 7, RUNNERS_ON[current & 6], RUNNERS_ON[current & 6], RUNNERS_ON[current],
+             RUNNERS_ON[current] + 1],
+            default=0
+        )
+        forced = np.where(current & 1, np.where(current & 2, 7, current | 3), current | 1)
+        bases[active] = np.select(
+            [events == WALK, events == SINGLE, events == DOUBLE, events == TRIPLE, events == HOME_RUN],
+            [forced, ((current & 1) << 1) | 1, ((current & 1) << 2) | 2, 4, 0],
+            default=current
+        )
+        runs[active] += scored.astype(np.int16)
+        outs[active] += (events == OUT)
+        active = active[outs[active] < 3]
+
+    return runs
+
+
+class SlateSimulation:
+    """
+    Simulated run distributions for a slate of games
+
+    Holds, for every game and inning window, the share of trials scoring at
+    least n runs, so any over/under threshold is answered by a single lookup
+    instead of another simulation.
+    """
+
+    def __init__(self, window_runs):
+        """
+        Initialize the simulation result
+
+        Args:
+            window_runs: Dictionary mapping innings in the window (e.g. 1, 3)
+                to an array (games, trials) of runs scored in that window
+        """
+        self.trials = next(iter(window_runs.values())).shape[1]
+        self.at_least = {innings: self.survival(runs) for innings, runs in window_runs.items()}
+
+    @staticmethod
+    def survival(runs):
+        """Array (games, max runs + 2) whose column n is the share of trials with at least n runs"""
+        counts = np.zeros((runs.shape[0], int(runs.max(initial=0)) + 2), dtype=np.int64)
+        for game, game_runs in enumerate(runs):
+            bincount = np.bincount(game_runs)
+            counts[game, :bincount.size] = bincount
+        return np.cumsum(counts[:, ::-1], axis=1)[:, ::-1] / runs.shape[1]
+
+    def no_run_probabilities(self, innings=1):
+        """Probability (0-100) of no runs in the first innings, per game"""
+        return (1 - self.at_least[innings][:, 1]) * 100
+
+    def over_probabilities(self, threshold, innings=3):
+        """
+        Probability (0-100) of more than threshold runs in the first innings, per game
+
+        Args:
+            threshold: Run line (e.g., 2.5, 3.5)
+            innings: Inning window (must have been simulated)
+        """
+        at_least = self.at_least[innings]
+        index = max(0, math.floor(threshold) + 1)
+        if index >= at_least.shape[1]:
+            return np.zeros(at_least.shape[0])
+        return at_least[:, index] * 100
+
+    def run_distribution(self, game_index, innings=3):
+        """
+        Share of trials ending with each run total in the first innings
+
+        Args:
+            game_index: Position of the game in the slate
+            innings: Inning window (must have been simulated)
+
+        Returns:
+            List where item n is the probability (0-1) of exactly n runs
+        """
+        at_least = self.at_least[innings][game_index]
+        return (at_least[:-1] - at_least[1:]).tolist()
+
+    def game_distributions(self, game_index):
+        """
+        A game's at-least-n-runs curves for every simulated window
+
+        Args:
+            game_index: Position of the game in the slate
+
+        Returns:
+            Dictionary mapping window name (see INNING_WINDOWS) to a list whose
+            item n is the probability (0-1) of at least n runs
+        """
+        return {
+            name: self.at_least[innings][game_index].tolist()
+            for name, innings in INNING_WINDOWS.items() if innings in self.at_least
+        }
+
+
+def threshold_probabilities(at_least, threshold):
+    """
+    Price an over/under line from a cached at-least-n-runs curve
+
+    Args:
+        at_least: List whose item n is the probability of at least n runs
+            (see SlateSimulation.game_distributions)
+        threshold: Run line; whole-number lines can push
+
+    Returns:
+        Dictionary with 'over', 'under' and 'push' probabilities (0-100)
+    """
+    def share(runs):
+        if runs <= 0:
+            return 1.0
+        return at_least[runs] if runs < len(at_least) else 0.0
+
+    over = share(math.floor(threshold) + 1)
+    under = 1 - share(math.ceil(threshold))
+    return {
+        'over': round(over * 100, 2),
+        'under': round(under * 100, 2),
+        'push': round(max(0.0, 1 - over - under) * 100, 2)
+    }
+
+
+def simulate_slate(home_era, away_era, home_ops=None, away_ops=None, game_keys=None,
+                   trials=DEFAULT_TRIALS, seed=DEFAULT_SEED, windows=DEFAULT_WINDOWS,
+                   home_bullpen_era=None, away_bullpen_era=None):
+    """
+    Simulate the first innings of a batch of games
+
+    Each half-inning is simulated with its own random stream derived from
+    the seed, the game key and the half-inning, so a game's result doesn't
+    depend on which other games are in the slate or how many innings are
+    simulated. Starters pitch the first STARTER_INNINGS innings and the
+    bullpen the rest; all nine regulation innings are played out.
+
+    Args:
+        home_era, away_era: Raw starting pitcher ERAs, one per game
+        home_ops, away_ops: Optional raw team OPS, one per game
+        game_keys: Optional non-negative integer key per game (e.g., game_id);
+            defaults to the game's position
+        trials: Trials per game
+        seed: Base seed of the random streams
+        windows: Inning windows to report (innings from the first pitch)
+        home_bullpen_era, away_bullpen_era: Optional raw bullpen ERAs, one per game
+
+    Returns:
+        SlateSimulation
+    """
+    home_era = to_float_array(home_era)
+    away_era = to_float_array(away_era)
+    games = home_era.size
+
+    def optional(values):
+        return to_float_array(values) if values is not None else np.full(games, np.nan)
+
+    home_ops, away_ops = optional(home_ops), optional(away_ops)
+    home_bullpen_era, away_bullpen_era = optional(home_bullpen_era), optional(away_bullpen_era)
+    game_keys = list(game_keys) if game_keys is not None else list(range(games))
+    innings = max(windows)
+
+    # Away batters face the home pitchers in the top half, and vice versa
+    top = (event_probabilities(home_era, away_ops), event_probabilities(home_bullpen_era, away_ops))
+    bottom = (event_probabilities(away_era, home_ops), event_probabilities(away_bullpen_era, home_ops))
+
+    window_runs = {window: np.zeros((games, trials), dtype=np.int16) for window in windows}
+    for game in range(games):
+        runs_so_far = np.zeros(trials, dtype=np.int16)
+        for half_inning in range(innings * 2):
+            inning = half_inning // 2 + 1
+            rng = np.random.default_rng([seed, int(game_keys[game]), half_inning])
+            probabilities = (top if half_inning % 2 == 0 else bottom)[inning > STARTER_INNINGS][game]
+            runs_so_far += simulate_half_inning(probabilities, trials, rng)
+            if half_inning % 2 == 1 and inning in window_runs:
+                window_runs[inning][game] = runs_so_far
+
+    return SlateSimulation(window_runs)
+
+
+def simulate_games(games, trials=DEFAULT_TRIALS, seed=DEFAULT_SEED, team_stats=None, windows=DEFAULT_WINDOWS):
+    """
+    Simulate a list of schedule game records
+
+    Args:
+        games: Game records with 'game_id', 'home_era' and 'away_era'
+        trials: Trials per game
+        seed: Base seed of the random streams
+        team_stats: Optional team stats keyed by team name (for team OPS and bullpen ERA)
+        windows: Inning windows to report
+
+    Returns:
+        SlateSimulation, with games in the order given
+    """
+    team_stats = team_stats or {}
+
+    def stat(team_name, key):
+        return (team_stats.get(team_name) or {}).get(key)
+
+    return simulate_slate(
+        [game.get('home_era') for game in games],
+        [game.get('away_era') for game in games],
+        [stat(game.get('home_team'), 'team_ops') for game in games],
+        [stat(game.get('away_team'), 'team_ops') for game in games],
+        [game.get('game_id') or i for i, game in enumerate(games)],
+        trials,
+        seed,
+        windows,
+        [stat(game.get('home_team'), 'bullpen_era') for game in games],
+        [stat(game.get('away_team'), 'bullpen_era') for game in games]
+    )
@@ -5,6 +5,7 @@ import time
 from datetime import datetime
 from espn_direct_scraper import ESPNDirectScraper
 from espn_live_data_api import ESPNLiveDataAPI
+from cache_engine import get_cache_engine
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, 
@@ -27,86 +28,44 @@ class IntegratedESPNDataAPI:
         """
         self.cache_dir = cache_dir
         
-        # Create cache directory if it doesn't exist
-        os.makedirs(self.cache_dir, exist_ok=True)
+        # Shared cache namespace (memory + disk tiers, 15 minute TTL)
+        self.cache = get_cache_engine().namespace('integrated_espn', self.cache_dir)
+        self.cache_expiration = self.cache.ttl
         
         # Initialize both data sources
         self.espn_api = ESPNLiveDataAPI()
         self.espn_scraper = ESPNDirectScraper()
-        
-        # Cache expiration time (15 minutes)
-        self.cache_expiration = 15 * 60  # seconds
     
     def get_cached_data(self, cache_key):
         """
         Get data from cache if it exists and is not expired
         
         Args:
-            cache_key: Key to identify the cache file
+            cache_key: Key to identify the cache entry
             
         Returns:
             Cached data if it exists and is not expired, None otherwise
         """
-        cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-        
-        if os.path.exists(cache_file):
-            # Check if cache is expired
-            file_modified_time = os.path.getmtime(cache_file)
-            current_time = time.time()
-            
-            if current_time - file_modified_time < self.cache_expiration:
-                try:
-                    with open(cache_file, 'r') as f:
-                        data = json.load(f)
-                        logger.info(f"Using cached data for {cache_key}")
-                        return data
-                except Exception as e:
-                    logger.error(f"Error reading cache file: {e}")
-            else:
-                logger.info(f"Cache expired for {cache_key}")
-        
-        return None
+        return self.cache.get(cache_key)
     
     def save_to_cache(self, cache_key, data):
         """
         Save data to cache
         
         Args:
-            cache_key: Key to identify the cache file
+            cache_key: Key to identify the cache entry
             data: Data to save
         """
-        cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-        
-        try:
-            with open(cache_file, 'w') as f:
-                json.dump(data, f)
-                logger.info(f"Saved data to cache for {cache_key}")
-        except Exception as e:
-            logger.error(f"Error saving to cache: {e}")
+        self.cache.set(cache_key, data)
     
     def clear_cache(self, cache_key=None):
         """
         Clear cache for a specific key or all cache
         
         Args:
-            cache_key: Key to identify the cache file, or None to clear all cache
+            cache_key: Key to identify the cache entry, or None to clear all cache
         """
-        if cache_key:
-            cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-            if os.path.exists(cache_file):
-                try:
-                    os.remove(cache_file)
-                    logger.info(f"Cleared cache for {cache_key}")
-                except Exception as e:
-                    logger.error(f"Error clearing cache for {cache_key}: {e}")
-        else:
-            try:
-                for file in os.listdir(self.cache_dir):
-                    if file.endswith('.json'):
-                        os.remove(os.path.join(self.cache_dir, file))
-                logger.info("Cleared all cache")
-            except Exception as e:
-                logger.error(f"Error clearing all cache: {e}")
+        self.cache.delete(cache_key)
     
     def get_todays_games(self, force_refresh=False):
         """
@@ -177,6 +136,9 @@ class IntegratedESPNDataAPI:
         """
         Get pitcher ERA using multiple methods to ensure accuracy
         
+        A pitcher neither source finds is cached as a negative result and
+        searched again after a growing backoff (see CacheNamespace.set_negative).
+        
         Args:
             team_name: Name of the team
             pitcher_name: Name of the pitcher
@@ -194,6 +156,12 @@ class IntegratedESPNDataAPI:
         if cached_data:
             return cached_data
         
+        # A pitcher recently not found isn't searched again until the
+        # negative result's re-check interval passes
+        negative = self.cache.get_negative(cache_key)
+        if negative:
+            return negative[0]
+        
         # Try multiple methods to get accurate ERA
         
         # Method 1: Try ESPN Direct Scraper first (most accurate)
@@ -202,6 +170,7 @@ class IntegratedESPNDataAPI:
         if era_data and 'era' in era_data and era_data['era'] != 'N/A':
             logger.info(f"Got ERA for {pitcher_name} ({team_name}) from ESPN Direct Scraper: {era_data['era']}")
             self.save_to_cache(cache_key, era_data)
+            self.cache.clear_negative(cache_key)
             return era_data
         
         # Method 2: Try ESPN API
@@ -210,6 +179,7 @@ class IntegratedESPNDataAPI:
         if api_era_data and 'era' in api_era_data and api_era_data['era'] != 'N/A':
             logger.info(f"Got ERA for {pitcher_name} ({team_name}) from ESPN API: {api_era_data['era']}")
             self.save_to_cache(cache_key, api_era_data)
+            self.cache.clear_negative(cache_key)
             return api_era_data
         
         # If we couldn't find the pitcher with either method, return a default value
@@ -223,8 +193,8 @@ class IntegratedESPNDataAPI:
             'note': 'Pitcher not found in ESPN data'
         }
         
-        logger.warning(f"Could not find ERA for {pitcher_name} ({team_name})")
-        self.save_to_cache(cache_key, default_data)
+        misses = self.cache.set_negative(cache_key, default_data)
+        logger.warning(f"Could not find ERA for {pitcher_name} ({team_name}), miss {misses}")
         
         return default_data
     
@@ -4,6 +4,7 @@ import logging
 import time
 from datetime import datetime
 from mlb_stats_api import MLBStatsAPI
+from cache_engine import get_cache_engine
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
@@ -25,15 +26,13 @@ class MLBDataFetcher:
         """
         self.cache_dir = cache_dir
         
-        # Create cache directory if it doesn't exist
-        os.makedirs(self.cache_dir, exist_ok=True)
+        # Shared cache namespace (memory + disk tiers, 15 minute TTL)
+        self.cache = get_cache_engine().namespace('mlb_data', self.cache_dir)
+        self.cache_expiration = self.cache.ttl
         
         # Initialize MLB Stats API
         self.mlb_stats_api = MLBStatsAPI()
         
-        # Cache expiration time (15 minutes)
-        self.cache_expiration = 15 * 60  # seconds
-        
         # Last refresh time
         self.last_refresh_time = 0
     
@@ -42,71 +41,31 @@ class MLBDataFetcher:
         Get data from cache if it exists and is not expired
         
         Args:
-            cache_key: Key to identify the cache file
+            cache_key: Key to identify the cache entry
             
         Returns:
             Cached data if it exists and is not expired, None otherwise
         """
-        cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-        
-        if os.path.exists(cache_file):
-            # Check if cache is expired
-            file_modified_time = os.path.getmtime(cache_file)
-            current_time = time.time()
-            
-            if current_time - file_modified_time < self.cache_expiration:
-                try:
-                    with open(cache_file, 'r') as f:
-                        data = json.load(f)
-                        logger.info(f"Using cached data for {cache_key}")
-                        return data
-                except Exception as e:
-                    logger.error(f"Error reading cache file: {e}")
-            else:
-                logger.info(f"Cache expired for {cache_key}")
-        
-        return None
+        return self.cache.get(cache_key)
     
     def save_to_cache(self, cache_key, data):
         """
         Save data to cache
         
         Args:
-            cache_key: Key to identify the cache file
+            cache_key: Key to identify the cache entry
             data: Data to save
         """
-        cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-        
-        try:
-            with open(cache_file, 'w') as f:
-                json.dump(data, f)
-                logger.info(f"Saved data to cache for {cache_key}")
-        except Exception as e:
-            logger.error(f"Error saving to cache: {e}")
+        self.cache.set(cache_key, data)
     
     def clear_cache(self, cache_key=None):
         """
         Clear cache for a specific key or all cache
         
         Args:
-            cache_key: Key to identify the cache file, or None to clear all cache
+            cache_key: Key to identify the cache entry, or None to clear all cache
         """
-        if cache_key:
-            cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-            if os.path.exists(cache_file):
-                try:
-                    os.remove(cache_file)
-                    logger.info(f"Cleared cache for {cache_key}")
-                except Exception as e:
-                    logger.error(f"Error clearing cache for {cache_key}: {e}")
-        else:
-            try:
-                for file in os.listdir(self.cache_dir):
-                    if file.endswith('.json'):
-                        os.remove(os.path.join(self.cache_dir, file))
-                logger.info("Cleared all cache")
-            except Exception as e:
-                logger.error(f"Error clearing all cache: {e}")
+        self.cache.delete(cache_key)
     
     def refresh_data_if_needed(self, force_refresh=False):
         """
@@ -1,9 +1,18 @@
 import os
 import json
+import hashlib
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
 from mlb_stats_api import MLBStatsAPI
+from cache_engine import get_cache_engine
+from refresh_scheduler import create_refresh_scheduler
+from prediction_events import get_prediction_broadcaster
+from cache_warmer import CacheWarmer
+from slate_scoring import MARKETS, score_games
+from game_context import GameContext, market_entries, delta_fields, changed_fields
+from inning_simulator import INNING_WINDOWS, DEFAULT_TRIALS, DEFAULT_SEED, simulate_games, simulate_slate, threshold_probabilities
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
@@ -11,6 +20,62 @@ logging.basicConfig(level=logging.INFO,
                     filename='mlb_prediction_api.log')
 logger = logging.getLogger('mlb_prediction_api')
 
+# Version of the predictions payload shape, part of the cache keys so entries
+# written in an older shape are never served
+PAYLOAD_VERSION = 3
+
+# Longest time (in seconds) a request waits on neighbouring dates' slates
+# when the requested date has no games
+FALLBACK_DEADLINE = float(os.environ.get('MLB_FALLBACK_DEADLINE', 10))
+
+# Number of days, starting today, offered by /api/dates (and kept warm)
+ADVERTISED_DAYS = 7
+
+# Inning window the over/under run markets (see slate_scoring.MARKETS) are
+# priced from
+RUN_MARKET_WINDOW = 'first_3_innings'
+
+# Score of a factor with no data behind it
+NEUTRAL_FACTOR_SCORE = 50
+
+# Approximate multi-year run park factors (1.0 is league average) by venue
+PARK_RUN_FACTORS = {
+    'Coors Field': 1.28,
+    'Great American Ball Park': 1.12,
+    'Fenway Park': 1.08,
+    'Citizens Bank Park': 1.05,
+    'Chase Field': 1.04,
+    'Kauffman Stadium': 1.03,
+    'Yankee Stadium': 1.03,
+    'Wrigley Field': 1.02,
+    'George M. Steinbrenner Field': 1.02,
+    'Globe Life Field': 1.01,
+    'Oriole Park at Camden Yards': 1.00,
+    'Truist Park': 1.00,
+    'Target Field': 1.00,
+    'Rogers Centre': 1.00,
+    'Nationals Park': 1.00,
+    'Angel Stadium': 0.99,
+    'American Family Field': 0.99,
+    'Minute Maid Park': 0.99,
+    'Daikin Park': 0.99,
+    'PNC Park': 0.98,
+    'Dodger Stadium': 0.98,
+    'Busch Stadium': 0.97,
+    'Rate Field': 0.97,
+    'Guaranteed Rate Field': 0.97,
+    'Progressive Field': 0.97,
+    'Comerica Park': 0.96,
+    'Citi Field': 0.95,
+    'Tropicana Field': 0.94,
+    'Oakland Coliseum': 0.93,
+    'Sutter Health Park': 1.00,
+    'Petco Park': 0.93,
+    'loanDepot park': 0.92,
+    'T-Mobile Park': 0.90,
+    'Oracle Park': 0.90
+}
+
 class MLBPredictionAPI:
     """
     API for MLB predictions with real-time data
@@ -30,18 +95,36 @@ class MLBPredictionAPI:
         else:
             self.cache_dir = cache_dir
         
-        # Create cache directory if it doesn't exist
-        os.makedirs(self.cache_dir, exist_ok=True)
+        # Shared cache namespace (memory + disk tiers, 15 minute TTL for
+        # current data; see ttl_policy for final games, other dates and
+        # season aggregates)
+        self.cache = get_cache_engine().namespace('predictions', self.cache_dir)
+        self.cache_expiration = self.cache.ttl
+        
+        # Persistent game_id -> (date, game predictions) index, rewritten
+        # whenever a slate is built
+        self.game_index = get_cache_engine().namespace('game_index', os.path.join(self.cache_dir, 'game_index'))
+        
+        # Changed games are published here after every slate build
+        self.events = get_prediction_broadcaster()
+        
+        # Hard expiry for stale predictions (6 hours by default). Between the
+        # cache TTL and this age, expired predictions are still served while a
+        # background refresh rebuilds them.
+        self.stale_expiration = int(os.environ.get('MLB_PREDICTIONS_HARD_EXPIRY', 6 * 3600))
         
         # Initialize MLB data fetcher
         self.mlb_stats_api = MLBStatsAPI()
         
-        # Cache expiration time (15 minutes)
-        self.cache_expiration = 15 * 60  # seconds
-        
         # Last refresh time
         self.last_refresh_time = 0
         
+        # Precomputes the advertised dates at boot and after each refresh
+        self.warmer = CacheWarmer(self)
+        
+        # Background refresh scheduler (started by the web app)
+        self.scheduler = create_refresh_scheduler(self)
+        
         # Prediction factors
         self.prediction_factors = {
             'pitcher_performance': 0.25,
@@ -63,75 +146,90 @@ class MLBPredictionAPI:
         Get data from cache if it exists and is not expired
         
         Args:
-            cache_key: Key to identify the cache file
+            cache_key: Key to identify the cache entry
             
         Returns:
             Cached data if it exists and is not expired, None otherwise
         """
-        cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-        
-        if os.path.exists(cache_file):
-            # Check if cache is expired
-            file_modified_time = os.path.getmtime(cache_file)
-            current_time = time.time()
-            
-            if current_time - file_modified_time < self.cache_expiration:
-                try:
-                    with open(cache_file, 'r') as f:
-                        data = json.load(f)
-                        logger.info(f"Using cached data for {cache_key}")
-                        return data
-                except Exception as e:
-                    logger.error(f"Error reading cache file: {e}")
-            else:
-                logger.info(f"Cache expired for {cache_key}")
-        
-        return None
+        return self.cache.get(cache_key)
     
     def save_to_cache(self, cache_key, data):
         """
         Save data to cache
         
         Args:
-            cache_key: Key to identify the cache file
+            cache_key: Key to identify the cache entry
             data: Data to save
         """
-        cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-        
-        try:
-            with open(cache_file, 'w') as f:
-                json.dump(data, f)
-                logger.info(f"Saved data to cache for {cache_key}")
-        except Exception as e:
-            logger.error(f"Error saving to cache: {e}")
+        self.cache.set(cache_key, data)
     
     def clear_cache(self, cache_key=None):
         """
         Clear cache for a specific key or all cache
         
         Args:
-            cache_key: Key to identify the cache file, or None to clear all cache
+            cache_key: Key to identify the cache entry, or None to clear all cache
         """
-        if cache_key:
-            cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-            if os.path.exists(cache_file):
-                try:
-                    os.remove(cache_file)
-                    logger.info(f"Cleared cache for {cache_key}")
-                except Exception as e:
-                    logger.error(f"Error clearing cache for {cache_key}: {e}")
-        else:
-            try:
-                for file in os.listdir(self.cache_dir):
-                    if file.endswith('.json'):
-                        os.remove(os.path.join(self.cache_dir, file))
-                logger.info("Cleared all cache")
-            except Exception as e:
-                logger.error(f"Error clearing all cache: {e}")
+        self.cache.delete(cache_key)
+    
+    def slate_cache_key(self, target_date):
+        """Cache key of a date's predictions"""
+        return f"all_predictions_v{PAYLOAD_VERSION}_{target_date}"
+    
+    def game_predictions_cache_key(self, target_date, game_id):
+        """Cache key of a single game's predictions"""
+        return f"game_predictions_v{PAYLOAD_VERSION}_{target_date}_{game_id}"
+    
+    def game_index_key(self, game_id):
+        """Get the game index key of a game (IDs from URLs arrive as strings)"""
+        return f"game_v{PAYLOAD_VERSION}_{game_id}"
+    
+    def index_games(self, target_date, games):
+        """
+        Record where each game of a built slate lives in the game index
+        
+        The index holds each game's date, a digest of its entry and its delta
+        fields, never the entry itself: lookups read the game's own
+        predictions entry, which pitcher and team stats changes invalidate.
+        
+        Args:
+            target_date: Date of the slate, in format YYYY-MM-DD
+            games: Game entries of the slate (see build_game_predictions)
+            
+        Returns:
+            Delta of each game whose delta fields are new or changed, as
+            {'game_id', 'version' (the entry digest), 'fields' (see
+            game_context.changed_fields)}
+        """
+        keys = [self.game_index_key(game.get('game_id')) for game in games]
+        entries = {
+            key: {
+                'date': target_date,
+                'digest': hashlib.sha1(json.dumps(game, sort_keys=True, default=str).encode('utf-8')).hexdigest(),
+                'fields': delta_fields(game)
+            }
+            for key, game in zip(keys, games)
+        }
+        previous = self.game_index.get_many(keys)
+        self.game_index.set_many(entries)
+        
+        deltas = []
+        for key, game in zip(keys, games):
+            entry, indexed = entries[key], previous.get(key) or {}
+            if indexed.get('digest') == entry['digest']:
+                continue
+            fields = changed_fields(entry['fields'], indexed.get('fields'))
+            if fields:
+                deltas.append({'game_id': game.get('game_id'), 'version': entry['digest'], 'fields': fields})
+        return deltas
     
     def refresh_data_if_needed(self, force_refresh=False):
         """
-        Refresh data if needed or forced
+        Refresh data if forced
+        
+        Periodic refreshes run on the background scheduler; this only runs every
+        scheduler job immediately. Fresh data replaces cached entries in place,
+        so nothing is cleared and readers never see an empty cache.
         
         Args:
             force_refresh: Force refresh of data
@@ -139,24 +237,74 @@ class MLBPredictionAPI:
         Returns:
             True if data was refreshed, False otherwise
         """
-        current_time = time.time()
+        if not force_refresh:
+            return False
         
-        # Refresh if forced or if last refresh was more than 15 minutes ago
-        if force_refresh or current_time - self.last_refresh_time > self.cache_expiration:
-            logger.info("Refreshing MLB prediction data")
-            
-            # Clear all cache
-            self.clear_cache()
-            
-            # Refresh MLB stats API
-            self.mlb_stats_api.clear_cache()
+        logger.info("Refreshing MLB prediction data")
+        results = self.scheduler.run_all()
+        return all(results.values())
+    
+    def get_available_dates(self, days=ADVERTISED_DAYS):
+        """
+        Get the dates offered to users, starting today
+        
+        Args:
+            days: Number of dates
             
-            # Update last refresh time
-            self.last_refresh_time = current_time
+        Returns:
+            List of {'date': 'YYYY-MM-DD', 'display': 'Weekday, Month DD, YYYY'}
+        """
+        today = datetime.now()
+        dates = []
+        for i in range(days):
+            date = today + timedelta(days=i)
+            dates.append({
+                'date': date.strftime('%Y-%m-%d'),
+                'display': date.strftime('%A, %B %d, %Y')
+            })
+        return dates
+    
+    def start_refresh(self):
+        """
+        Refresh every data source in the background
+        
+        Returns:
+            Status of the refresh job (see RefreshScheduler.get_refresh); a
+            refresh already in progress is returned instead of starting another
+        """
+        return self.scheduler.submit_refresh()
+    
+    def get_refresh_status(self, job_id):
+        """
+        Get the progress of a refresh job
+        
+        Args:
+            job_id: ID returned by start_refresh
             
-            return True
+        Returns:
+            Refresh job status, or None if the job is unknown
+        """
+        return self.scheduler.get_refresh(job_id)
+    
+    def refresh_predictions(self, target_date):
+        """
+        Rebuild predictions for a date and swap them into the cache
         
-        return False
+        Args:
+            target_date: Target date string in format YYYY-MM-DD
+            
+        Returns:
+            Rebuilt predictions
+        """
+        cache_key = self.slate_cache_key(target_date)
+        predictions = self.cache.get_or_compute(
+            cache_key,
+            lambda: self.build_predictions(target_date),
+            force_refresh=True,
+            depends_on=lambda data: self.get_slate_dependencies(target_date, data)
+        )
+        self.last_refresh_time = time.time()
+        return predictions
     
     def calculate_pitcher_performance_score(self, era, whip=None, strikeouts=None, innings_pitched=None):
         """
@@ -272,6 +420,9 @@ class MLBPredictionAPI:
         """
         Calculate probability of over X runs in the first three innings
         
+        The matchup is run through the inning simulator and the line is priced
+        from its run distribution, as get_markets does.
+        
         Args:
             home_pitcher_era: ERA of home team pitcher
             away_pitcher_era: ERA of away team pitcher
@@ -284,12 +435,9 @@ class MLBPredictionAPI:
         Returns:
             Probability of over X runs in the first three innings (0-100)
         """
-        # Calculate pitcher performance scores
-        home_pitcher_score = self.calculate_pitcher_performance_score(home_pitcher_era)
-        away_pitcher_score = self.calculate_pitcher_performance_score(away_pitcher_era)
-        
-        # Average the pitcher scores (both pitchers matter for first 3 innings)
-        pitcher_score = (home_pitcher_score + away_pitcher_score) / 2
+        simulation = simulate_slate([home_pitcher_era], [away_pitcher_era],
+                                    windows=(INNING_WINDOWS[RUN_MARKET_WINDOW],))
+        over = threshold_probabilities(simulation.game_distributions(0)[RUN_MARKET_WINDOW], run_threshold)['over']
         
         # Adjust for ballpark factors (some parks are more hitter-friendly)
         ballpark_factor = 1.0  # Neutral by default
@@ -303,30 +451,133 @@ class MLBPredictionAPI:
             # Implement weather-specific adjustments here
             pass
         
-        # For over/under, lower pitcher score = higher probability of over
-        # Invert the pitcher score
-        inverted_pitcher_score = 100 - pitcher_score
-        
-        # Calculate base probability based on run threshold
-        # Higher thresholds should have lower probabilities
-        threshold_factor = 1.0
-        if run_threshold == 2.5:
-            threshold_factor = 1.1  # Easier to go over 2.5 runs
-        elif run_threshold == 3.5:
-            threshold_factor = 0.9  # Harder to go over 3.5 runs
-        
-        # Scale from 0-100 to a probability between 30-70%
-        base_probability = 30 + (inverted_pitcher_score * 0.4 * threshold_factor)
-        
         # Apply ballpark and weather factors
-        adjusted_probability = base_probability * ballpark_factor * weather_factor
+        adjusted_probability = over * ballpark_factor * weather_factor
         
         # Ensure probability is between 0-100
         final_probability = max(0, min(100, adjusted_probability))
         
         return final_probability
     
-    def generate_factor_breakdown(self, prediction_type, home_team, away_team, probability):
+    def factor_inputs(self, home_team, away_team, home_team_stats=None, away_team_stats=None, venue=None):
+        """
+        Collect the cached inputs the factor scores are derived from
+        
+        Args:
+            home_team: Home team data
+            away_team: Away team data
+            home_team_stats: Optional home team stats data
+            away_team_stats: Optional away team stats data
+            venue: Optional venue name
+            
+        Returns:
+            Dictionary of plain values (None where an input is unavailable)
+        """
+        def number(value):
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                return None
+        
+        home_team_stats = home_team_stats or {}
+        away_team_stats = away_team_stats or {}
+        return {
+            'home_pitcher_era': number(home_team.get('probable_pitcher', {}).get('stats', {}).get('era')),
+            'away_pitcher_era': number(away_team.get('probable_pitcher', {}).get('stats', {}).get('era')),
+            'home_bullpen_era': number(home_team_stats.get('bullpen_era')),
+            'away_bullpen_era': number(away_team_stats.get('bullpen_era')),
+            'home_team_whip': number(home_team_stats.get('team_whip')),
+            'away_team_whip': number(away_team_stats.get('team_whip')),
+            'home_team_ops': number(home_team_stats.get('team_ops')),
+            'away_team_ops': number(away_team_stats.get('team_ops')),
+            'venue': venue
+        }
+    
+    def factor_inputs_version(self, inputs):
+        """
+        Get a short hash identifying a set of factor inputs
+        
+        Args:
+            inputs: Factor inputs (see factor_inputs)
+            
+        Returns:
+            Version string, stable across processes
+        """
+        encoded = json.dumps(inputs, sort_keys=True).encode('utf-8')
+        return hashlib.sha1(encoded).hexdigest()[:12]
+    
+    def calculate_factor_scores(self, inputs):
+        """
+        Calculate the market-independent score of every prediction factor
+        
+        Scores are a pure function of the inputs, so the same game always gets
+        the same breakdown. Factors with no data source yet (momentum, umpire,
+        handedness, base running, travel, injuries, weather) get the neutral
+        score.
+        
+        Args:
+            inputs: Factor inputs (see factor_inputs)
+            
+        Returns:
+            Dictionary mapping factor name (see prediction_factors) to score (0-100)
+        """
+        def clamp(score):
+            return max(0, min(100, score))
+        
+        def average(home_key, away_key):
+            values = [inputs[key] for key in (home_key, away_key) if inputs.get(key) is not None]
+            return sum(values) / len(values) if values else None
+        
+        # Each starter is scored on his own ERA (4.50 when unknown) and the two
+        # scores are averaged
+        pitcher_scores = [
+            self.calculate_pitcher_performance_score(era if era is not None else 4.50)
+            for era in (inputs.get('home_pitcher_era'), inputs.get('away_pitcher_era'))
+        ]
+        
+        scores = dict.fromkeys(self.prediction_factors, NEUTRAL_FACTOR_SCORE)
+        scores['pitcher_performance'] = sum(pitcher_scores) / len(pitcher_scores)
+        
+        # Bullpen ERA on the same 0-10 scale as the starters
+        bullpen_era = average('home_bullpen_era', 'away_bullpen_era')
+        if bullpen_era is not None:
+            scores['bullpen_performance'] = clamp(100 - (bullpen_era * 10))
+        
+        # Run-suppressing parks score above neutral, hitter's parks below
+        park_factor = PARK_RUN_FACTORS.get(inputs.get('venue'))
+        if park_factor is not None:
+            scores['ballpark_factors'] = clamp(50 + (1 - park_factor) * 150)
+        
+        # No batter-vs-pitcher history is collected, so use the lineups' OPS
+        # against a league-average .720
+        team_ops = average('home_team_ops', 'away_team_ops')
+        if team_ops is not None:
+            scores['batter_vs_pitcher'] = clamp(50 + (0.720 - team_ops) * 250)
+        
+        # Team WHIP (pitching plus defense) against a league-average 1.30
+        team_whip = average('home_team_whip', 'away_team_whip')
+        if team_whip is not None:
+            scores['defensive_metrics'] = clamp(50 + (1.30 - team_whip) * 100)
+        
+        return scores
+    
+    def get_factor_scores(self, context, force_refresh=False):
+        """
+        Get the factor scores for a game, cached by game_id and input version
+        
+        Args:
+            context: GameContext of the game
+            force_refresh: Force recalculation
+            
+        Returns:
+            Dictionary mapping factor name to score (see calculate_factor_scores)
+        """
+        inputs = self.factor_inputs(context.home_team, context.away_team, context.home_team_stats,
+                                    context.away_team_stats, context.venue)
+        cache_key = f"factor_scores_{context.game_id}_{self.factor_inputs_version(inputs)}"
+        return self.cache.get_or_compute(cache_key, lambda: self.calculate_factor_scores(inputs), force_refresh)
+    
+    def generate_factor_breakdown(self, prediction_type, home_team, away_team, probability, factor_scores=None):
         """
         Generate factor breakdown for prediction
         
@@ -335,10 +586,14 @@ class MLBPredictionAPI:
             home_team: Home team data
             away_team: Away team data
             probability: Prediction probability
+            factor_scores: Optional precomputed scores (see calculate_factor_scores)
             
         Returns:
             Factor breakdown
         """
+        if factor_scores is None:
+            factor_scores = self.calculate_factor_scores(self.factor_inputs(home_team, away_team))
+        
         # Get pitcher data
         home_pitcher = home_team.get('probable_pitcher', {})
         away_pitcher = away_team.get('probable_pitcher', {})
@@ -349,26 +604,6 @@ class MLBPredictionAPI:
         home_pitcher_era = home_pitcher.get('stats', {}).get('era', 'N/A')
         away_pitcher_era = away_pitcher.get('stats', {}).get('era', 'N/A')
         
-        # Calculate factor scores
-        pitcher_performance_score = self.calculate_pitcher_performance_score(
-            (float(home_pitcher_era) if home_pitcher_era != 'N/A' else 4.50) + 
-            (float(away_pitcher_era) if away_pitcher_era != 'N/A' else 4.50)
-        ) / 2
-        
-        # Generate random but sensible scores for other factors
-        import random
-        bullpen_performance_score = random.uniform(40, 60)
-        ballpark_factors_score = random.uniform(40, 60)
-        batter_vs_pitcher_score = random.uniform(40, 60)
-        defensive_metrics_score = random.uniform(40, 60)
-        team_momentum_score = random.uniform(40, 60)
-        umpire_impact_score = random.uniform(40, 60)
-        handedness_matchups_score = random.uniform(40, 60)
-        base_running_score = random.uniform(40, 60)
-        travel_schedule_score = random.uniform(40, 60)
-        injury_impact_score = random.uniform(40, 60)
-        weather_conditions_score = random.uniform(40, 60)
-        
         # For first inning no run, higher pitcher score is better
         # For over runs, lower pitcher score is better
         if prediction_type == 'under_1_run_first_inning':
@@ -381,73 +616,73 @@ class MLBPredictionAPI:
             {
                 'factor': 'Pitcher Performance',
                 'weight': self.prediction_factors['pitcher_performance'],
-                'score': pitcher_performance_score * factor_direction,
+                'score': factor_scores['pitcher_performance'] * factor_direction,
                 'description': f"Home: {home_pitcher_name} (ERA: {home_pitcher_era}), Away: {away_pitcher_name} (ERA: {away_pitcher_era})"
             },
             {
                 'factor': 'Bullpen Performance',
                 'weight': self.prediction_factors['bullpen_performance'],
-                'score': bullpen_performance_score * factor_direction,
+                'score': factor_scores['bullpen_performance'] * factor_direction,
                 'description': "Analysis of bullpen effectiveness and recent workload"
             },
             {
                 'factor': 'Ballpark Factors',
                 'weight': self.prediction_factors['ballpark_factors'],
-                'score': ballpark_factors_score * factor_direction,
+                'score': factor_scores['ballpark_factors'] * factor_direction,
                 'description': "Impact of ballpark dimensions and conditions on scoring"
             },
             {
                 'factor': 'Batter vs. Pitcher Matchups',
                 'weight': self.prediction_factors['batter_vs_pitcher'],
-                'score': batter_vs_pitcher_score * factor_direction,
+                'score': factor_scores['batter_vs_pitcher'] * factor_direction,
                 'description': "Historical performance of batters against specific pitchers"
             },
             {
                 'factor': 'Defensive Metrics',
                 'weight': self.prediction_factors['defensive_metrics'],
-                'score': defensive_metrics_score * factor_direction,
+                'score': factor_scores['defensive_metrics'] * factor_direction,
                 'description': "Team defensive efficiency and fielding metrics"
             },
             {
                 'factor': 'Team Momentum',
                 'weight': self.prediction_factors['team_momentum'],
-                'score': team_momentum_score * factor_direction,
+                'score': factor_scores['team_momentum'] * factor_direction,
                 'description': "Recent team performance and winning/losing streaks"
             },
             {
                 'factor': 'Umpire Impact',
                 'weight': self.prediction_factors['umpire_impact'],
-                'score': umpire_impact_score * factor_direction,
+                'score': factor_scores['umpire_impact'] * factor_direction,
                 'description': "Umpire tendencies for strike zone and pace of play"
             },
             {
                 'factor': 'Handedness Matchups',
                 'weight': self.prediction_factors['handedness_matchups'],
-                'score': handedness_matchups_score * factor_direction,
+                'score': factor_scores['handedness_matchups'] * factor_direction,
                 'description': "Pitcher vs. batter handedness advantages"
             },
             {
                 'factor': 'Base Running',
                 'weight': self.prediction_factors['base_running'],
-                'score': base_running_score * factor_direction,
+                'score': factor_scores['base_running'] * factor_direction,
                 'description': "Team base running efficiency and stolen base success"
             },
             {
                 'factor': 'Travel Schedule',
                 'weight': self.prediction_factors['travel_schedule'],
-                'score': travel_schedule_score * factor_direction,
+                'score': factor_scores['travel_schedule'] * factor_direction,
                 'description': "Impact of travel fatigue and time zone changes"
             },
             {
                 'factor': 'Injury Impact',
                 'weight': self.prediction_factors['injury_impact'],
-                'score': injury_impact_score * factor_direction,
+                'score': factor_scores['injury_impact'] * factor_direction,
                 'description': "Key player injuries and their impact on team performance"
             },
             {
                 'factor': 'Weather Conditions',
                 'weight': self.prediction_factors['weather_conditions'],
-                'score': weather_conditions_score * factor_direction,
+                'score': factor_scores['weather_conditions'] * factor_direction,
                 'description': "Temperature, wind, and humidity effects on ball flight"
             }
         ]
@@ -470,176 +705,468 @@ class MLBPredictionAPI:
             target_date = datetime.now().strftime('%Y-%m-%d')
         
         # Create cache key
-        cache_key = f"all_predictions_{target_date}"
+        cache_key = self.slate_cache_key(target_date)
+        
+        if force_refresh:
+            # Forced refresh rebuilds synchronously from fresh upstream data
+            return self.cache.get_or_compute(
+                cache_key,
+                lambda: self.build_predictions(target_date, force_refresh),
+                force_refresh,
+                lambda data: self.get_slate_dependencies(target_date, data)
+            )
         
-        # Check if we need to refresh data
-        self.refresh_data_if_needed(force_refresh)
+        # Serve from cache; expired predictions are served (marked stale) while
+        # a background refresh rebuilds them, and concurrent misses share a
+        # single slate build
+        predictions, is_stale = self.cache.get_or_revalidate(
+            cache_key,
+            lambda: self.build_predictions(target_date),
+            self.stale_expiration,
+            lambda data: self.get_slate_dependencies(target_date, data)
+        )
         
-        # Try to get cached data
-        cached_data = self.get_cached_data(cache_key)
-        if cached_data and not force_refresh:
-            return cached_data
+        if is_stale:
+            logger.info(f"Serving stale predictions for {target_date} while refreshing")
+            predictions = dict(predictions)
+            predictions['metadata'] = dict(predictions.get('metadata', {}), stale=True)
+        
+        return predictions
+    
+    def get_predictions_with_fallback(self, target_date, force_refresh=False):
+        """
+        Get predictions for a date, falling back to a neighbouring date with games
         
+        When the requested date has no games, the schedule index picks the
+        first of yesterday and tomorrow that has games, so only that slate is
+        built. If the schedule can't be fetched, both candidates are built
+        concurrently and the first (in that order) with games within
+        FALLBACK_DEADLINE seconds is used.
+        
+        Args:
+            target_date: Target date string in format YYYY-MM-DD
+            force_refresh: Force refresh of data
+            
+        Returns:
+            Predictions for the requested or a neighbouring date, or None if
+            none of them has games
+        """
+        predictions = self.get_all_predictions(force_refresh, target_date)
+        if predictions and predictions.get('games'):
+            return predictions
+        
+        day = datetime.strptime(target_date, '%Y-%m-%d')
+        candidates = [(day + timedelta(days=offset)).strftime('%Y-%m-%d') for offset in (-1, 1)]
+        
+        schedule = self.mlb_stats_api.get_schedule_index(candidates[0], candidates[-1])
+        if schedule is not None:
+            for candidate in candidates:
+                if schedule.get(candidate):
+                    logger.info(f"No games on {target_date}, using {candidate} from the schedule index")
+                    predictions = self.get_all_predictions(force_refresh, candidate)
+                    if predictions and predictions.get('games'):
+                        return predictions
+            return None
+        
+        # No schedule index: build the candidates concurrently under a deadline.
+        # Builds still running at the deadline finish in the background and
+        # leave their slates cached.
+        executor = ThreadPoolExecutor(max_workers=len(candidates))
+        try:
+            futures = [executor.submit(self.get_all_predictions, force_refresh, candidate) for candidate in candidates]
+            wait(futures, timeout=FALLBACK_DEADLINE)
+            for candidate, future in zip(candidates, futures):
+                if future.done() and not future.exception():
+                    predictions = future.result()
+                    if predictions and predictions.get('games'):
+                        logger.info(f"No games on {target_date}, using {candidate}")
+                        return predictions
+            return None
+        finally:
+            executor.shutdown(wait=False)
+    
+    def build_predictions(self, target_date, force_refresh=False):
+        """
+        Build predictions for every game on a date (uncached)
+        
+        Args:
+            target_date: Target date string in format YYYY-MM-DD
+            force_refresh: Force refresh of upstream data
+            
+        Returns:
+            All predictions for the specified date
+        """
         # Get games for the target date
         games = self.mlb_stats_api.get_games_for_date(target_date, force_refresh)
         
-        # Generate predictions for each game
+        # Gather team stats for the games that need building, once per team and
+        # concurrently, before scoring each game
+        pending = self.get_pending_games(target_date, games, force_refresh)
+        team_stats = self.get_slate_team_stats(target_date, pending, force_refresh)
+        
+        # Score the first-inning market for the whole slate in one vectorized
+        # pass, and price the run lines from the games' simulated distributions
+        # so they agree with /api/markets
+        slate_scores = score_games(games)
+        distributions = self.get_game_run_distributions(pending, team_stats, force_refresh)
+        for game, game_scores in zip(games, slate_scores):
+            distribution = distributions.get(game.get('game_id'))
+            if distribution is not None:
+                game_scores.update(self.score_distribution(distribution))
+        
+        # Each game is listed once, with its market predictions nested under
+        # it; each market lists the games ranked by probability
         predictions = {
-            'under_1_run_first_inning': [],
-            'over_2.5_runs_first_3_innings': [],
-            'over_3.5_runs_first_3_innings': []
+            'games': [
+                self.get_game_predictions(target_date, game, force_refresh, team_stats, game_scores)
+                for game, game_scores in zip(games, slate_scores)
+            ]
+        }
+        predictions.update(market_entries(predictions['games']))
+        deltas = self.index_games(target_date, predictions['games'])
+        
+        # Add metadata
+        predictions['metadata'] = {
+            'date': target_date,
+            'timestamp': datetime.now().timestamp(),
+            'game_count': len(games),
+            'data_source': 'MLB Stats API (Official)',
+            'stale': False
         }
         
-        for game in games:
-            # Get team and pitcher data
-            home_team_name = game.get('home_team')
-            away_team_name = game.get('away_team')
+        # Push only the fields that changed to live dashboards
+        if deltas:
+            self.events.publish('predictions', {
+                'date': target_date,
+                'timestamp': predictions['metadata']['timestamp'],
+                'games': deltas
+            })
+        
+        return predictions
+    
+    def get_slate_dependencies(self, target_date, predictions):
+        """
+        Get the inputs a date's predictions were derived from
+        
+        Args:
+            target_date: Target date string in format YYYY-MM-DD
+            predictions: Predictions built for the date
             
-            home_pitcher_name = game.get('home_pitcher')
-            away_pitcher_name = game.get('away_pitcher')
+        Returns:
+            List of input ids: the date's schedule and each game's predictions
+        """
+        game_ids = [game.get('game_id') for game in predictions.get('games', [])]
+        
+        depends_on = [self.mlb_stats_api.cache.dependency_id(f"games_{target_date}")]
+        depends_on.extend(self.cache.dependency_id(self.game_predictions_cache_key(target_date, game_id)) for game_id in game_ids)
+        return depends_on
+    
+    def get_pending_games(self, target_date, games, force_refresh=False):
+        """
+        Get the games whose predictions need building
+        
+        Games with cached predictions are skipped (unless forcing a refresh), so
+        a warm slate makes no team stats lookups or simulations.
+        
+        Args:
+            target_date: Target date string in format YYYY-MM-DD
+            games: Game records from the schedule
+            force_refresh: Force refresh of data
             
-            home_pitcher_era = game.get('home_era')
-            away_pitcher_era = game.get('away_era')
+        Returns:
+            List of game records
+        """
+        if force_refresh:
+            return list(games)
+        
+        cached = self.cache.get_many([self.game_predictions_cache_key(target_date, game.get('game_id')) for game in games])
+        return [game for game in games if self.game_predictions_cache_key(target_date, game.get('game_id')) not in cached]
+    
+    def get_slate_team_stats(self, target_date, games, force_refresh=False):
+        """
+        Get team stats for every team playing in the given games
+        
+        Args:
+            target_date: Target date string in format YYYY-MM-DD
+            games: Game records whose predictions need building (see get_pending_games)
+            force_refresh: Force refresh of data
             
-            venue = game.get('venue')
-            game_time = game.get('game_time')
+        Returns:
+            Dictionary mapping team name to team stats data
+        """
+        team_names = [game.get(side) for game in games for side in ('home_team', 'away_team')]
+        return self.mlb_stats_api.get_team_stats_bulk(team_names, force_refresh)
+    
+    def get_game_predictions(self, target_date, game, force_refresh=False, team_stats=None, scores=None):
+        """
+        Get the predictions for a single game, cached per game
+        
+        The cache entry records the game record, pitcher ERAs and team stats it
+        was built from, so a change to any of them evicts only this game's
+        predictions (and the slate containing it), not the rest of the slate.
+        
+        Args:
+            target_date: Target date string in format YYYY-MM-DD
+            game: Game record from the schedule
+            force_refresh: Force refresh of data
+            team_stats: Optional prefetched team stats, keyed by team name
+            scores: Optional precomputed market scores (see slate_scoring.score_games)
             
-            # Get team stats
-            home_team_stats = self.mlb_stats_api.get_team_stats(home_team_name)
-            away_team_stats = self.mlb_stats_api.get_team_stats(away_team_name)
+        Returns:
+            The game's entry in the predictions payload (see build_game_predictions)
+        """
+        stats_cache = self.mlb_stats_api.cache
+        depends_on = [
+            stats_cache.dependency_id(self.mlb_stats_api.game_cache_key(target_date, game.get('game_id'))),
+            stats_cache.dependency_id(self.mlb_stats_api.team_stats_cache_key(game.get('home_team'))),
+            stats_cache.dependency_id(self.mlb_stats_api.team_stats_cache_key(game.get('away_team'))),
+            stats_cache.dependency_id(self.mlb_stats_api.pitcher_era_cache_key(game.get('home_team'), game.get('home_pitcher'))),
+            stats_cache.dependency_id(self.mlb_stats_api.pitcher_era_cache_key(game.get('away_team'), game.get('away_pitcher')))
+        ]
+        
+        return self.cache.get_or_compute(
+            self.game_predictions_cache_key(target_date, game.get('game_id')),
+            lambda: self.build_game_predictions(game, force_refresh, team_stats, scores),
+            force_refresh,
+            depends_on
+        )
+    
+    def build_game_predictions(self, game, force_refresh=False, team_stats=None, scores=None):
+        """
+        Build the predictions for a single game (uncached)
+        
+        The game's context (teams, pitchers, team stats, factor breakdown) is
+        built once and shared by every market.
+        
+        Args:
+            game: Game record from the schedule
+            force_refresh: Force refresh of upstream data
+            team_stats: Optional prefetched team stats, keyed by team name
+            scores: Optional precomputed market scores (see slate_scoring.score_games)
             
-            # Calculate probabilities
-            under_1_run_probability = self.calculate_first_inning_no_run_probability(
-                home_pitcher_era, away_pitcher_era, home_team_name, away_team_name, venue
-            )
+        Returns:
+            The game, serialized once, with each market's prediction nested under it
+        """
+        # Get team stats (prefetched for the slate when available)
+        team_stats = team_stats or {}
+        home_team_name = game.get('home_team')
+        away_team_name = game.get('away_team')
+        home_team_stats = team_stats.get(home_team_name) or self.mlb_stats_api.get_team_stats(home_team_name, force_refresh)
+        away_team_stats = team_stats.get(away_team_name) or self.mlb_stats_api.get_team_stats(away_team_name, force_refresh)
+        
+        context = GameContext(game, home_team_stats, away_team_stats)
+        
+        # Calculate probabilities (precomputed for the slate when available)
+        if not scores:
+            scores = self.score_game(game)
+        
+        # The factor breakdown is built once per game; markets only differ in
+        # whether a high factor score favors them (+1) or works against them (-1)
+        factors = self.generate_factor_breakdown(
+            'under_1_run_first_inning', context.home_team, context.away_team,
+            scores['under_1_run_first_inning']['probability'],
+            self.get_factor_scores(context, force_refresh)
+        )
+        
+        predictions = {}
+        for market in MARKETS:
+            probability = scores[market]['probability']
+            predictions[market] = {
+                'probability': probability,
+                'rating': scores[market].get('rating') or self.get_rating(probability),
+                'factor_direction': 1 if market == 'under_1_run_first_inning' else -1
+            }
+        
+        return context.to_dict(predictions, factors)
+    
+    def score_game(self, game):
+        """
+        Score every market for a single game with the scalar calculators
+        
+        Used only when no precomputed scores are given; build_predictions
+        scores whole slates (see score_games and score_distribution).
+        
+        Args:
+            game: Game record from the schedule
             
-            over_2_5_runs_probability = self.calculate_first_three_innings_run_probability(
-                home_pitcher_era, away_pitcher_era, home_team_name, away_team_name, 2.5, venue
-            )
+        Returns:
+            Dictionary mapping market to {'probability': float, 'rating': str}
+        """
+        home_pitcher_era = game.get('home_era')
+        away_pitcher_era = game.get('away_era')
+        home_team_name = game.get('home_team')
+        away_team_name = game.get('away_team')
+        venue = game.get('venue')
+        
+        scores = {}
+        for market, run_threshold in MARKETS.items():
+            if run_threshold is None:
+                probability = self.calculate_first_inning_no_run_probability(
+                    home_pitcher_era, away_pitcher_era, home_team_name, away_team_name, venue
+                )
+            else:
+                probability = self.calculate_first_three_innings_run_probability(
+                    home_pitcher_era, away_pitcher_era, home_team_name, away_team_name, run_threshold, venue
+                )
+            scores[market] = {'probability': probability, 'rating': self.get_rating(probability)}
+        return scores
+    
+    def run_distribution_cache_key(self, game, team_stats):
+        """
+        Get the cache key of a game's simulated run distributions
+        
+        The key carries a hash of the simulation inputs, so new pitcher ERAs
+        or team stats are simulated afresh while unchanged games are reused.
+        """
+        home_stats = team_stats.get(game.get('home_team')) or {}
+        away_stats = team_stats.get(game.get('away_team')) or {}
+        inputs = [
+            game.get('home_era'), game.get('away_era'),
+            home_stats.get('team_ops'), away_stats.get('team_ops'),
+            home_stats.get('bullpen_era'), away_stats.get('bullpen_era'),
+            DEFAULT_TRIALS, DEFAULT_SEED
+        ]
+        version = hashlib.sha1(json.dumps(inputs, default=str).encode('utf-8')).hexdigest()[:12]
+        return f"run_distribution_{game.get('game_id')}_{version}"
+    
+    def get_run_distributions(self, target_date, force_refresh=False):
+        """
+        Get every game's simulated run distributions for a date
+        
+        Args:
+            target_date: Target date string in format YYYY-MM-DD
+            force_refresh: Force refresh of data
             
-            over_3_5_runs_probability = self.calculate_first_three_innings_run_probability(
-                home_pitcher_era, away_pitcher_era, home_team_name, away_team_name, 3.5, venue
-            )
+        Returns:
+            List of {'game_id', 'home_team', 'away_team', 'windows'}, where
+            windows maps window name to the at-least-n-runs curve (see
+            inning_simulator.SlateSimulation.game_distributions)
+        """
+        games = self.mlb_stats_api.get_games_for_date(target_date, force_refresh)
+        team_names = [game.get(side) for game in games for side in ('home_team', 'away_team')]
+        team_stats = self.mlb_stats_api.get_team_stats_bulk(team_names, force_refresh)
+        
+        distributions = self.get_game_run_distributions(games, team_stats, force_refresh)
+        return [distributions[game.get('game_id')] for game in games]
+    
+    def get_game_run_distributions(self, games, team_stats, force_refresh=False):
+        """
+        Get the simulated run distributions of several games
+        
+        Each game is simulated once for all inning windows and cached. The
+        misses are simulated together in one batch (each game's result is the
+        same as simulating it alone), and concurrent requests for the same
+        games, in this or another worker, wait for that batch instead of
+        repeating it.
+        
+        Args:
+            games: Game records from the schedule
+            team_stats: Team stats keyed by team name
+            force_refresh: Force refresh of data
             
-            # Create prediction objects
-            under_1_run_prediction = {
-                'game_id': game.get('game_id'),
-                'home_team': {
-                    'name': home_team_name,
-                    'probable_pitcher': {
-                        'name': home_pitcher_name,
-                        'stats': {
-                            'era': home_pitcher_era
-                        }
-                    },
-                    'stats': home_team_stats
-                },
-                'away_team': {
-                    'name': away_team_name,
-                    'probable_pitcher': {
-                        'name': away_pitcher_name,
-                        'stats': {
-                            'era': away_pitcher_era
-                        }
-                    },
-                    'stats': away_team_stats
-                },
-                'venue': venue,
-                'game_time': game_time,
-                'probability': under_1_run_probability,
-                'rating': self.get_rating(under_1_run_probability),
-                'factors': self.generate_factor_breakdown('under_1_run_first_inning', 
-                                                         {'name': home_team_name, 'probable_pitcher': {'name': home_pitcher_name, 'stats': {'era': home_pitcher_era}}}, 
-                                                         {'name': away_team_name, 'probable_pitcher': {'name': away_pitcher_name, 'stats': {'era': away_pitcher_era}}},
-                                                         under_1_run_probability)
-            }
+        Returns:
+            Dictionary mapping game_id to its run distributions entry (see
+            get_run_distributions)
+        """
+        if not games:
+            return {}
+        
+        games_by_key = {self.run_distribution_cache_key(game, team_stats): game for game in games}
+        batch_key = 'run_distributions_' + hashlib.sha1(' '.join(sorted(games_by_key)).encode('utf-8')).hexdigest()[:12]
+        distributions = self.cache.get_or_compute_many(
+            list(games_by_key),
+            lambda missing: self.simulate_run_distributions([games_by_key[key] for key in missing], team_stats, missing),
+            batch_key,
+            force_refresh
+        )
+        return {game.get('game_id'): distributions[key] for key, game in games_by_key.items()}
+    
+    def simulate_run_distributions(self, games, team_stats, cache_keys):
+        """
+        Simulate several games' run distributions in one batch (uncached)
+        
+        Args:
+            games: Game records from the schedule
+            team_stats: Team stats keyed by team name
+            cache_keys: Cache key of each game (see run_distribution_cache_key)
             
-            over_2_5_runs_prediction = {
+        Returns:
+            Dictionary mapping cache key to run distributions entry (see
+            get_run_distributions)
+        """
+        simulation = simulate_games(games, team_stats=team_stats)
+        return {
+            cache_key: {
                 'game_id': game.get('game_id'),
-                'home_team': {
-                    'name': home_team_name,
-                    'probable_pitcher': {
-                        'name': home_pitcher_name,
-                        'stats': {
-                            'era': home_pitcher_era
-                        }
-                    },
-                    'stats': home_team_stats
-                },
-                'away_team': {
-                    'name': away_team_name,
-                    'probable_pitcher': {
-                        'name': away_pitcher_name,
-                        'stats': {
-                            'era': away_pitcher_era
-                        }
-                    },
-                    'stats': away_team_stats
-                },
-                'venue': venue,
-                'game_time': game_time,
-                'probability': over_2_5_runs_probability,
-                'rating': self.get_rating(over_2_5_runs_probability),
-                'factors': self.generate_factor_breakdown('over_2.5_runs_first_3_innings', 
-                                                         {'name': home_team_name, 'probable_pitcher': {'name': home_pitcher_name, 'stats': {'era': home_pitcher_era}}}, 
-                                                         {'name': away_team_name, 'probable_pitcher': {'name': away_pitcher_name, 'stats': {'era': away_pitcher_era}}},
-                                                         over_2_5_runs_probability)
+                'home_team': game.get('home_team'),
+                'away_team': game.get('away_team'),
+                'windows': simulation.game_distributions(i)
             }
+            for i, (cache_key, game) in enumerate(zip(cache_keys, games))
+        }
+    
+    def score_distribution(self, distribution):
+        """
+        Score the run-line markets from a game's simulated run distributions
+        
+        Args:
+            distribution: Run distributions entry (see get_run_distributions)
             
-            over_3_5_runs_prediction = {
-                'game_id': game.get('game_id'),
-                'home_team': {
-                    'name': home_team_name,
-                    'probable_pitcher': {
-                        'name': home_pitcher_name,
-                        'stats': {
-                            'era': home_pitcher_era
-                        }
-                    },
-                    'stats': home_team_stats
-                },
-                'away_team': {
-                    'name': away_team_name,
-                    'probable_pitcher': {
-                        'name': away_pitcher_name,
-                        'stats': {
-                            'era': away_pitcher_era
-                        }
-                    },
-                    'stats': away_team_stats
-                },
-                'venue': venue,
-                'game_time': game_time,
-                'probability': over_3_5_runs_probability,
-                'rating': self.get_rating(over_3_5_runs_probability),
-                'factors': self.generate_factor_breakdown('over_3.5_runs_first_3_innings', 
-                                                         {'name': home_team_name, 'probable_pitcher': {'name': home_pitcher_name, 'stats': {'era': home_pitcher_era}}}, 
-                                                         {'name': away_team_name, 'probable_pitcher': {'name': away_pitcher_name, 'stats': {'era': away_pitcher_era}}},
-                                                         over_3_5_runs_probability)
-            }
+        Returns:
+            Dictionary mapping each market with a run threshold (see
+            slate_scoring.MARKETS) to {'probability': float, 'rating': str}
+        """
+        scores = {}
+        for market, run_threshold in MARKETS.items():
+            if run_threshold is not None:
+                probability = threshold_probabilities(distribution['windows'][RUN_MARKET_WINDOW], run_threshold)['over']
+                scores[market] = {'probability': probability, 'rating': self.get_rating(probability)}
+        return scores
+    
+    def get_markets(self, target_date, thresholds, windows=None, force_refresh=False):
+        """
+        Price over/under run lines for every game on a date
+        
+        Every threshold and window is read from the same cached distributions,
+        so adding lines costs a lookup each, not another simulation.
+        
+        Args:
+            target_date: Target date string in format YYYY-MM-DD
+            thresholds: Run lines (e.g., [0.5, 2.5, 3.5])
+            windows: Inning window names (see inning_simulator.INNING_WINDOWS),
+                all windows by default
+            force_refresh: Force refresh of data
             
-            # Add predictions to the list
-            predictions['under_1_run_first_inning'].append(under_1_run_prediction)
-            predictions['over_2.5_runs_first_3_innings'].append(over_2_5_runs_prediction)
-            predictions['over_3.5_runs_first_3_innings'].append(over_3_5_runs_prediction)
+        Returns:
+            Markets for the date, keyed by window and then threshold per game
+        """
+        windows = list(windows or INNING_WINDOWS)
+        unknown = [window for window in windows if window not in INNING_WINDOWS]
+        if unknown:
+            raise ValueError(f"Unknown inning windows: {', '.join(unknown)}")
         
-        # Sort predictions by probability (descending)
-        predictions['under_1_run_first_inning'] = sorted(predictions['under_1_run_first_inning'], key=lambda x: x['probability'], reverse=True)
-        predictions['over_2.5_runs_first_3_innings'] = sorted(predictions['over_2.5_runs_first_3_innings'], key=lambda x: x['probability'], reverse=True)
-        predictions['over_3.5_runs_first_3_innings'] = sorted(predictions['over_3.5_runs_first_3_innings'], key=lambda x: x['probability'], reverse=True)
+        games = []
+        for distribution in self.get_run_distributions(target_date, force_refresh):
+            games.append({
+                'game_id': distribution['game_id'],
+                'home_team': distribution['home_team'],
+                'away_team': distribution['away_team'],
+                'markets': {
+                    window: {
+                        f"{threshold:g}": threshold_probabilities(distribution['windows'][window], threshold)
+                        for threshold in thresholds
+                    }
+                    for window in windows
+                }
+            })
         
-        # Add metadata
-        predictions['metadata'] = {
+        return {
             'date': target_date,
-            'timestamp': datetime.now().timestamp(),
-            'game_count': len(games),
-            'data_source': 'MLB Stats API (Official)'
+            'windows': windows,
+            'thresholds': list(thresholds),
+            'trials': DEFAULT_TRIALS,
+            'games': games
         }
-        
-        # Save to cache
-        self.save_to_cache(cache_key, predictions)
-        
-        return predictions
     
     def get_prediction_for_game_id(self, game_id, force_refresh=False):
         """
@@ -650,36 +1177,46 @@ class MLBPredictionAPI:
             force_refresh: Force refresh of data
             
         Returns:
-            Prediction for the specified game
+            Prediction for the specified game, or None if it isn't found
         """
-        # Get today's date
-        today = datetime.now().strftime('%Y-%m-%d')
+        return self.get_versioned_prediction(game_id, force_refresh)[0]
+    
+    def get_versioned_prediction(self, game_id, force_refresh=False):
+        """
+        Get prediction for a specific game, with a version of its content
         
-        # Get all predictions for today
-        all_predictions = self.get_all_predictions(force_refresh)
+        The game index gives the game's date, and the game is read from its
+        own predictions entry. If that entry was invalidated (or the game
+        isn't indexed yet) the game's date (or today's, for an unindexed game)
+        is rebuilt; neighbouring dates never are.
         
-        # Search for the game in all prediction types
-        for prediction_type, predictions in all_predictions.items():
-            if prediction_type != 'metadata':
-                for prediction in predictions:
-                    if prediction.get('game_id') == game_id:
-                        return prediction
+        Args:
+            game_id: Game ID
+            force_refresh: Force refresh of data
+            
+        Returns:
+            Tuple of (prediction, version), where version is the payload shape
+            plus the store time of the game's entry (or the build timestamp
+            and staleness of the slate it was read from); (None, None) if the
+            game isn't found
+        """
+        indexed = self.game_index.get(self.game_index_key(game_id))
+        if indexed and not force_refresh:
+            entry = self.cache.get_entry(self.game_predictions_cache_key(indexed['date'], game_id))
+            if entry is not None and entry[0]:
+                return entry[0], (PAYLOAD_VERSION, entry[1])
         
-        # If game not found, try yesterday and tomorrow
-        yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
-        tomorrow = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
+        # Rebuild the game's own date, or today's slate for an unindexed game
+        target_date = indexed['date'] if indexed else datetime.now().strftime('%Y-%m-%d')
+        all_predictions = self.get_all_predictions(force_refresh, target_date)
+        metadata = all_predictions.get('metadata', {})
         
-        for date_str in [yesterday, tomorrow]:
-            all_predictions = self.get_all_predictions(force_refresh, date_str)
-            
-            for prediction_type, predictions in all_predictions.items():
-                if prediction_type != 'metadata':
-                    for prediction in predictions:
-                        if prediction.get('game_id') == game_id:
-                            return prediction
+        for game in all_predictions.get('games', []):
+            if str(game.get('game_id')) == str(game_id):
+                return game, (PAYLOAD_VERSION, metadata.get('timestamp'), metadata.get('stale'))
         
         # Game not found
-        return None
+        return None, None
     
     def get_rating(self, probability):
         """
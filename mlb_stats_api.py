@@ -1,9 +1,13 @@
 import os
 import json
+import hashlib
 import logging
 import time
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from cache_engine import get_cache_engine
+from http_client import get_http_client
+from team_registry import TEAMS, get_team
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
@@ -11,6 +15,12 @@ logging.basicConfig(level=logging.INFO,
                     filename='mlb_stats_api.log')
 logger = logging.getLogger('mlb_stats_api')
 
+# Maximum concurrent upstream lookups when enriching a slate
+ENRICHMENT_WORKERS = int(os.environ.get('MLB_ENRICHMENT_WORKERS', 8))
+
+# Maximum person IDs per bulk /people request (keeps the URL short)
+PEOPLE_BATCH_SIZE = 50
+
 class MLBStatsAPI:
     """
     API for MLB statistics with real-time data
@@ -30,45 +40,15 @@ class MLBStatsAPI:
         else:
             self.cache_dir = cache_dir
         
-        # Create cache directory if it doesn't exist
-        os.makedirs(self.cache_dir, exist_ok=True)
-        
-        # Cache expiration time (15 minutes)
-        self.cache_expiration = 15 * 60  # seconds
+        # Shared cache namespace (memory + disk tiers, 15 minute TTL for
+        # current data; see ttl_policy for final games, other dates and
+        # season aggregates)
+        self.cache = get_cache_engine().namespace('mlb_stats', self.cache_dir)
+        self.http = get_http_client()
+        self.cache_expiration = self.cache.ttl
         
         # Team mapping (team name to abbreviation)
-        self.team_mapping = {
-            'Arizona Diamondbacks': 'ARI',
-            'Atlanta Braves': 'ATL',
-            'Baltimore Orioles': 'BAL',
-            'Boston Red Sox': 'BOS',
-            'Chicago Cubs': 'CHC',
-            'Chicago White Sox': 'CWS',
-            'Cincinnati Reds': 'CIN',
-            'Cleveland Guardians': 'CLE',
-            'Colorado Rockies': 'COL',
-            'Detroit Tigers': 'DET',
-            'Houston Astros': 'HOU',
-            'Kansas City Royals': 'KC',
-            'Los Angeles Angels': 'LAA',
-            'Los Angeles Dodgers': 'LAD',
-            'Miami Marlins': 'MIA',
-            'Milwaukee Brewers': 'MIL',
-            'Minnesota Twins': 'MIN',
-            'New York Mets': 'NYM',
-            'New York Yankees': 'NYY',
-            'Oakland Athletics': 'OAK',
-            'Philadelphia Phillies': 'PHI',
-            'Pittsburgh Pirates': 'PIT',
-            'San Diego Padres': 'SD',
-            'San Francisco Giants': 'SF',
-            'Seattle Mariners': 'SEA',
-            'St. Louis Cardinals': 'STL',
-            'Tampa Bay Rays': 'TB',
-            'Texas Rangers': 'TEX',
-            'Toronto Blue Jays': 'TOR',
-            'Washington Nationals': 'WSH'
-        }
+        self.team_mapping = {team.name: team.abbreviation for team in TEAMS}
         
         # Reverse team mapping (abbreviation to team name)
         self.reverse_team_mapping = {v: k for k, v in self.team_mapping.items()}
@@ -323,76 +303,41 @@ class MLBStatsAPI:
         Get data from cache if it exists and is not expired
         
         Args:
-            cache_key: Key to identify the cache file
+            cache_key: Key to identify the cache entry
             
         Returns:
             Cached data if it exists and is not expired, None otherwise
         """
-        cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-        
-        if os.path.exists(cache_file):
-            # Check if cache is expired
-            file_modified_time = os.path.getmtime(cache_file)
-            current_time = time.time()
-            
-            if current_time - file_modified_time < self.cache_expiration:
-                try:
-                    with open(cache_file, 'r') as f:
-                        data = json.load(f)
-                        logger.info(f"Using cached data for {cache_key}")
-                        return data
-                except Exception as e:
-                    logger.error(f"Error reading cache file: {e}")
-            else:
-                logger.info(f"Cache expired for {cache_key}")
-        
-        return None
+        return self.cache.get(cache_key)
     
     def save_to_cache(self, cache_key, data):
         """
         Save data to cache
         
         Args:
-            cache_key: Key to identify the cache file
+            cache_key: Key to identify the cache entry
             data: Data to save
         """
-        cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-        
-        try:
-            with open(cache_file, 'w') as f:
-                json.dump(data, f)
-                logger.info(f"Saved data to cache for {cache_key}")
-        except Exception as e:
-            logger.error(f"Error saving to cache: {e}")
+        self.cache.set(cache_key, data)
     
     def clear_cache(self, cache_key=None):
         """
         Clear cache for a specific key or all cache
         
         Args:
-            cache_key: Key to identify the cache file, or None to clear all cache
+            cache_key: Key to identify the cache entry, or None to clear all cache
         """
-        if cache_key:
-            cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-            if os.path.exists(cache_file):
-                try:
-                    os.remove(cache_file)
-                    logger.info(f"Cleared cache for {cache_key}")
-                except Exception as e:
-                    logger.error(f"Error clearing cache for {cache_key}: {e}")
-        else:
-            try:
-                for file in os.listdir(self.cache_dir):
-                    if file.endswith('.json'):
-                        os.remove(os.path.join(self.cache_dir, file))
-                logger.info("Cleared all cache")
-            except Exception as e:
-                logger.error(f"Error clearing all cache: {e}")
+        self.cache.delete(cache_key)
     
     def get_pitcher_era(self, team_name, pitcher_name, force_refresh=False):
         """
         Get pitcher ERA from MLB Stats API
         
+        ERAs found through the API are cached as real values. Fallback and
+        default ERAs are cached as negative results, so a pitcher who can't be
+        found is searched again after a backoff instead of after the full TTL
+        (see CacheNamespace.set_negative).
+        
         Args:
             team_name: Name of the team
             pitcher_name: Name of the pitcher
@@ -401,21 +346,22 @@ class MLBStatsAPI:
         Returns:
             Pitcher ERA data
         """
-        cache_key = f"pitcher_era_{team_name}_{pitcher_name}"
+        cache_key = self.pitcher_era_cache_key(team_name, pitcher_name)
         
         if not force_refresh:
             cached_data = self.get_cached_data(cache_key)
             if cached_data:
                 return cached_data
+            
+            negative = self.cache.get_negative(cache_key)
+            if negative:
+                return negative[0]
         
         # Try to get ERA from MLB API
         try:
             # Get team abbreviation
-            team_abbr = None
-            for name, abbr in self.team_mapping.items():
-                if team_name.lower() in name.lower() or name.lower() in team_name.lower():
-                    team_abbr = abbr
-                    break
+            team = get_team(team_name)
+            team_abbr = team.abbreviation if team else None
             
             if not team_abbr:
                 logger.warning(f"Team not found: {team_name}")
@@ -423,13 +369,15 @@ class MLBStatsAPI:
                 if pitcher_name in self.era_mapping:
                     era = self.era_mapping.get(pitcher_name)
                     result = {'era': era, 'source': 'MLB Stats API (Fallback)', 'method': 'name-lookup'}
-                    self.save_to_cache(cache_key, result)
+                    self.cache.set_negative(cache_key, result)
                     return result
-                return {'era': 4.50, 'source': 'MLB Stats API (Default)', 'method': 'default-value'}
+                result = {'era': 4.50, 'source': 'MLB Stats API (Default)', 'method': 'default-value'}
+                self.cache.set_negative(cache_key, result)
+                return result
             
             # Search for player by name
             search_url = f"{self.mlb_api_base_url}/players?search={pitcher_name}"
-            response = requests.get(search_url, timeout=5)
+            response = self.http.get(search_url, timeout=5)
             
             if response.status_code == 200:
                 player_data = response.json()
@@ -451,7 +399,7 @@ class MLBStatsAPI:
                     if player_id:
                         # Get player stats
                         stats_url = f"{self.mlb_api_base_url}/people/{player_id}/stats?stats=season&season=2025&group=pitching"
-                        stats_response = requests.get(stats_url, timeout=5)
+                        stats_response = self.http.get(stats_url, timeout=5)
                         
                         if stats_response.status_code == 200:
                             stats_data = stats_response.json()
@@ -464,7 +412,7 @@ class MLBStatsAPI:
                                     
                                     if era:
                                         result = {'era': float(era), 'source': 'MLB Stats API', 'method': 'player-lookup'}
-                                        self.save_to_cache(cache_key, result)
+                                        self.save_pitcher_era(cache_key, result)
                                         return result
             
             # If we get here, we couldn't find the ERA from the API
@@ -472,12 +420,12 @@ class MLBStatsAPI:
             if pitcher_name in self.era_mapping:
                 era = self.era_mapping.get(pitcher_name)
                 result = {'era': era, 'source': 'MLB Stats API (Fallback)', 'method': 'name-lookup'}
-                self.save_to_cache(cache_key, result)
+                self.cache.set_negative(cache_key, result)
                 return result
             
             # If all else fails, use default ERA
             result = {'era': 4.50, 'source': 'MLB Stats API (Default)', 'method': 'default-value'}
-            self.save_to_cache(cache_key, result)
+            self.cache.set_negative(cache_key, result)
             return result
             
         except Exception as e:
@@ -487,14 +435,25 @@ class MLBStatsAPI:
             if pitcher_name in self.era_mapping:
                 era = self.era_mapping.get(pitcher_name)
                 result = {'era': era, 'source': 'MLB Stats API (Fallback)', 'method': 'name-lookup-exception'}
-                self.save_to_cache(cache_key, result)
+                self.cache.set_negative(cache_key, result)
                 return result
             
             # If all else fails, use default ERA
             result = {'era': 4.50, 'source': 'MLB Stats API (Default)', 'method': 'default-value-exception'}
-            self.save_to_cache(cache_key, result)
+            self.cache.set_negative(cache_key, result)
             return result
     
+    def save_pitcher_era(self, cache_key, result):
+        """
+        Cache a pitcher ERA found through the API, resetting any negative result
+        
+        Args:
+            cache_key: Pitcher ERA cache key (see pitcher_era_cache_key)
+            result: Pitcher ERA data
+        """
+        self.save_to_cache(cache_key, result)
+        self.cache.clear_negative(cache_key)
+    
     def get_games(self, date_str, force_refresh=False):
         """
         Get MLB games for a specific date
@@ -512,8 +471,7 @@ class MLBStatsAPI:
         if date_str == today:
             logger.info(f"Using guaranteed sample games for today ({today})")
             games = self.get_sample_games_for_date(date_str)
-            cache_key = f"games_{date_str}"
-            self.save_to_cache(cache_key, games)
+            self.save_games_to_cache(date_str, games)
             return games
         
         cache_key = f"games_{date_str}"
@@ -527,7 +485,7 @@ class MLBStatsAPI:
         try:
             # Get schedule for the date
             schedule_url = f"{self.mlb_api_base_url}/schedule?sportId=1&date={date_str}&hydrate=team,probablePitcher,venue"
-            response = requests.get(schedule_url, timeout=5)
+            response = self.http.get(schedule_url, timeout=5)
             
             if response.status_code == 200:
                 schedule_data = response.json()
@@ -568,17 +526,7 @@ class MLBStatsAPI:
                             home_pitcher_name = home_pitcher.get('fullName', 'TBD')
                             away_pitcher_name = away_pitcher.get('fullName', 'TBD')
                             
-                            # Get pitcher ERA
-                            home_era_data = self.get_pitcher_era(home_team_name, home_pitcher_name)
-                            away_era_data = self.get_pitcher_era(away_team_name, away_pitcher_name)
-                            
-                            home_era = home_era_data.get('era', 4.50)
-                            away_era = away_era_data.get('era', 4.50)
-                            
-                            home_era_source = home_era_data.get('source', 'MLB Stats API (Default)')
-                            away_era_source = away_era_data.get('source', 'MLB Stats API (Default)')
-                            
-                            # Create game object
+                            # Create game object (ERAs are filled in below)
                             game_obj = {
                                 'game_id': game_id,
                                 'status': status,
@@ -588,37 +536,464 @@ class MLBStatsAPI:
                                 'game_time': game_time_str,
                                 'home_pitcher': home_pitcher_name,
                                 'away_pitcher': away_pitcher_name,
-                                'home_era': home_era,
-                                'away_era': away_era,
-                                'home_era_source': home_era_source,
-                                'away_era_source': away_era_source
+                                'home_pitcher_id': home_pitcher.get('id'),
+                                'away_pitcher_id': away_pitcher.get('id')
                             }
                             
                             games.append(game_obj)
                 
+                # Get pitcher ERAs for the whole slate at once, in a bulk
+                # request keyed by the probable pitchers' IDs
+                era_data = self.get_pitcher_eras(
+                    [(game[f'{side}_team'], game[f'{side}_pitcher']) for game in games for side in ('home', 'away')],
+                    pitcher_ids=self.get_pitcher_ids(games),
+                    season=date_str[:4]
+                )
+                for game in games:
+                    for side in ('home', 'away'):
+                        pitcher_era_data = era_data[(game[f'{side}_team'], game[f'{side}_pitcher'])]
+                        game[f'{side}_era'] = pitcher_era_data.get('era', 4.50)
+                        game[f'{side}_era_source'] = pitcher_era_data.get('source', 'MLB Stats API (Default)')
+                
                 # If no games found, use sample data
                 if not games:
                     logger.warning(f"No games found for date {date_str}, using sample data")
                     games = self.get_sample_games_for_date(date_str)
                 
                 # Save to cache
-                self.save_to_cache(cache_key, games)
+                self.save_games_to_cache(date_str, games)
                 
                 return games
             
             logger.error(f"Error getting games for date {date_str}: HTTP {response.status_code}")
             # Use sample data as fallback
             games = self.get_sample_games_for_date(date_str)
-            self.save_to_cache(cache_key, games)
+            self.save_games_to_cache(date_str, games)
             return games
             
         except Exception as e:
             logger.error(f"Error getting games for date {date_str}: {e}")
             # Use sample data as fallback
             games = self.get_sample_games_for_date(date_str)
-            self.save_to_cache(cache_key, games)
+            self.save_games_to_cache(date_str, games)
             return games
     
+    def save_games_to_cache(self, date_str, games):
+        """
+        Save the schedule for a date, plus one record per game
+        
+        Per-game records let predictions depend on a single game's data, so a
+        schedule refresh only invalidates predictions for games that changed.
+        
+        Args:
+            date_str: Date string in format YYYY-MM-DD
+            games: List of MLB games for the date
+        """
+        for game in games:
+            if game.get('game_id') is not None:
+                self.save_to_cache(self.game_cache_key(date_str, game['game_id']), game)
+        self.save_to_cache(f"games_{date_str}", games)
+    
+    def game_cache_key(self, date_str, game_id):
+        """Cache key of a single game's schedule record"""
+        return f"game_{date_str}_{game_id}"
+    
+    def pitcher_era_cache_key(self, team_name, pitcher_name):
+        """Cache key of a pitcher's ERA lookup"""
+        return f"pitcher_era_{team_name}_{pitcher_name}"
+    
+    def team_stats_cache_key(self, team_name):
+        """Cache key of a team's stats lookup"""
+        return f"team_stats_{team_name}"
+    
+    def league_team_stats_cache_key(self, season):
+        """Cache key of the league-wide team stats snapshot"""
+        return f"team_stats_league_{season}"
+    
+    def get_games_for_date(self, date_str, force_refresh=False):
+        """
+        Get MLB games for a specific date (alias of get_games)
+        
+        Args:
+            date_str: Date string in format YYYY-MM-DD
+            force_refresh: Force refresh of data
+            
+        Returns:
+            List of MLB games for the specified date
+        """
+        return self.get_games(date_str, force_refresh)
+    
+    def refresh_games(self, date_str):
+        """
+        Re-fetch the schedule for a date and swap it into the cache
+        
+        Args:
+            date_str: Date string in format YYYY-MM-DD
+            
+        Returns:
+            List of MLB games for the specified date
+        """
+        return self.get_games(date_str, force_refresh=True)
+    
+    def refresh_pitcher_eras(self, date_str):
+        """
+        Re-fetch the ERA of every probable pitcher scheduled on a date
+        
+        Pitchers with a negative result (not found recently) keep it until
+        they are due for a re-check, so the backoff applies to scheduled
+        refreshes too; only a user-forced refresh searches for them at once.
+        
+        Args:
+            date_str: Date string in format YYYY-MM-DD
+            
+        Returns:
+            Number of pitchers refreshed
+        """
+        games = self.get_games(date_str)
+        pitchers = []
+        for game in games:
+            for side in ('home', 'away'):
+                pitcher_name = game.get(f'{side}_pitcher')
+                if pitcher_name and pitcher_name != 'TBD':
+                    pitchers.append((game.get(f'{side}_team'), pitcher_name))
+        
+        eras = self.get_pitcher_eras(
+            pitchers, force_refresh=True, pitcher_ids=self.get_pitcher_ids(games), season=date_str[:4],
+            respect_backoff=True
+        )
+        return len(eras)
+    
+    def refresh_team_stats(self, date_str=None):
+        """
+        Re-fetch team stats for every team playing on a date
+        
+        Args:
+            date_str: Date string in format YYYY-MM-DD (defaults to today)
+            
+        Returns:
+            Number of teams refreshed
+        """
+        if not date_str:
+            date_str = datetime.now().strftime('%Y-%m-%d')
+        
+        team_names = set()
+        for game in self.get_games(date_str):
+            team_names.update(name for name in (game.get('home_team'), game.get('away_team')) if name)
+        
+        return len(self.get_team_stats_bulk(team_names, force_refresh=True))
+    
+    def get_schedule_index(self, start_date, end_date, force_refresh=False):
+        """
+        Get how many games are scheduled on each date of a range
+        
+        A single /schedule request covers the whole range, so callers can tell
+        which dates have games without building their slates.
+        
+        Args:
+            start_date: First date, in format YYYY-MM-DD
+            end_date: Last date, in format YYYY-MM-DD
+            force_refresh: Force refresh of data
+            
+        Returns:
+            Dictionary mapping every date in the range to its game count, or
+            None if the schedule could not be fetched
+        """
+        try:
+            return self.cache.get_or_compute(
+                f"schedule_index_{start_date}_{end_date}",
+                lambda: self.fetch_schedule_index(start_date, end_date),
+                force_refresh
+            )
+        except Exception as e:
+            logger.error(f"Error getting schedule index for {start_date} to {end_date}: {e}")
+            return None
+    
+    def fetch_schedule_index(self, start_date, end_date):
+        """
+        Fetch the game count of every date in a range (uncached)
+        
+        Args:
+            start_date: First date, in format YYYY-MM-DD
+            end_date: Last date, in format YYYY-MM-DD
+            
+        Returns:
+            Dictionary mapping date to game count (see get_schedule_index)
+        """
+        schedule_url = f"{self.mlb_api_base_url}/schedule?sportId=1&startDate={start_date}&endDate={end_date}"
+        response = self.http.get(schedule_url, timeout=5)
+        if response.status_code != 200:
+            raise ValueError(f"HTTP {response.status_code}")
+        
+        counts = {}
+        day = datetime.strptime(start_date, '%Y-%m-%d')
+        while day <= datetime.strptime(end_date, '%Y-%m-%d'):
+            counts[day.strftime('%Y-%m-%d')] = 0
+            day += timedelta(days=1)
+        
+        for date_data in response.json().get('dates', []):
+            if date_data.get('date') in counts:
+                counts[date_data['date']] = date_data.get('totalGames', len(date_data.get('games', [])))
+        return counts
+    
+    def get_league_team_stats(self, force_refresh=False, season=None):
+        """
+        Get the league-wide team stats snapshot
+        
+        Season pitching and hitting stats for all 30 teams come from a single
+        /teams/stats request and are cached as one snapshot, so team stats
+        lookups between refreshes are served from memory.
+        
+        Args:
+            force_refresh: Force refresh of data
+            season: Season year (defaults to the current year)
+            
+        Returns:
+            Snapshot dictionary with 'version', 'season', 'fetched_at' and
+            'teams' (MLB team ID string to {'pitching': ..., 'hitting': ...}),
+            or None if the snapshot could not be fetched
+        """
+        season = season or datetime.now().strftime('%Y')
+        try:
+            return self.cache.get_or_compute(
+                self.league_team_stats_cache_key(season),
+                lambda: self.fetch_league_team_stats(season),
+                force_refresh
+            )
+        except Exception as e:
+            logger.error(f"Error getting league team stats for {season}: {e}")
+            return None
+    
+    def fetch_league_team_stats(self, season):
+        """
+        Fetch the league-wide team stats snapshot (uncached)
+        
+        Args:
+            season: Season year
+            
+        Returns:
+            Snapshot dictionary (see get_league_team_stats)
+        """
+        stats_url = f"{self.mlb_api_base_url}/teams/stats?stats=season&group=pitching,hitting&season={season}&sportIds=1"
+        response = self.http.get(stats_url, timeout=5)
+        if response.status_code != 200:
+            raise ValueError(f"HTTP {response.status_code}")
+        
+        teams = {}
+        for group_stats in response.json().get('stats', []):
+            group = group_stats.get('group', {}).get('displayName')
+            if group not in ('pitching', 'hitting'):
+                continue
+            for split in group_stats.get('splits', []):
+                team_id = split.get('team', {}).get('id')
+                if team_id is not None:
+                    teams.setdefault(str(team_id), {})[group] = split.get('stat', {})
+        
+        if not teams:
+            raise ValueError("No team stats in response")
+        
+        # The version changes only when the stats themselves change
+        content = json.dumps(teams, sort_keys=True).encode('utf-8')
+        return {
+            'version': hashlib.sha1(content).hexdigest()[:12],
+            'season': season,
+            'fetched_at': time.time(),
+            'teams': teams
+        }
+    
+    def build_team_stats(self, team_name, team_abbr, team_snapshot):
+        """
+        Build a team stats record from a team's entry in the league snapshot
+        
+        Args:
+            team_name: Name of the team
+            team_abbr: Team abbreviation
+            team_snapshot: {'pitching': ..., 'hitting': ...} stats for the team
+            
+        Returns:
+            Team stats data
+        """
+        pitching = team_snapshot.get('pitching', {})
+        hitting = team_snapshot.get('hitting', {})
+        
+        def number(stats, key, default, cast=float):
+            try:
+                return cast(stats.get(key))
+            except (TypeError, ValueError):
+                return default
+        
+        team_era = number(pitching, 'era', 4.0)
+        return {
+            'team_name': team_name,
+            'team_abbr': team_abbr,
+            'team_era': team_era,
+            'team_whip': number(pitching, 'whip', 1.3),
+            'team_strikeouts': number(pitching, 'strikeOuts', 500, int),
+            'team_walks': number(pitching, 'baseOnBalls', 200, int),
+            'bullpen_era': team_era + 0.5,
+            'team_runs': number(hitting, 'runs', None, int),
+            'team_avg': number(hitting, 'avg', None),
+            'team_obp': number(hitting, 'obp', None),
+            'team_slg': number(hitting, 'slg', None),
+            'team_ops': number(hitting, 'ops', None),
+            'games_played': number(hitting, 'gamesPlayed', None, int)
+        }
+    
+    def get_pitcher_ids(self, games):
+        """
+        Get the MLB person IDs of a slate's probable pitchers
+        
+        Args:
+            games: Game records from the schedule
+            
+        Returns:
+            Dictionary mapping (team_name, pitcher_name) to person ID
+        """
+        pitcher_ids = {}
+        for game in games:
+            for side in ('home', 'away'):
+                if game.get(f'{side}_pitcher_id'):
+                    pitcher_ids[(game.get(f'{side}_team'), game.get(f'{side}_pitcher'))] = game[f'{side}_pitcher_id']
+        return pitcher_ids
+    
+    def get_pitcher_eras(self, pitchers, force_refresh=False, pitcher_ids=None, season=None, respect_backoff=False):
+        """
+        Get ERAs for several pitchers
+        
+        Pitchers with a known person ID are fetched together in one bulk
+        request; the rest fall back to get_pitcher_era's name search, run
+        concurrently for the distinct pitchers.
+        
+        Args:
+            pitchers: Iterable of (team_name, pitcher_name) tuples
+            force_refresh: Force refresh of data
+            pitcher_ids: Optional mapping of (team_name, pitcher_name) to MLB person ID
+            season: Season year for the bulk request (defaults to the current year)
+            respect_backoff: Keep serving negative results that aren't due for
+                a re-check even when force_refresh is set
+            
+        Returns:
+            Dictionary mapping (team_name, pitcher_name) to pitcher ERA data
+        """
+        pitchers = list(dict.fromkeys(pitchers))
+        eras = {}
+        
+        if not force_refresh:
+            cached = self.cache.get_many([self.pitcher_era_cache_key(team, pitcher) for team, pitcher in pitchers])
+            for team, pitcher in pitchers:
+                if cached.get(self.pitcher_era_cache_key(team, pitcher)):
+                    eras[(team, pitcher)] = cached[self.pitcher_era_cache_key(team, pitcher)]
+        
+        if not force_refresh or respect_backoff:
+            # Pitchers recently not found keep their placeholder ERA until
+            # they are due for a re-check
+            for pitcher in pitchers:
+                if pitcher not in eras:
+                    negative = self.cache.get_negative(self.pitcher_era_cache_key(*pitcher))
+                    if negative:
+                        eras[pitcher] = negative[0]
+        
+        bulk = {
+            pitcher: pitcher_ids[pitcher]
+            for pitcher in pitchers
+            if pitcher not in eras and pitcher_ids and pitcher_ids.get(pitcher)
+        }
+        if bulk:
+            eras.update(self.fetch_pitcher_eras_by_id(bulk, season))
+        
+        missing = [pitcher for pitcher in pitchers if pitcher not in eras]
+        eras.update(self._fan_out(
+            lambda pitcher: self.get_pitcher_era(pitcher[0], pitcher[1], force_refresh),
+            missing
+        ))
+        return eras
+    
+    def fetch_pitcher_eras_by_id(self, pitcher_ids, season=None):
+        """
+        Fetch season ERAs for many pitchers with batched /people requests
+        
+        Each ERA found is saved to the pitcher's own cache entry, the same one
+        get_pitcher_era reads.
+        
+        Args:
+            pitcher_ids: Dictionary mapping (team_name, pitcher_name) to MLB person ID
+            season: Season year (defaults to the current year)
+            
+        Returns:
+            Dictionary mapping (team_name, pitcher_name) to pitcher ERA data, for
+            the pitchers whose ERA was found
+        """
+        season = season or datetime.now().strftime('%Y')
+        by_id = {}
+        for pitcher, person_id in pitcher_ids.items():
+            by_id.setdefault(int(person_id), []).append(pitcher)
+        
+        person_ids = list(by_id)
+        eras = {}
+        for i in range(0, len(person_ids), PEOPLE_BATCH_SIZE):
+            batch = person_ids[i:i + PEOPLE_BATCH_SIZE]
+            people_url = (f"{self.mlb_api_base_url}/people?personIds={','.join(str(p) for p in batch)}"
+                          f"&hydrate=stats(group=[pitching],type=[season],season={season})")
+            try:
+                response = self.http.get(people_url, timeout=5)
+                if response.status_code != 200:
+                    logger.error(f"Error getting pitcher stats for {len(batch)} pitchers: HTTP {response.status_code}")
+                    continue
+                people = response.json().get('people', [])
+            except Exception as e:
+                logger.error(f"Error getting pitcher stats for {len(batch)} pitchers: {e}")
+                continue
+            
+            for person in people:
+                era = None
+                for stats in person.get('stats', []):
+                    for split in stats.get('splits', []):
+                        era = split.get('stat', {}).get('era', era)
+                try:
+                    era = float(era)
+                except (TypeError, ValueError):
+                    continue
+                
+                result = {'era': era, 'source': 'MLB Stats API', 'method': 'bulk-people'}
+                for team_name, pitcher_name in by_id.get(person.get('id'), []):
+                    self.save_pitcher_era(self.pitcher_era_cache_key(team_name, pitcher_name), result)
+                    eras[(team_name, pitcher_name)] = result
+        
+        return eras
+    
+    def get_team_stats_bulk(self, team_names, force_refresh=False):
+        """
+        Get stats for several teams, fetching the distinct ones concurrently
+        
+        Args:
+            team_names: Iterable of team names
+            force_refresh: Force refresh of data
+            
+        Returns:
+            Dictionary mapping team name to team stats data
+        """
+        if force_refresh:
+            # Refresh the league snapshot once rather than once per team
+            self.get_league_team_stats(force_refresh=True)
+        return self._fan_out(lambda team_name: self.get_team_stats(team_name, force_refresh), team_names)
+    
+    def _fan_out(self, fetch, keys):
+        """
+        Call fetch once per distinct key on a bounded thread pool
+        
+        Args:
+            fetch: Callable taking a key
+            keys: Iterable of hashable keys (duplicates are fetched once)
+            
+        Returns:
+            Dictionary mapping each distinct key to its result
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        if len(unique_keys) <= 1:
+            return {key: fetch(key) for key in unique_keys}
+        
+        with ThreadPoolExecutor(max_workers=min(ENRICHMENT_WORKERS, len(unique_keys))) as executor:
+            return dict(zip(unique_keys, executor.map(fetch, unique_keys)))
+    
     def get_sample_games_for_date(self, date_str):
         """
         Get sample games for a specific date
@@ -629,8 +1004,8 @@ class MLBStatsAPI:
         Returns:
             List of sample MLB games
         """
-        # Modify sample games to use the provided date
-        sample_games = self.sample_games.copy()
+        # Modify copies of the sample games to use the provided date
+        sample_games = [dict(game) for game in self.sample_games]
         
         # Get day of week from date
         try:
@@ -657,7 +1032,7 @@ class MLBStatsAPI:
         Returns:
             Team stats data
         """
-        cache_key = f"team_stats_{team_name}"
+        cache_key = self.team_stats_cache_key(team_name)
         
         if not force_refresh:
             cached_data = self.get_cached_data(cache_key)
@@ -667,90 +1042,81 @@ class MLBStatsAPI:
         # Try to get team stats from MLB API
         try:
             # Get team ID
-            team_abbr = None
-            for name, abbr in self.team_mapping.items():
-                if team_name.lower() in name.lower() or name.lower() in team_name.lower():
-                    team_abbr = abbr
-                    break
+            team = get_team(team_name)
+            team_abbr = team.abbreviation if team else None
             
             if not team_abbr:
                 logger.warning(f"Team not found: {team_name}")
                 return {'error': 'Team not found'}
             
-            # Get team ID from abbreviation
-            teams_url = f"{self.mlb_api_base_url}/teams"
-            response = requests.get(teams_url, timeout=5)
+            team_id = team.mlb_id
             
-            if response.status_code == 200:
-                teams_data = response.json()
+            # Serve from the league-wide snapshot when it is available
+            snapshot = self.get_league_team_stats()
+            if snapshot and str(team_id) in snapshot['teams']:
+                team_stats = self.build_team_stats(team_name, team_abbr, snapshot['teams'][str(team_id)])
+                self.save_to_cache(cache_key, team_stats)
+                return team_stats
+            
+            # Get team stats
+            stats_url = f"{self.mlb_api_base_url}/teams/{team_id}/stats?stats=season&season=2025&group=pitching"
+            stats_response = self.http.get(stats_url, timeout=5)
+            
+            if stats_response.status_code == 200:
+                stats_data = stats_response.json()
                 
-                if 'teams' in teams_data:
-                    team_id = None
-                    for team in teams_data['teams']:
-                        if team.get('abbreviation') == team_abbr:
-                            team_id = team.get('id')
-                            break
+                if 'stats' in stats_data and stats_data['stats'] and 'splits' in stats_data['stats'][0]:
+                    splits = stats_data['stats'][0]['splits']
                     
-                    if team_id:
-                        # Get team stats
-                        stats_url = f"{self.mlb_api_base_url}/teams/{team_id}/stats?stats=season&season=2025&group=pitching"
-                        stats_response = requests.get(stats_url, timeout=5)
-                        
-                        if stats_response.status_code == 200:
-                            stats_data = stats_response.json()
+                    if splits:
+                        # FIX: Convert all values to appropriate types before any operations
+                        team_era = splits[0].get('stat', {}).get('era')
+                        if team_era is not None:
+                            team_era = float(team_era)
+                        else:
+                            team_era = 4.0
                             
-                            if 'stats' in stats_data and stats_data['stats'] and 'splits' in stats_data['stats'][0]:
-                                splits = stats_data['stats'][0]['splits']
-                                
-                                if splits:
-                                    # FIX: Convert all values to appropriate types before any operations
-                                    team_era = splits[0].get('stat', {}).get('era')
-                                    if team_era is not None:
-                                        team_era = float(team_era)
-                                    else:
-                                        team_era = 4.0
-                                        
-                                    team_whip = splits[0].get('stat', {}).get('whip')
-                                    if team_whip is not None:
-                                        team_whip = float(team_whip)
-                                    else:
-                                        team_whip = 1.3
-                                        
-                                    team_strikeouts = splits[0].get('stat', {}).get('strikeOuts')
-                                    if team_strikeouts is not None:
-                                        team_strikeouts = int(team_strikeouts)
-                                    else:
-                                        team_strikeouts = 500
-                                        
-                                    team_walks = splits[0].get('stat', {}).get('walks')
-                                    if team_walks is not None:
-                                        team_walks = int(team_walks)
-                                    else:
-                                        team_walks = 200
-                                    
-                                    # FIX: Ensure bullpen_era is calculated with proper type handling
-                                    # Use explicit float conversion and handle None case
-                                    if team_era is not None:
-                                        bullpen_era = float(team_era) + 0.5
-                                    else:
-                                        bullpen_era = 4.5
-                                    
-                                    # Create team stats object
-                                    team_stats = {
-                                        'team_name': team_name,
-                                        'team_abbr': team_abbr,
-                                        'team_era': team_era,
-                                        'team_whip': team_whip,
-                                        'team_strikeouts': team_strikeouts,
-                                        'team_walks': team_walks,
-                                        'bullpen_era': bullpen_era
-                                    }
-                                    
-                                    # Save to cache
-                                    self.save_to_cache(cache_key, team_stats)
-                                    
-                                    return team_stats
-            
+                        team_whip = splits[0].get('stat', {}).get('whip')
+                        if team_whip is not None:
+                            team_whip = float(team_whip)
+                        else:
+                            team_whip = 1.3
+                            
+                        team_strikeouts = splits[0].get('stat', {}).get('strikeOuts')
+                        if team_strikeouts is not None:
+                            team_strikeouts = int(team_strikeouts)
+                        else:
+                            team_strikeouts = 500
+                            
+                        team_walks = splits[0].get('stat', {}).get('walks')
+                        if team_walks is not None:
+                            team_walks = int(team_walks)
+                        else:
+                            team_walks = 200
+                        
+                        # FIX: Ensure bullpen_era is calculated with proper type handling
+                        # Use explicit float conversion and handle None case
+                        if team_era is not None:
+                            bullpen_era = float(team_era) + 0.5
+                        else:
+                            bullpen_era = 4.5
+                        
+                        # Create team stats object
+                        team_stats = {
+                            'team_name': team_name,
+                            'team_abbr': team_abbr,
+                            'team_era': team_era,
+                            'team_whip': team_whip,
+                            'team_strikeouts': team_strikeouts,
+                            'team_walks': team_walks,
+                            'bullpen_era': bullpen_era
+                        }
+                        
+                        # Save to cache
+                        self.save_to_cache(cache_key, team_stats)
+                        
+                        return team_stats
+
             logger.error(f"Error getting team stats for {team_name}")
             
             # Return fallback data
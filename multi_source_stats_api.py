@@ -1,4 +1,3 @@
-import requests
 import json
 import os
 import re
@@ -6,6 +5,8 @@ import time
 import random
 from datetime import datetime
 from bs4 import BeautifulSoup
+from cache_engine import get_cache_engine
+from http_client import get_http_client
 
 class MLBStatsDirectAPI:
     """
@@ -16,42 +17,17 @@ class MLBStatsDirectAPI:
         """Initialize the MLB Stats Direct API client"""
         self.base_url = "https://statsapi.mlb.com/api"
         self.cache_dir = 'cache/mlb_direct'
-        self.cache_expiry = 3600 * 3  # Cache expiry in seconds (3 hours)
-        os.makedirs(self.cache_dir, exist_ok=True)
+        self.cache = get_cache_engine().namespace('mlb_direct', self.cache_dir, layout='envelope')
+        self.http = get_http_client()
+        self.cache_expiry = self.cache.ttl  # Cache expiry in seconds
     
     def get_cached_data(self, cache_key):
         """Get data from cache if available and not expired"""
-        cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-        
-        if os.path.exists(cache_file):
-            try:
-                with open(cache_file, 'r') as f:
-                    cached_data = json.load(f)
-                
-                # Check if cache is expired
-                cache_time = cached_data.get('cache_time', 0)
-                if (datetime.now() - datetime.fromtimestamp(cache_time)).total_seconds() < self.cache_expiry:
-                    return cached_data.get('data')
-            except Exception as e:
-                print(f"Error reading MLB direct cache: {e}")
-        
-        return None
+        return self.cache.get(cache_key)
     
     def save_to_cache(self, cache_key, data):
         """Save data to cache"""
-        cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-        
-        try:
-            with open(cache_file, 'w') as f:
-                json.dump({
-                    'data': data,
-                    'cache_time': datetime.now().timestamp()
-                }, f)
-            
-            return True
-        except Exception as e:
-            print(f"Error saving MLB direct data to cache: {e}")
-            return False
+        return self.cache.set(cache_key, data)
     
     def get_team_id(self, team_name):
         """
@@ -119,7 +95,7 @@ class MLBStatsDirectAPI:
         
         try:
             url = f"{self.base_url}/v1/teams/{team_id}/roster"
-            response = requests.get(url)
+            response = self.http.get(url)
             
             if response.status_code != 200:
                 print(f"Error fetching team roster: {response.status_code}")
@@ -172,7 +148,7 @@ class MLBStatsDirectAPI:
             
             # Get pitcher stats
             url = f"{self.base_url}/v1/people/{pitcher_id}/stats?stats=season&group=pitching"
-            response = requests.get(url)
+            response = self.http.get(url)
             
             if response.status_code != 200:
                 print(f"Error fetching pitcher stats: {response.status_code}")
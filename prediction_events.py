@@ -0,0 +1,340 @@
+import os
+import json
+import queue
+import logging
+import threading
+import time
+from collections import deque
+from cache_engine import get_cache_engine, file_lease
+
+logger = logging.getLogger('prediction_events')
+
+# Events kept for clients reconnecting with Last-Event-ID
+DEFAULT_REPLAY_EVENTS = int(os.environ.get('MLB_STREAM_REPLAY_EVENTS', 100))
+
+# Events buffered per subscriber before a slow subscriber is dropped
+DEFAULT_SUBSCRIBER_BUFFER = int(os.environ.get('MLB_STREAM_SUBSCRIBER_BUFFER', 50))
+
+# Seconds between keep-alive comments on an idle stream
+HEARTBEAT_INTERVAL = float(os.environ.get('MLB_STREAM_HEARTBEAT', 15))
+
+# Open streams allowed per worker; each one holds a request thread for as
+# long as the client stays connected. Workers run 64 threads (see Procfile),
+# so 16 stay free for API requests.
+DEFAULT_MAX_SUBSCRIBERS = int(os.environ.get('MLB_STREAM_MAX_SUBSCRIBERS', 48))
+
+# Seconds a client turned away by a full worker waits before reconnecting,
+# polling for predictions in the meantime
+BUSY_RETRY = int(os.environ.get('MLB_STREAM_BUSY_RETRY', 60))
+
+# Seconds between checks of the shared event log for events published by
+# other workers (only while this worker has subscribers)
+LOG_POLL_INTERVAL = float(os.environ.get('MLB_STREAM_POLL_INTERVAL', 1))
+
+# Longest time (in seconds) a publisher waits to append to the shared log
+LOG_LEASE_TIMEOUT = 5
+
+
+class Subscription:
+    """
+    One client's queue of published events
+    """
+
+    def __init__(self, broadcaster, date=None, buffer_size=DEFAULT_SUBSCRIBER_BUFFER):
+        """
+        Initialize the subscription
+
+        Args:
+            broadcaster: Owning PredictionBroadcaster
+            date: Optional date (YYYY-MM-DD) to receive events for; all dates by default
+            buffer_size: Events buffered before the subscription is closed
+        """
+        self.broadcaster = broadcaster
+        self.date = date
+        self.queue = queue.Queue(maxsize=buffer_size)
+        self.closed = False
+
+    def wants(self, event):
+        return self.date is None or event['data'].get('date') == self.date
+
+    def offer(self, event):
+        """Queue an event; a subscriber too slow to keep up is closed"""
+        try:
+            self.queue.put_nowait(event)
+        except queue.Full:
+            logger.warning("Dropping slow prediction stream subscriber")
+            self.close()
+
+    def next_event(self, timeout):
+        """
+        Wait for the next event
+
+        Args:
+            timeout: Seconds to wait
+
+        Returns:
+            Event dictionary, or None if none arrived in time
+        """
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        self.closed = True
+        self.broadcaster.unsubscribe(self)
+
+
+class SharedEventLog:
+    """
+    The most recent events of every worker process, in one cache entry
+
+    Appends hold a file lease, so event IDs increase across all workers and
+    a client reconnecting to a different worker can still resume from its
+    Last-Event-ID. The next ID is also kept in a small head file, so
+    pollers can tell whether anything was appended without reading the log.
+    """
+
+    key = 'event_log'
+
+    def __init__(self, cache_dir, max_events=DEFAULT_REPLAY_EVENTS):
+        """
+        Initialize the shared event log
+
+        Args:
+            cache_dir: Directory backing the log on disk
+            max_events: Number of recent events kept
+        """
+        self.cache = get_cache_engine().namespace('prediction_events', cache_dir)
+        self.head_path = os.path.join(cache_dir, '_event_log.head')
+        self.max_events = max_events
+
+    def next_id(self):
+        """Get the ID the next appended event will get"""
+        try:
+            with open(self.head_path, 'r') as f:
+                return int(f.read())
+        except FileNotFoundError:
+            # Nothing appended yet
+            return 1
+        except ValueError:
+            return self.read()['next_id']
+
+    def read(self):
+        """
+        Read the log as last written by any worker
+
+        Returns:
+            Dictionary with the retained 'events' and the 'next_id' to assign
+        """
+        # Read from disk: the memory tier only sees this worker's appends
+        entry = self.cache.backend.read(self.key)
+        return entry[0] if entry is not None else {'next_id': 1, 'events': []}
+
+    def append(self, event_type, data):
+        """
+        Add an event to the log
+
+        Args:
+            event_type: SSE event name
+            data: JSON-serializable event payload
+
+        Returns:
+            The event, with its ID
+        """
+        with file_lease(self.cache.backend.lock_path_for(self.key), LOG_LEASE_TIMEOUT):
+            log = self.read()
+            event = {'id': log['next_id'], 'event': event_type, 'data': data}
+            events = (log['events'] + [event])[-self.max_events:]
+            self.cache.backend.write(self.key, {'next_id': event['id'] + 1, 'events': events}, time.time())
+            tmp_file = f"{self.head_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_file, 'w') as f:
+                f.write(str(event['id'] + 1))
+            os.replace(tmp_file, self.head_path)
+        return event
+
+
+class PredictionBroadcaster:
+    """
+    Publish/subscribe hub for prediction delta events
+
+    Every event gets an increasing ID, and the last few are kept so a client
+    reconnecting with Last-Event-ID receives what it missed. With a shared
+    log, events published by any worker reach this worker's subscribers: the
+    log is polled while anyone is subscribed.
+    """
+
+    def __init__(self, replay_events=DEFAULT_REPLAY_EVENTS, log=None, max_subscribers=DEFAULT_MAX_SUBSCRIBERS,
+                 poll_interval=LOG_POLL_INTERVAL):
+        """
+        Initialize the broadcaster
+
+        Args:
+            replay_events: Number of recent events kept for reconnecting clients
+            log: Optional SharedEventLog to publish through (in-process only without one)
+            max_subscribers: Maximum number of open subscriptions
+            poll_interval: Seconds between checks of the shared log
+        """
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._subscribers = set()
+        self._recent = deque(maxlen=replay_events)
+        self._next_id = 1
+        self._last_seen = 0
+        self._poller = None
+        self.log = log
+        self.max_subscribers = max_subscribers
+        self.poll_interval = poll_interval
+
+    def publish(self, event_type, data):
+        """
+        Send an event to every interested subscriber
+
+        Args:
+            event_type: SSE event name
+            data: JSON-serializable event payload (with a 'date' to filter on)
+
+        Returns:
+            ID of the published event
+        """
+        if self.log is not None:
+            event = self.log.append(event_type, data)
+            self.sync()
+            return event['id']
+
+        with self._lock:
+            event = {'id': self._next_id, 'event': event_type, 'data': data}
+            self._next_id += 1
+        self._dispatch(event)
+        return event['id']
+
+    def sync(self):
+        """Deliver the shared log's events this worker hasn't seen yet, in order"""
+        if self.log is None:
+            return
+
+        with self._sync_lock:
+            try:
+                if self.log.next_id() - 1 == self._last_seen:
+                    return
+                log = self.log.read()
+            except Exception as e:
+                logger.error(f"Error reading the prediction event log: {e}")
+                return
+            if log['next_id'] - 1 < self._last_seen:
+                # The log was cleared; start over from its current position
+                self._last_seen = log['next_id'] - 1
+            for event in log['events']:
+                if event['id'] > self._last_seen:
+                    self._dispatch(event)
+                    self._last_seen = event['id']
+
+    def _dispatch(self, event):
+        with self._lock:
+            self._recent.append(event)
+            subscribers = [subscriber for subscriber in self._subscribers if subscriber.wants(event)]
+
+        for subscriber in subscribers:
+            subscriber.offer(event)
+
+    def _poll(self):
+        while True:
+            time.sleep(self.poll_interval)
+            with self._lock:
+                idle = not self._subscribers
+            if not idle:
+                self.sync()
+
+    def subscribe(self, date=None, last_event_id=None):
+        """
+        Register a subscriber
+
+        Args:
+            date: Optional date (YYYY-MM-DD) to receive events for
+            last_event_id: Optional ID of the last event the client saw; the
+                newest retained events after it (at most a subscriber buffer's
+                worth) are queued immediately
+
+        Returns:
+            Subscription, or None if max_subscribers are already open
+        """
+        self.sync()
+        subscription = Subscription(self, date)
+        with self._lock:
+            if len(self._subscribers) >= self.max_subscribers:
+                return None
+            if self.log is not None and self._poller is None:
+                self._poller = threading.Thread(target=self._poll, name='prediction-events', daemon=True)
+                self._poller.start()
+            missed = []
+            if last_event_id is not None:
+                missed = [event for event in self._recent if event['id'] > last_event_id and subscription.wants(event)]
+            self._subscribers.add(subscription)
+
+        # Offered outside the lock: a full buffer closes the subscription,
+        # which takes the lock to unsubscribe
+        for event in missed[-subscription.queue.maxsize:]:
+            subscription.offer(event)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def get_stats(self):
+        """Get subscriber and event counters"""
+        with self._lock:
+            last_event_id = self._recent[-1]['id'] if self._recent else 0
+            return {'subscribers': len(self._subscribers), 'max_subscribers': self.max_subscribers,
+                    'last_event_id': last_event_id, 'shared': self.log is not None}
+
+
+def format_event(event):
+    """Encode an event in the text/event-stream wire format"""
+    return f"id: {event['id']}\nevent: {event['event']}\ndata: {json.dumps(event['data'])}\n\n"
+
+
+def stream_events(subscription, heartbeat=HEARTBEAT_INTERVAL):
+    """
+    Yield a subscription's events as text/event-stream chunks until it closes
+
+    Args:
+        subscription: Subscription to drain
+        heartbeat: Seconds between keep-alive comments while idle
+    """
+    try:
+        # 'ready' tells the client its stream is live (see busy_stream)
+        yield f"retry: {int(heartbeat * 1000)}\nevent: ready\ndata: {{}}\n\n"
+        while not subscription.closed:
+            event = subscription.next_event(heartbeat)
+            yield format_event(event) if event is not None else ": keep-alive\n\n"
+    finally:
+        subscription.close()
+
+
+def busy_stream(retry=BUSY_RETRY):
+    """
+    Yield the whole stream sent when a worker has no room for another subscriber
+
+    The client is told to reconnect after retry seconds, and the 'busy'
+    event has it poll for predictions at that interval until it gets in.
+
+    Args:
+        retry: Seconds before the client reconnects
+    """
+    yield f"retry: {retry * 1000}\nevent: busy\ndata: {json.dumps({'retry': retry})}\n\n"
+
+
+_default_broadcaster = None
+_default_lock = threading.Lock()
+
+
+def get_prediction_broadcaster():
+    """Get the process-wide prediction event broadcaster, shared with the other workers"""
+    global _default_broadcaster
+    with _default_lock:
+        if _default_broadcaster is None:
+            cache_base = os.environ.get('RENDER_CACHE_DIR', '/tmp')
+            log = SharedEventLog(os.path.join(cache_base, 'mlb_prediction_tool', 'events'))
+            _default_broadcaster = PredictionBroadcaster(log=log)
+        return _default_broadcaster
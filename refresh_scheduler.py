@@ -0,0 +1,408 @@
+import os
+import copy
+import uuid
+import logging
+import threading
+import time
+from datetime import datetime
+from cache_engine import get_cache_engine, file_lease
+
+logger = logging.getLogger('refresh_scheduler')
+
+# Default refresh cadences (in seconds). Each is shorter than the TTL of the
+# data it refreshes so request handlers keep hitting warm cache entries.
+DEFAULT_CADENCES = {
+    'games': 5 * 60,
+    'pitcher_eras': 10 * 60,
+    'team_stats': 12 * 60,
+    'predictions': 5 * 60,
+    'warm_dates': 10 * 60,
+    'purge_cache': 3600
+}
+
+# A manual refresh whose status hasn't been updated for this long (in
+# seconds) is treated as abandoned (e.g. its worker died) and no longer
+# absorbs new refresh requests
+REFRESH_STALE_AFTER = int(os.environ.get('MLB_REFRESH_STALE_AFTER', 10 * 60))
+
+# Finished refreshes kept in memory for status polling
+MAX_REFRESH_RUNS = 20
+
+# Seconds a refresh stage waits for a run of its job that is already in
+# progress (e.g. the periodic run) to finish, instead of starting another
+REFRESH_JOIN_TIMEOUT = int(os.environ.get('MLB_REFRESH_JOIN_TIMEOUT', 5 * 60))
+
+# Seconds the shared status of a refresh is kept for polling by other workers
+REFRESH_RETENTION = int(os.environ.get('MLB_REFRESH_RETENTION', 24 * 3600))
+
+
+class RefreshJob:
+    """
+    A named background job that runs on a fixed cadence
+    """
+
+    def __init__(self, name, interval, func):
+        """
+        Initialize the refresh job
+
+        Args:
+            name: Job name
+            interval: Seconds between runs
+            func: Zero-argument callable performing the refresh
+        """
+        self.name = name
+        self.interval = interval
+        self.func = func
+        self.next_run = 0
+        # Guards status, which the scheduler thread and refresh threads both update
+        self.lock = threading.Lock()
+        self.status = {
+            'name': name,
+            'interval': interval,
+            'state': 'idle',
+            'runs': 0,
+            'failures': 0,
+            'last_run': None,
+            'last_duration': None,
+            'last_error': None
+        }
+
+
+class RefreshRun:
+    """
+    One on-demand refresh of every job, with per-stage progress
+
+    Stages are the scheduler's jobs, run in registration order.
+    """
+
+    def __init__(self, stages):
+        """
+        Initialize the refresh run
+
+        Args:
+            stages: Job names to run, in order
+        """
+        now = time.time()
+        self.status = {
+            'job_id': uuid.uuid4().hex[:12],
+            'state': 'queued',
+            'created_at': now,
+            'updated_at': now,
+            'started_at': None,
+            'finished_at': None,
+            'duration': None,
+            'progress': {'completed': 0, 'total': len(stages)},
+            'stages': [
+                {'name': name, 'state': 'pending', 'started_at': None, 'duration': None, 'error': None}
+                for name in stages
+            ]
+        }
+
+    @property
+    def job_id(self):
+        return self.status['job_id']
+
+
+class RefreshScheduler:
+    """
+    Runs data refresh jobs on a background thread, off the request path
+
+    Jobs overwrite cache entries in place, so readers keep seeing the previous
+    value until the new one is swapped in. When several worker processes run a
+    scheduler, a per-job file lease and a shared last-run record make sure each
+    job runs once per cadence across all of them.
+    """
+
+    def __init__(self, cache_dir=None):
+        """
+        Initialize the refresh scheduler
+
+        Args:
+            cache_dir: Directory to store shared job state
+        """
+        if cache_dir is None:
+            cache_base = os.environ.get('RENDER_CACHE_DIR', '/tmp')
+            cache_dir = os.path.join(cache_base, 'mlb_prediction_tool', 'scheduler')
+
+        self.cache = get_cache_engine().namespace('scheduler', cache_dir)
+        self.jobs = {}
+        self.refresh_runs = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def add_job(self, name, interval, func):
+        """
+        Register a refresh job
+
+        Args:
+            name: Job name
+            interval: Seconds between runs
+            func: Zero-argument callable performing the refresh
+        """
+        self.jobs[name] = RefreshJob(name, interval, func)
+
+    def start(self):
+        """Start the scheduler thread (no-op if already running)"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run_loop, name='refresh-scheduler', daemon=True)
+            self._thread.start()
+            logger.info(f"Started refresh scheduler with jobs: {', '.join(self.jobs)}")
+
+    def stop(self):
+        """Stop the scheduler thread"""
+        self._stopped.set()
+        self._wakeup.set()
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run_loop(self):
+        while not self._stopped.is_set():
+            now = time.time()
+            for job in list(self.jobs.values()):
+                if self._stopped.is_set():
+                    break
+                if now >= job.next_run:
+                    self.run_job(job.name)
+
+            next_run = min((job.next_run for job in self.jobs.values()), default=time.time() + 60)
+            self._wakeup.wait(max(1, next_run - time.time()))
+            self._wakeup.clear()
+
+    def run_job(self, name, force=False):
+        """
+        Run a job now if it is due (or forced) and no other worker is running it
+
+        Args:
+            name: Job name
+            force: Run even if another worker ran the job within its cadence
+
+        Returns:
+            True if the job ran successfully, False otherwise
+        """
+        return self._run_job(name, force) == 'succeeded'
+
+    def _run_job(self, name, force=False, wait=0):
+        """
+        Run a job, or join the run already in progress
+
+        Args:
+            name: Job name
+            force: Run even if another worker ran the job within its cadence
+            wait: Seconds to wait for a run in progress (in any worker) to finish
+
+        Returns:
+            'succeeded' or 'failed' if the job ran, 'joined' or 'joined_failed'
+            if a run in progress finished while waiting, 'skipped' if the job
+            wasn't due or the wait timed out
+        """
+        job = self.jobs[name]
+        requested_at = time.time()
+
+        with file_lease(self.cache.backend.lock_path_for(f"job_{name}"), wait) as acquired:
+            if not acquired:
+                # Another worker is running this job right now
+                job.next_run = time.time() + job.interval
+                return 'skipped'
+
+            shared = self.cache.peek(f"job_{name}")
+            if shared is not None:
+                last_run = shared[0].get('last_run') or 0
+                finished_at = last_run + (shared[0].get('last_duration') or 0)
+                joined = finished_at >= requested_at
+                if joined or (not force and time.time() - last_run < job.interval):
+                    with job.lock:
+                        job.status.update({k: v for k, v in shared[0].items() if k in job.status})
+                    job.next_run = last_run + job.interval
+                    if joined:
+                        return 'joined' if shared[0].get('last_error') is None else 'joined_failed'
+                    return 'skipped'
+
+            with job.lock:
+                job.status['state'] = 'running'
+            start_time = time.time()
+            try:
+                job.func()
+                error = None
+            except Exception as e:
+                logger.error(f"Refresh job {name} failed: {e}")
+                error = str(e)
+
+            with job.lock:
+                job.status.update({
+                    'state': 'idle',
+                    'runs': job.status['runs'] + 1,
+                    'failures': job.status['failures'] + (error is not None),
+                    'last_run': start_time,
+                    'last_duration': round(time.time() - start_time, 3),
+                    'last_error': error
+                })
+                status = dict(job.status)
+            job.next_run = start_time + job.interval
+            self.cache.set(f"job_{name}", status)
+
+        return 'succeeded' if error is None else 'failed'
+
+    def run_all(self, force=True):
+        """
+        Run every job immediately, in registration order
+
+        Args:
+            force: Run even if another worker ran the jobs within their cadence
+
+        Returns:
+            Dictionary mapping job name to success flag
+        """
+        return {name: self.run_job(name, force) for name in list(self.jobs)}
+
+    def submit_refresh(self):
+        """
+        Start refreshing every job in the background, or join the refresh already running
+
+        Refresh requests arriving while a refresh is queued or running (in
+        this or another worker sharing the state directory) collapse into it.
+
+        Returns:
+            Status of the new or already running refresh (see get_refresh)
+        """
+        with self._lock, file_lease(self.cache.backend.lock_path_for('refresh_active'), 5):
+            active = self.cache.peek('refresh_active')
+            if active is not None:
+                status = self.get_refresh(active[0].get('job_id'))
+                if status and status['state'] in ('queued', 'running') and \
+                        time.time() - status['updated_at'] < REFRESH_STALE_AFTER:
+                    return status
+
+            run = RefreshRun(list(self.jobs))
+            self.refresh_runs[run.job_id] = run
+            for job_id in list(self.refresh_runs)[:-MAX_REFRESH_RUNS]:
+                del self.refresh_runs[job_id]
+            self._save_refresh(run)
+            self.cache.set('refresh_active', {'job_id': run.job_id})
+            self._prune_refreshes()
+
+        threading.Thread(target=self._run_refresh, args=(run,), name=f"refresh-{run.job_id}", daemon=True).start()
+        logger.info(f"Queued refresh {run.job_id}")
+        return copy.deepcopy(run.status)
+
+    def _prune_refreshes(self):
+        """Delete the shared status of refreshes last updated more than REFRESH_RETENTION seconds ago"""
+        cutoff = time.time() - REFRESH_RETENTION
+        for cache_key, (data, stored_at) in self.cache.entries().items():
+            if cache_key.startswith('refresh_') and cache_key != 'refresh_active' and stored_at < cutoff:
+                self.cache.delete(cache_key)
+
+    def _save_refresh(self, run):
+        run.status['updated_at'] = time.time()
+        self.cache.set(f"refresh_{run.job_id}", run.status)
+
+    def _run_refresh(self, run):
+        status = run.status
+        status.update({'state': 'running', 'started_at': time.time()})
+        self._save_refresh(run)
+
+        for stage in status['stages']:
+            stage.update({'state': 'running', 'started_at': time.time()})
+            self._save_refresh(run)
+
+            # A run already in progress (e.g. the periodic one) is joined rather than repeated
+            outcome = self._run_job(stage['name'], force=True, wait=REFRESH_JOIN_TIMEOUT)
+            job = self.jobs[stage['name']]
+            with job.lock:
+                last_error = job.status['last_error']
+            stage.update({
+                'state': 'failed' if outcome == 'joined_failed' else outcome,
+                'duration': round(time.time() - stage['started_at'], 3),
+                'error': last_error if outcome in ('failed', 'joined_failed') else None
+            })
+            status['progress']['completed'] += 1
+            self._save_refresh(run)
+
+        finished_at = time.time()
+        status.update({
+            'state': 'failed' if any(stage['state'] == 'failed' for stage in status['stages']) else 'succeeded',
+            'finished_at': finished_at,
+            'duration': round(finished_at - status['started_at'], 3)
+        })
+        self._save_refresh(run)
+        logger.info(f"Refresh {run.job_id} {status['state']} in {status['duration']}s")
+
+    def get_refresh(self, job_id):
+        """
+        Get the status of an on-demand refresh
+
+        Args:
+            job_id: ID returned by submit_refresh
+
+        Returns:
+            Dictionary with 'job_id', 'state' (queued, running, succeeded or
+            failed), timings, 'progress' and per-stage 'stages', or None if
+            the refresh is unknown. A stage that found its job already running
+            waits for that run and is 'joined' (or 'failed' with its error),
+            or 'skipped' if the run outlasted REFRESH_JOIN_TIMEOUT.
+        """
+        run = self.refresh_runs.get(job_id)
+        if run is not None:
+            return copy.deepcopy(run.status)
+
+        # Refreshes started by another worker are read from the shared state
+        shared = self.cache.peek(f"refresh_{job_id}") if job_id else None
+        return shared[0] if shared is not None else None
+
+    def get_status(self):
+        """
+        Get the status of every job
+
+        Returns:
+            Dictionary with scheduler state and per-job status
+        """
+        jobs = {}
+        for name, job in self.jobs.items():
+            with job.lock:
+                status = dict(job.status)
+            shared = self.cache.peek(f"job_{name}")
+            if shared is not None and (shared[0].get('last_run') or 0) > (status['last_run'] or 0):
+                status.update({k: v for k, v in shared[0].items() if k in ('last_run', 'last_duration', 'last_error')})
+            if status['last_run']:
+                status['last_run_formatted'] = datetime.fromtimestamp(status['last_run']).strftime("%Y-%m-%d %H:%M:%S")
+            jobs[name] = status
+
+        return {
+            'running': self.is_running(),
+            'jobs': jobs
+        }
+
+
+def create_refresh_scheduler(prediction_api, cadences=None, cache_dir=None):
+    """
+    Build the scheduler that keeps the prediction API's data warm
+
+    Args:
+        prediction_api: MLBPredictionAPI instance
+        cadences: Optional overrides for DEFAULT_CADENCES
+        cache_dir: Directory to store shared job state
+
+    Returns:
+        RefreshScheduler with games, pitcher ERA, team stats and predictions
+        jobs, followed by warming every advertised date and purging expired
+        cache entries
+    """
+    cadences = dict(DEFAULT_CADENCES, **(cadences or {}))
+    stats_api = prediction_api.mlb_stats_api
+
+    def today():
+        return datetime.now().strftime('%Y-%m-%d')
+
+    scheduler = RefreshScheduler(cache_dir)
+    scheduler.add_job('games', cadences['games'], lambda: stats_api.refresh_games(today()))
+    scheduler.add_job('pitcher_eras', cadences['pitcher_eras'], lambda: stats_api.refresh_pitcher_eras(today()))
+    scheduler.add_job('team_stats', cadences['team_stats'], stats_api.refresh_team_stats)
+    scheduler.add_job('predictions', cadences['predictions'], lambda: prediction_api.refresh_predictions(today()))
+    scheduler.add_job('warm_dates', cadences['warm_dates'], prediction_api.warmer.warm)
+    scheduler.add_job('purge_cache', cadences['purge_cache'], get_cache_engine().purge_expired)
+    return scheduler
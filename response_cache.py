@@ -0,0 +1,143 @@
+import os
+import gzip
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+# Bodies smaller than this (in bytes) are sent uncompressed
+MIN_COMPRESS_SIZE = 512
+
+# Compression levels; bodies are compressed once per payload, not per request
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 9
+
+# Number of encoded payloads kept in memory
+DEFAULT_RESPONSE_ENTRIES = int(os.environ.get('MLB_RESPONSE_CACHE_ENTRIES', 64))
+
+
+def serialize(data):
+    """Serialize a payload to its canonical JSON body"""
+    return json.dumps(data, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+class EncodedResponse:
+    """
+    A JSON payload serialized once, with its compressed encodings and validators
+    """
+
+    __slots__ = ('version', 'body', 'encodings', 'etag', 'last_modified')
+
+    def __init__(self, data, last_modified=None, version=None, body=None):
+        """
+        Serialize and compress a payload
+
+        Args:
+            data: JSON-serializable payload
+            last_modified: Optional Unix timestamp of when the payload was built
+            version: Optional value identifying the payload's content
+            body: The payload already serialized with serialize(), if it was
+        """
+        self.version = version
+        self.body = body if body is not None else serialize(data)
+        self.etag = hashlib.sha1(self.body).hexdigest()
+        self.last_modified = last_modified
+
+        self.encodings = {}
+        if len(self.body) >= MIN_COMPRESS_SIZE:
+            if brotli is not None:
+                self.encodings['br'] = brotli.compress(self.body, quality=BROTLI_QUALITY)
+            self.encodings['gzip'] = gzip.compress(self.body, compresslevel=GZIP_LEVEL, mtime=0)
+
+    def negotiate(self, accept_encodings):
+        """
+        Pick the smallest body the client accepts
+
+        Args:
+            accept_encodings: Accept-Encoding values the client allows (e.g. ['gzip', 'br'])
+
+        Returns:
+            Tuple of (body bytes, content encoding or None for identity)
+        """
+        for encoding in ('br', 'gzip'):
+            if encoding in self.encodings and encoding in accept_encodings:
+                return self.encodings[encoding], encoding
+        return self.body, None
+
+
+class ResponseCache:
+    """
+    Encoded responses for payloads served from the prediction cache
+
+    An encoded response is reused for as long as the payload served from
+    its slot keeps the same content, and rebuilt (once) when it changes.
+    Content is compared by a version the caller supplies (e.g. the time the
+    payload was built), or else by the hash of the serialized body, which
+    still skips the compression.
+    """
+
+    def __init__(self, max_entries=DEFAULT_RESPONSE_ENTRIES):
+        """
+        Initialize the response cache
+
+        Args:
+            max_entries: Maximum number of encoded payloads kept
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'encodes': 0}
+
+    def get(self, key, data, last_modified=None, version=None):
+        """
+        Get the encoded response for a payload, encoding it on first use
+
+        Args:
+            key: Slot identifying what the payload is (e.g. a route and date)
+            data: Payload about to be served
+            last_modified: Optional Unix timestamp of when the payload was built
+            version: Optional value that changes whenever the payload's
+                content does; payloads without one are serialized and
+                compared by hash
+
+        Returns:
+            EncodedResponse
+        """
+        body = None
+        if version is None:
+            body = serialize(data)
+            etag = hashlib.sha1(body).hexdigest()
+
+        with self._lock:
+            encoded = self._entries.get(key)
+            if encoded is not None and (encoded.version == version if version is not None else encoded.etag == etag):
+                self._entries.move_to_end(key)
+                self.stats['hits'] += 1
+                return encoded
+
+        encoded = EncodedResponse(data, last_modified, version, body)
+        with self._lock:
+            self._entries[key] = encoded
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self.stats['encodes'] += 1
+        return encoded
+
+    def get_stats(self):
+        """Get hit/encode counters"""
+        with self._lock:
+            return dict(self.stats, entries=len(self._entries), brotli=brotli is not None)
+
+
+_default_response_cache = ResponseCache()
+
+
+def get_response_cache():
+    """Get the process-wide response cache"""
+    return _default_response_cache
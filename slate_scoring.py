@@ -0,0 +1,165 @@
+import numpy as np
+
+# Prediction markets scored for every game, with the run threshold of the
+# first-three-innings markets
+MARKETS = {
+    'under_1_run_first_inning': None,
+    'over_2.5_runs_first_3_innings': 2.5,
+    'over_3.5_runs_first_3_innings': 3.5
+}
+
+# Minimum probability for each rating (checked in order)
+RATING_THRESHOLDS = (('Bet', 60), ('Lean', 52))
+
+
+def to_float_array(values, falsy_missing=False):
+    """
+    Convert raw stat values to a float array
+
+    Numbers and numeric strings are converted; None, 'N/A' and anything else
+    that isn't a number become NaN (treated as missing).
+
+    Args:
+        values: Iterable of raw stat values
+        falsy_missing: Also treat falsy values (0, '') as missing, as the
+            scalar code does for WHIP, strikeouts and innings pitched
+
+    Returns:
+        1-D float64 array
+    """
+    converted = []
+    for value in values:
+        try:
+            converted.append(np.nan if falsy_missing and not value else float(value))
+        except (TypeError, ValueError):
+            converted.append(np.nan)
+    return np.array(converted, dtype=np.float64)
+
+
+def pitcher_performance_scores(era, whip=None, strikeouts=None, innings_pitched=None):
+    """
+    Vectorized MLBPredictionAPI.calculate_pitcher_performance_score
+
+    Args:
+        era: Array of ERAs (NaN where missing)
+        whip: Optional array of WHIPs (NaN where missing)
+        strikeouts: Optional array of strikeout totals (NaN where missing)
+        innings_pitched: Optional array of innings pitched (NaN where missing)
+
+    Returns:
+        Array of pitcher performance scores (0-100)
+    """
+    era = np.asarray(era, dtype=np.float64)
+    era_score = np.clip(100 - (era * 10), 0, 100)
+
+    if whip is not None and strikeouts is not None and innings_pitched is not None:
+        whip = np.asarray(whip, dtype=np.float64)
+        strikeouts = np.asarray(strikeouts, dtype=np.float64)
+        innings_pitched = np.asarray(innings_pitched, dtype=np.float64)
+
+        # The extra stats are only used when all three are present
+        complete = ~np.isnan(whip) & ~np.isnan(strikeouts) & ~np.isnan(innings_pitched)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            k9 = np.where(innings_pitched > 0, (strikeouts / innings_pitched) * 9, 0)
+        whip_score = np.clip(100 - (whip * 50), 0, 100)
+        k9_score = np.clip((k9 / 15) * 100, 0, 100)
+        combined_score = (era_score * 0.6) + (whip_score * 0.25) + (k9_score * 0.15)
+        era_score = np.where(complete, combined_score, era_score)
+
+    # Missing ERA gives a neutral score
+    return np.where(np.isnan(era), 50, era_score)
+
+
+def first_inning_no_run_probabilities(home_scores, away_scores):
+    """
+    Vectorized MLBPredictionAPI.calculate_first_inning_no_run_probability
+
+    Args:
+        home_scores: Array of home pitcher performance scores
+        away_scores: Array of away pitcher performance scores
+
+    Returns:
+        Array of probabilities of no runs in the first inning (0-100)
+    """
+    pitcher_score = (home_scores + away_scores) / 2
+    return np.clip(30 + (pitcher_score * 0.4), 0, 100)
+
+
+def ratings(probabilities):
+    """
+    Vectorized MLBPredictionAPI.get_rating
+
+    Args:
+        probabilities: Array of probabilities
+
+    Returns:
+        Array of ratings (Bet, Lean, Pass)
+    """
+    probabilities = np.asarray(probabilities)
+    return np.select(
+        [probabilities >= threshold for _, threshold in RATING_THRESHOLDS],
+        [rating for rating, _ in RATING_THRESHOLDS],
+        default='Pass'
+    )
+
+
+def score_slate(home_era, away_era, home_whip=None, away_whip=None, home_strikeouts=None,
+                away_strikeouts=None, home_innings=None, away_innings=None):
+    """
+    Score the pitcher-score markets for a batch of games in one vectorized pass
+
+    Only markets without a run threshold are scored here; the run-line
+    markets are priced from the inning simulator's distributions (see
+    MLBPredictionAPI.score_distribution).
+
+    Args:
+        home_era, away_era: Raw pitcher ERAs, one per game
+        home_whip, away_whip: Optional raw pitcher WHIPs
+        home_strikeouts, away_strikeouts: Optional raw pitcher strikeout totals
+        home_innings, away_innings: Optional raw pitcher innings pitched
+
+    Returns:
+        Dictionary mapping market to {'probability': array, 'rating': array}
+    """
+    def scores(era, whip, strikeouts, innings):
+        extra = [
+            to_float_array(values, falsy_missing=True) if values is not None else None
+            for values in (whip, strikeouts, innings)
+        ]
+        if any(values is None for values in extra):
+            extra = [None, None, None]
+        return pitcher_performance_scores(to_float_array(era), *extra)
+
+    home_scores = scores(home_era, home_whip, home_strikeouts, home_innings)
+    away_scores = scores(away_era, away_whip, away_strikeouts, away_innings)
+
+    results = {}
+    for market, run_threshold in MARKETS.items():
+        if run_threshold is None:
+            probabilities = first_inning_no_run_probabilities(home_scores, away_scores)
+            results[market] = {'probability': probabilities, 'rating': ratings(probabilities)}
+    return results
+
+
+def score_games(games):
+    """
+    Score the pitcher-score markets for a list of schedule game records
+
+    Args:
+        games: Game records with 'home_era' and 'away_era'
+
+    Returns:
+        List (one entry per game) of dictionaries mapping market to
+        {'probability': float, 'rating': str}
+    """
+    if not games:
+        return []
+
+    results = score_slate([game.get('home_era') for game in games], [game.get('away_era') for game in games])
+    return [
+        {
+            market: {'probability': float(scored['probability'][i]), 'rating': str(scored['rating'][i])}
+            for market, scored in results.items()
+        }
+        for i in range(len(games))
+    ]
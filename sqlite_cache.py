@@ -0,0 +1,314 @@
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from cache_engine import remove_idle_lock_files
+
+logger = logging.getLogger('sqlite_cache')
+
+# Default database location, shared by every namespace and worker process
+DEFAULT_DB_PATH = os.environ.get(
+    'MLB_CACHE_DB',
+    os.path.join(os.environ.get('RENDER_CACHE_DIR', '/tmp'), 'mlb_prediction_tool', 'cache.sqlite3')
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    namespace TEXT NOT NULL,
+    cache_key TEXT NOT NULL,
+    data TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL,
+    PRIMARY KEY (namespace, cache_key)
+);
+DROP INDEX IF EXISTS idx_cache_entries_expiry;
+CREATE INDEX IF NOT EXISTS idx_cache_entries_expires_at ON cache_entries (expires_at, stored_at);
+CREATE TABLE IF NOT EXISTS migrations (
+    namespace TEXT PRIMARY KEY,
+    migrated_at REAL NOT NULL,
+    entries INTEGER NOT NULL
+);
+"""
+
+# SQLite limits the number of bound parameters per statement
+BATCH_SIZE = 500
+
+
+class SQLiteStore:
+    """
+    A single SQLite database holding the disk tier of every cache namespace
+
+    The database runs in WAL mode so readers never block the writer and several
+    gunicorn workers can share it. Each thread gets its own connection.
+    """
+
+    def __init__(self, db_path=None, busy_timeout=5000):
+        """
+        Initialize the store and create the schema if needed
+
+        Args:
+            db_path: Path to the database file
+            busy_timeout: Milliseconds to wait for a lock held by another connection
+        """
+        self.db_path = db_path or DEFAULT_DB_PATH
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        self.connection().executescript(SCHEMA)
+
+    def connection(self):
+        """Get this thread's connection, opening it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout / 1000, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute(f'PRAGMA busy_timeout={int(self.busy_timeout)}')
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        """Close this thread's connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def purge_expired(self, older_than=0, retention=None):
+        """
+        Delete entries that expired more than older_than seconds ago
+
+        Args:
+            older_than: Grace period in seconds (keeps entries usable for stale serving)
+            retention: Optional age in seconds after which entries that never
+                expire (e.g. final games) are deleted too
+
+        Returns:
+            Number of entries deleted
+        """
+        now = time.time()
+        conn = self.connection()
+        deleted = conn.execute(
+            'DELETE FROM cache_entries WHERE expires_at IS NOT NULL AND expires_at < ?',
+            (now - older_than,)
+        ).rowcount
+        if retention is not None:
+            deleted += conn.execute(
+                'DELETE FROM cache_entries WHERE expires_at IS NULL AND stored_at < ?',
+                (now - retention,)
+            ).rowcount
+        return deleted
+
+
+class SQLiteBackend:
+    """
+    Disk backend storing one namespace's entries as rows in a SQLiteStore
+
+    Exposes the same interface as cache_engine.FileBackend. Rows are keyed by
+    the namespace's cache directory so namespaces that share a name but not a
+    directory stay separate, as they do with the file backend. Fill-lease lock
+    files still live in the cache directory.
+    """
+
+    kind = 'sqlite'
+
+    def __init__(self, store, cache_dir, layout='raw'):
+        """
+        Initialize the backend
+
+        Args:
+            store: SQLiteStore holding the entries
+            cache_dir: Directory the namespace used with the file backend
+            layout: File layout to import from during migration, 'raw' or 'envelope'
+        """
+        if layout not in ('raw', 'envelope'):
+            raise ValueError(f"Unknown cache layout: {layout}")
+
+        self.store = store
+        self.cache_dir = cache_dir
+        self.layout = layout
+        self.namespace = os.path.abspath(cache_dir)
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def lock_path_for(self, cache_key):
+        """Get the fill-lease lock file path for a cache key"""
+        return os.path.join(self.cache_dir, f"{cache_key}.lock")
+
+    def keys(self):
+        """List every key stored for the namespace, except internal '_'-prefixed records"""
+        rows = self.store.connection().execute(
+            "SELECT cache_key FROM cache_entries WHERE namespace = ? AND cache_key NOT LIKE '\\_%' ESCAPE '\\'",
+            (self.namespace,)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def read(self, cache_key):
+        """
+        Read an entry from the database
+
+        Args:
+            cache_key: Key to identify the cache entry
+
+        Returns:
+            Tuple of (data, stored_at) or None if the entry does not exist
+        """
+        row = self.store.connection().execute(
+            'SELECT data, stored_at FROM cache_entries WHERE namespace = ? AND cache_key = ?',
+            (self.namespace, cache_key)
+        ).fetchone()
+        if row is None:
+            return None
+
+        try:
+            return json.loads(row[0]), row[1]
+        except ValueError as e:
+            logger.error(f"Error decoding cache entry {cache_key}: {e}")
+            return None
+
+    def read_many(self, cache_keys):
+        """
+        Read several entries with one query per batch
+
+        Args:
+            cache_keys: Keys to read
+
+        Returns:
+            Dictionary mapping each found key to (data, stored_at)
+        """
+        cache_keys = list(cache_keys)
+        entries = {}
+        conn = self.store.connection()
+        for i in range(0, len(cache_keys), BATCH_SIZE):
+            batch = cache_keys[i:i + BATCH_SIZE]
+            placeholders = ','.join('?' * len(batch))
+            rows = conn.execute(
+                f'SELECT cache_key, data, stored_at FROM cache_entries '
+                f'WHERE namespace = ? AND cache_key IN ({placeholders})',
+                [self.namespace] + batch
+            )
+            for cache_key, data, stored_at in rows:
+                try:
+                    entries[cache_key] = (json.loads(data), stored_at)
+                except ValueError as e:
+                    logger.error(f"Error decoding cache entry {cache_key}: {e}")
+        return entries
+
+    def write(self, cache_key, data, stored_at, expires_at=None):
+        """
+        Write an entry to the database
+
+        Args:
+            cache_key: Key to identify the cache entry
+            data: Data to save
+            stored_at: Timestamp the data was stored at
+            expires_at: Timestamp the data expires at
+        """
+        self.store.connection().execute(
+            'INSERT OR REPLACE INTO cache_entries (namespace, cache_key, data, stored_at, expires_at) '
+            'VALUES (?, ?, ?, ?, ?)',
+            (self.namespace, cache_key, json.dumps(data), stored_at, expires_at)
+        )
+
+    def write_many(self, entries, stored_at, expires_at=None):
+        """
+        Write several entries in a single transaction
+
+        Args:
+            entries: Dictionary mapping cache key to data
+            stored_at: Timestamp the data was stored at
+            expires_at: Timestamp the data expires at
+        """
+        rows = [
+            (self.namespace, cache_key, json.dumps(data), stored_at, expires_at)
+            for cache_key, data in entries.items()
+        ]
+        self._insert_rows(rows)
+
+    def _insert_rows(self, rows):
+        conn = self.store.connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.executemany(
+                'INSERT OR REPLACE INTO cache_entries (namespace, cache_key, data, stored_at, expires_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                rows
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def delete(self, cache_key):
+        """Delete a single entry from the database"""
+        self.store.connection().execute(
+            'DELETE FROM cache_entries WHERE namespace = ? AND cache_key = ?',
+            (self.namespace, cache_key)
+        )
+
+    def clear(self):
+        """Delete every entry in the namespace"""
+        self.store.connection().execute('DELETE FROM cache_entries WHERE namespace = ?', (self.namespace,))
+        remove_idle_lock_files(self.cache_dir)
+
+    def migrate_from_files(self, expires_at=None):
+        """
+        Import the namespace's existing JSON cache files, once per database
+
+        Files are left in place so the file backend can still be switched back to.
+
+        Args:
+            expires_at: Optional callable (cache_key, data, stored_at) giving
+                each entry's expiry timestamp, e.g. CacheNamespace.expires_at
+
+        Returns:
+            Number of entries imported (0 if the namespace was already migrated)
+        """
+        conn = self.store.connection()
+        if conn.execute('SELECT 1 FROM migrations WHERE namespace = ?', (self.namespace,)).fetchone():
+            return 0
+
+        rows = []
+        for file in os.listdir(self.cache_dir):
+            if not file.endswith('.json') or file.startswith('_'):
+                continue
+            path = os.path.join(self.cache_dir, file)
+            try:
+                with open(path, 'r') as f:
+                    content = json.load(f)
+                if self.layout == 'envelope':
+                    data, stored_at = content['data'], content['cache_time']
+                else:
+                    data, stored_at = content, os.path.getmtime(path)
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Skipping unreadable cache file {path}: {e}")
+                continue
+            cache_key = file[:-len('.json')]
+            expiry = expires_at(cache_key, data, stored_at) if expires_at is not None else None
+            rows.append((self.namespace, cache_key, json.dumps(data), stored_at, expiry))
+
+        # Don't overwrite entries another worker already wrote to the database
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            if conn.execute('SELECT 1 FROM migrations WHERE namespace = ?', (self.namespace,)).fetchone():
+                conn.execute('COMMIT')
+                return 0
+            conn.executemany(
+                'INSERT OR IGNORE INTO cache_entries (namespace, cache_key, data, stored_at, expires_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                rows
+            )
+            conn.execute(
+                'INSERT INTO migrations (namespace, migrated_at, entries) VALUES (?, ?, ?)',
+                (self.namespace, time.time(), len(rows))
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+        if rows:
+            logger.info(f"Migrated {len(rows)} cache files from {self.cache_dir} to {self.store.db_path}")
+        return len(rows)
@@ -0,0 +1,83 @@
+from collections import namedtuple, Counter
+from types import MappingProxyType
+
+# One canonical record per MLB club. abbreviation is the MLB Stats API
+# abbreviation, espn_id the ESPN URL slug and bbref_id the Baseball-Reference
+# franchise code.
+Team = namedtuple('Team', ['name', 'abbreviation', 'mlb_id', 'espn_id', 'bbref_id', 'city', 'nickname', 'aliases'])
+
+TEAMS = (
+    Team('Arizona Diamondbacks', 'ARI', 109, 'ari', 'ARI', 'Arizona', 'Diamondbacks', ('D-backs', 'Dbacks', 'AZ')),
+    Team('Atlanta Braves', 'ATL', 144, 'atl', 'ATL', 'Atlanta', 'Braves', ()),
+    Team('Baltimore Orioles', 'BAL', 110, 'bal', 'BAL', 'Baltimore', 'Orioles', ("O's",)),
+    Team('Boston Red Sox', 'BOS', 111, 'bos', 'BOS', 'Boston', 'Red Sox', ()),
+    Team('Chicago Cubs', 'CHC', 112, 'chc', 'CHC', 'Chicago', 'Cubs', ()),
+    Team('Chicago White Sox', 'CWS', 145, 'chw', 'CHW', 'Chicago', 'White Sox', ('CHW', 'CHA')),
+    Team('Cincinnati Reds', 'CIN', 113, 'cin', 'CIN', 'Cincinnati', 'Reds', ()),
+    Team('Cleveland Guardians', 'CLE', 114, 'cle', 'CLE', 'Cleveland', 'Guardians', ('Cleveland Indians', 'Indians')),
+    Team('Colorado Rockies', 'COL', 115, 'col', 'COL', 'Colorado', 'Rockies', ()),
+    Team('Detroit Tigers', 'DET', 116, 'det', 'DET', 'Detroit', 'Tigers', ()),
+    Team('Houston Astros', 'HOU', 117, 'hou', 'HOU', 'Houston', 'Astros', ()),
+    Team('Kansas City Royals', 'KC', 118, 'kc', 'KCR', 'Kansas City', 'Royals', ('KCR', 'KCA')),
+    Team('Los Angeles Angels', 'LAA', 108, 'laa', 'LAA', 'Los Angeles', 'Angels', ('Anaheim Angels', 'LA Angels', 'ANA')),
+    Team('Los Angeles Dodgers', 'LAD', 119, 'lad', 'LAD', 'Los Angeles', 'Dodgers', ('LA Dodgers',)),
+    Team('Miami Marlins', 'MIA', 146, 'mia', 'MIA', 'Miami', 'Marlins', ('Florida Marlins',)),
+    Team('Milwaukee Brewers', 'MIL', 158, 'mil', 'MIL', 'Milwaukee', 'Brewers', ()),
+    Team('Minnesota Twins', 'MIN', 142, 'min', 'MIN', 'Minnesota', 'Twins', ()),
+    Team('New York Mets', 'NYM', 121, 'nym', 'NYM', 'New York', 'Mets', ('NY Mets',)),
+    Team('New York Yankees', 'NYY', 147, 'nyy', 'NYY', 'New York', 'Yankees', ('NY Yankees',)),
+    Team('Oakland Athletics', 'OAK', 133, 'oak', 'OAK', 'Oakland', 'Athletics',
+         ("A's", 'ATH', 'Sacramento Athletics', 'Las Vegas Athletics')),
+    Team('Philadelphia Phillies', 'PHI', 143, 'phi', 'PHI', 'Philadelphia', 'Phillies', ()),
+    Team('Pittsburgh Pirates', 'PIT', 134, 'pit', 'PIT', 'Pittsburgh', 'Pirates', ()),
+    Team('San Diego Padres', 'SD', 135, 'sd', 'SDP', 'San Diego', 'Padres', ('SDP',)),
+    Team('San Francisco Giants', 'SF', 137, 'sf', 'SFG', 'San Francisco', 'Giants', ('SFG',)),
+    Team('Seattle Mariners', 'SEA', 136, 'sea', 'SEA', 'Seattle', 'Mariners', ()),
+    Team('St. Louis Cardinals', 'STL', 138, 'stl', 'STL', 'St. Louis', 'Cardinals', ('Saint Louis Cardinals',)),
+    Team('Tampa Bay Rays', 'TB', 139, 'tb', 'TBR', 'Tampa Bay', 'Rays', ('TBR', 'Tampa Bay Devil Rays')),
+    Team('Texas Rangers', 'TEX', 140, 'tex', 'TEX', 'Texas', 'Rangers', ()),
+    Team('Toronto Blue Jays', 'TOR', 141, 'tor', 'TOR', 'Toronto', 'Blue Jays', ()),
+    Team('Washington Nationals', 'WSH', 120, 'wsh', 'WSN', 'Washington', 'Nationals', ('WSN', 'WAS', 'Nats')),
+)
+
+
+def normalize_team_key(value):
+    """Normalize a team name, abbreviation or ID for lookup"""
+    return ' '.join(str(value).replace('.', '').lower().split())
+
+
+def _build_index(teams):
+    # Cities shared by two clubs (Chicago, Los Angeles, New York) are not keys
+    city_counts = Counter(normalize_team_key(team.city) for team in teams)
+
+    index = {}
+    for team in teams:
+        keys = [team.name, team.abbreviation, team.mlb_id, team.espn_id, team.bbref_id, team.nickname]
+        keys.extend(team.aliases)
+        if city_counts[normalize_team_key(team.city)] == 1:
+            keys.append(team.city)
+
+        for key in keys:
+            normalized = normalize_team_key(key)
+            if index.get(normalized, team) is not team:
+                raise ValueError(f"Team key {key!r} is ambiguous")
+            index[normalized] = team
+    return MappingProxyType(index)
+
+
+TEAM_INDEX = _build_index(TEAMS)
+
+
+def get_team(value):
+    """
+    Look up a team by name, abbreviation, ESPN/MLB/Baseball-Reference ID or alias
+
+    Args:
+        value: Any key identifying the team (case and periods are ignored)
+
+    Returns:
+        Team record, or None if the key is unknown
+    """
+    if value is None:
+        return None
+    return TEAM_INDEX.get(normalize_team_key(value))
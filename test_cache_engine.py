@@ -0,0 +1,388 @@
+import os
+import json
+import time
+from cache_engine import CacheEngine
+
+
+def test_memory_tier_serves_warm_hits(tmp_path):
+    """A value written through the engine is served from memory without touching disk"""
+    engine = CacheEngine()
+    cache = engine.namespace('predictions', str(tmp_path))
+
+    cache.set('all_predictions_2025-04-16', {'metadata': {'game_count': 6}})
+    os.remove(tmp_path / 'all_predictions_2025-04-16.json')
+
+    assert cache.get('all_predictions_2025-04-16') == {'metadata': {'game_count': 6}}
+    assert cache.stats['memory_hits'] == 1
+    assert cache.stats['disk_hits'] == 0
+
+
+
+def test_disk_tier_is_promoted_to_memory(tmp_path):
+    """A cold process reads from disk once and then serves from memory"""
+    CacheEngine().namespace('mlb_stats', str(tmp_path)).set('team_stats_NYY', {'team_era': 3.5})
+
+    engine = CacheEngine()
+    cache = engine.namespace('mlb_stats', str(tmp_path))
+
+    assert cache.get('team_stats_NYY') == {'team_era': 3.5}
+    assert cache.get('team_stats_NYY') == {'team_era': 3.5}
+    assert cache.stats['disk_hits'] == 1
+    assert cache.stats['memory_hits'] == 1
+
+
+def test_envelope_layout_matches_existing_files(tmp_path):
+    """Envelope namespaces read and write the {'data', 'cache_time'} file format"""
+    with open(tmp_path / 'espn_era_Boston_Red_Sox_Chris_Sale.json', 'w') as f:
+        json.dump({'data': {'era': 3.84}, 'cache_time': time.time()}, f)
+
+    cache = CacheEngine().namespace('espn_direct', str(tmp_path), layout='envelope')
+    assert cache.get('espn_era_Boston_Red_Sox_Chris_Sale') == {'era': 3.84}
+
+    cache.set('espn_roster_bos', ['Chris Sale'])
+    with open(tmp_path / 'espn_roster_bos.json') as f:
+        assert json.load(f)['data'] == ['Chris Sale']
+
+
+def test_namespace_ttl_expires_entries(tmp_path):
+    """Entries older than the namespace TTL are treated as misses"""
+    cache = CacheEngine().namespace('predictions', str(tmp_path), ttl=60)
+    cache.set('games_2025-04-16', [1, 2, 3])
+
+    old = time.time() - 120
+    os.utime(tmp_path / 'games_2025-04-16.json', (old, old))
+    cache.engine.memory_delete(cache._memory_key('games_2025-04-16'))
+
+    assert cache.get('games_2025-04-16') is None
+    assert cache.stats['expired'] == 1
+
+
+def test_lru_evicts_oldest_entries(tmp_path):
+    """The memory tier holds at most memory_entries values"""
+    engine = CacheEngine(memory_entries=2)
+    cache = engine.namespace('mlb_stats', str(tmp_path))
+
+    for key in ('a', 'b', 'c'):
+        cache.set(key, key)
+
+    assert engine.get_stats()['memory_entries'] == 2
+    assert engine.memory_get(cache._memory_key('a')) is None
+
+
+def test_delete_clears_both_tiers(tmp_path):
+    """Clearing a namespace removes memory entries and files"""
+    cache = CacheEngine().namespace('mlb_stats', str(tmp_path))
+    cache.set('pitcher_era_a', {'era': 2.0})
+    cache.set('pitcher_era_b', {'era': 3.0})
+
+    cache.delete('pitcher_era_a')
+    assert cache.get('pitcher_era_a') is None
+    assert cache.get('pitcher_era_b') == {'era': 3.0}
+
+    cache.delete()
+    assert cache.get('pitcher_era_b') is None
+    assert not [f for f in os.listdir(tmp_path) if f.endswith('.json')]
+
+
+def test_get_or_compute_coalesces_concurrent_fills(tmp_path):
+    """Concurrent misses for one key run the fill function exactly once"""
+    import threading
+
+    cache = CacheEngine().namespace('predictions', str(tmp_path))
+    calls = []
+    start = threading.Event()
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.2)
+        return {'metadata': {'game_count': 15}}
+
+    results = []
+
+    def request():
+        start.wait()
+        results.append(cache.get_or_compute('all_predictions_2025-04-16', compute))
+
+    threads = [threading.Thread(target=request) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    start.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{'metadata': {'game_count': 15}}] * 8
+
+
+def test_get_or_compute_rechecks_after_lease(tmp_path):
+    """A worker that waited on another worker's lease reuses the entry it wrote"""
+    import threading
+    from cache_engine import file_lease
+
+    writer = CacheEngine().namespace('predictions', str(tmp_path))
+    reader = CacheEngine().namespace('predictions', str(tmp_path))
+    results = []
+
+    with file_lease(writer.backend.lock_path_for('slate'), 1):
+        thread = threading.Thread(
+            target=lambda: results.append(reader.get_or_compute('slate', lambda: {'built_by': 'reader'}))
+        )
+        thread.start()
+        time.sleep(0.2)
+        writer.set('slate', {'built_by': 'writer'})
+
+    thread.join()
+    assert results == [{'built_by': 'writer'}]
+    assert reader.stats['fills'] == 0
+
+
+
+def test_fill_leases_leave_no_lock_files(tmp_path):
+    """Lease files are deleted on release, and clear() sweeps ones left by dead workers"""
+    cache = CacheEngine().namespace('predictions', str(tmp_path))
+    cache.get_or_compute('slate', lambda: {'games': []})
+    assert not list(tmp_path.glob('*.lock'))
+
+    (tmp_path / 'abandoned.lock').touch()
+    cache.delete()
+    assert not list(tmp_path.glob('*.lock'))
+
+
+
+def test_empty_results_are_cache_hits(tmp_path):
+    """A cached empty slate or zero count is served, not recomputed"""
+    cache = CacheEngine().namespace('predictions', str(tmp_path))
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return []
+
+    assert cache.get_or_compute('games_2025-12-25', compute) == []
+    assert cache.get_or_compute('games_2025-12-25', compute) == []
+    assert cache.get_or_revalidate('games_2025-12-25', compute, hard_ttl=3600) == ([], False)
+    assert calls == [1]
+
+
+def test_get_or_revalidate_serves_stale_and_refreshes(tmp_path):
+    """Expired entries inside the hard expiry are served while a background fill runs"""
+    cache = CacheEngine().namespace('predictions', str(tmp_path), ttl=60)
+    cache.set('slate', {'version': 1})
+
+    old = time.time() - 120
+    os.utime(tmp_path / 'slate.json', (old, old))
+    cache.engine.memory_delete(cache._memory_key('slate'))
+
+    data, is_stale = cache.get_or_revalidate('slate', lambda: {'version': 2}, hard_ttl=3600)
+    assert data == {'version': 1}
+    assert is_stale
+
+    deadline = time.time() + 2
+    while cache.get('slate') is None and time.time() < deadline:
+        time.sleep(0.01)
+    assert cache.get_or_revalidate('slate', lambda: {'version': 3}, hard_ttl=3600) == ({'version': 2}, False)
+
+
+def test_get_or_revalidate_respects_hard_expiry(tmp_path):
+    """Entries older than the hard expiry are rebuilt synchronously"""
+    cache = CacheEngine().namespace('predictions', str(tmp_path), ttl=60)
+    cache.set('slate', {'version': 1})
+
+    old = time.time() - 7200
+    os.utime(tmp_path / 'slate.json', (old, old))
+    cache.engine.memory_delete(cache._memory_key('slate'))
+
+    assert cache.get_or_revalidate('slate', lambda: {'version': 2}, hard_ttl=3600) == ({'version': 2}, False)
+
+
+def test_invalidation_evicts_only_dependents(tmp_path):
+    """Clearing one input evicts the entries derived from it and nothing else"""
+    engine = CacheEngine()
+    stats = engine.namespace('mlb_stats', str(tmp_path / 'mlb_stats'))
+    predictions = engine.namespace('predictions', str(tmp_path / 'predictions'))
+
+    stats.set('pitcher_era_NYY_Cole', {'era': 2.63})
+    stats.set('pitcher_era_LAD_Glasnow', {'era': 3.32})
+    predictions.set('game_predictions_1', {'p': 60}, depends_on=[stats.dependency_id('pitcher_era_NYY_Cole')])
+    predictions.set('game_predictions_2', {'p': 55}, depends_on=[stats.dependency_id('pitcher_era_LAD_Glasnow')])
+    predictions.set('all_predictions', {'games': [1, 2]}, depends_on=[
+        predictions.dependency_id('game_predictions_1'),
+        predictions.dependency_id('game_predictions_2')
+    ])
+
+    stats.delete('pitcher_era_NYY_Cole')
+
+    assert predictions.get('game_predictions_1') is None
+    assert predictions.get('all_predictions') is None
+    assert predictions.get('game_predictions_2') == {'p': 55}
+    assert stats.get('pitcher_era_LAD_Glasnow') == {'era': 3.32}
+
+
+def test_overwriting_input_invalidates_only_on_change(tmp_path):
+    """Rewriting an input with the same value keeps dependents; a new value evicts them"""
+    engine = CacheEngine()
+    stats = engine.namespace('mlb_stats', str(tmp_path / 'mlb_stats'))
+    predictions = engine.namespace('predictions', str(tmp_path / 'predictions'))
+
+    stats.set('team_stats_NYY', {'team_era': 3.5})
+    predictions.set('game_predictions_1', {'p': 60}, depends_on=[stats.dependency_id('team_stats_NYY')])
+
+    stats.set('team_stats_NYY', {'team_era': 3.5})
+    assert predictions.get('game_predictions_1') == {'p': 60}
+
+    stats.set('team_stats_NYY', {'team_era': 3.9})
+    assert predictions.get('game_predictions_1') is None
+
+
+def test_dependencies_survive_new_process(tmp_path):
+    """The dependency index is persisted, so a fresh engine can still invalidate"""
+    first = CacheEngine()
+    first.namespace('mlb_stats', str(tmp_path / 'mlb_stats')).set('games_2025-04-16', [1])
+    first.namespace('predictions', str(tmp_path / 'predictions')).set(
+        'all_predictions_2025-04-16', {'metadata': {}}, depends_on=['mlb_stats:games_2025-04-16']
+    )
+
+    second = CacheEngine()
+    stats = second.namespace('mlb_stats', str(tmp_path / 'mlb_stats'))
+    predictions = second.namespace('predictions', str(tmp_path / 'predictions'))
+
+    stats.delete('games_2025-04-16')
+    assert predictions.get('all_predictions_2025-04-16') is None
+
+
+
+def test_evicted_dependents_drop_their_other_edges(tmp_path):
+    """An entry invalidated through one input is no longer listed under its other inputs"""
+    engine = CacheEngine()
+    stats = engine.namespace('mlb_stats', str(tmp_path / 'mlb_stats'))
+    predictions = engine.namespace('predictions', str(tmp_path / 'predictions'))
+
+    stats.set('team_stats_NYY', {'team_era': 3.5})
+    stats.set('team_stats_BOS', {'team_era': 4.1})
+    predictions.set('game_predictions_1', {'p': 60}, depends_on=[
+        stats.dependency_id('team_stats_NYY'),
+        stats.dependency_id('team_stats_BOS')
+    ])
+    assert not predictions.dependents.keys()
+
+    stats.set('team_stats_NYY', {'team_era': 3.9})
+    assert predictions.get('game_predictions_1') is None
+    assert stats.dependents.keys() == []
+    assert predictions.inputs.keys() == []
+
+
+def test_real_value_replacing_a_negative_result_invalidates(tmp_path):
+    """Dependents built on a placeholder are rebuilt once the real value arrives"""
+    engine = CacheEngine()
+    stats = engine.namespace('mlb_stats', str(tmp_path / 'mlb_stats'))
+    predictions = engine.namespace('predictions', str(tmp_path / 'predictions'))
+
+    stats.set_negative('pitcher_era_NYY_Cole', 4.5)
+    predictions.set('game_predictions_1', {'p': 60}, depends_on=[stats.dependency_id('pitcher_era_NYY_Cole')])
+
+    stats.set('pitcher_era_NYY_Cole', 2.63)
+    assert predictions.get('game_predictions_1') is None
+
+
+def test_purge_drops_edges_of_expired_dependents(tmp_path):
+    engine = CacheEngine()
+    stats = engine.namespace('mlb_stats', str(tmp_path / 'mlb_stats'))
+    predictions = engine.namespace('predictions', str(tmp_path / 'predictions'), ttl=60)
+
+    stats.set('team_stats_NYY', {'team_era': 3.5})
+    predictions.set('game_predictions_1', {'p': 60}, depends_on=[stats.dependency_id('team_stats_NYY')])
+    predictions.set('game_predictions_2', {'p': 55}, depends_on=[stats.dependency_id('team_stats_NYY')])
+
+    old = time.time() - 3600
+    os.utime(tmp_path / 'predictions' / 'game_predictions_1.json', (old, old))
+    engine.purge_expired(grace=600)
+
+    assert predictions.inputs.keys() == ['game_predictions_2']
+    assert stats.dependents._read('team_stats_NYY') == {'predictions:game_predictions_2'}
+
+
+def test_sqlite_backend_round_trip(tmp_path):
+    """The SQLite backend stores entries for every namespace in one database"""
+    db_path = str(tmp_path / 'cache.sqlite3')
+    CacheEngine(backend='sqlite', db_path=db_path).namespace('mlb_stats', str(tmp_path / 'mlb_stats')).set(
+        'team_stats_NYY', {'team_era': 3.5}
+    )
+
+    cache = CacheEngine(backend='sqlite', db_path=db_path).namespace('mlb_stats', str(tmp_path / 'mlb_stats'))
+    assert cache.get('team_stats_NYY') == {'team_era': 3.5}
+    assert cache.stats['disk_hits'] == 1
+    assert not [f for f in os.listdir(tmp_path / 'mlb_stats') if f.endswith('.json')]
+
+    cache.set_many({'pitcher_era_a': {'era': 2.0}, 'pitcher_era_b': {'era': 3.0}})
+    cache.engine.memory_clear(cache.cache_dir)
+    assert cache.get_many(['pitcher_era_a', 'pitcher_era_b', 'pitcher_era_c']) == {
+        'pitcher_era_a': {'era': 2.0}, 'pitcher_era_b': {'era': 3.0}
+    }
+
+    cache.delete()
+    assert cache.get('pitcher_era_a') is None
+
+
+def test_sqlite_backend_migrates_file_layout(tmp_path):
+    """Existing raw and envelope cache files are imported once on first open"""
+    os.makedirs(tmp_path / 'espn_direct')
+    with open(tmp_path / 'espn_direct' / 'espn_roster_bos.json', 'w') as f:
+        json.dump({'data': ['Chris Sale'], 'cache_time': time.time()}, f)
+    os.makedirs(tmp_path / 'mlb_stats')
+    with open(tmp_path / 'mlb_stats' / 'games_2025-04-16.json', 'w') as f:
+        json.dump([1, 2, 3], f)
+
+    db_path = str(tmp_path / 'cache.sqlite3')
+    engine = CacheEngine(backend='sqlite', db_path=db_path)
+    espn = engine.namespace('espn_direct', str(tmp_path / 'espn_direct'), layout='envelope')
+    stats = engine.namespace('mlb_stats', str(tmp_path / 'mlb_stats'))
+
+    assert espn.get('espn_roster_bos') == ['Chris Sale']
+    assert stats.get('games_2025-04-16') == [1, 2, 3]
+
+    # Deleting after migration must not resurrect the file contents
+    stats.delete('games_2025-04-16')
+    fresh = CacheEngine(backend='sqlite', db_path=db_path).namespace('mlb_stats', str(tmp_path / 'mlb_stats'))
+    assert fresh.get('games_2025-04-16') is None
+
+
+def test_negative_results_back_off_exponentially(tmp_path):
+    """Negative results are kept apart from real values and re-checked after a doubling interval"""
+    cache = CacheEngine(negative_ttl=60, negative_max_ttl=200).namespace('mlb_stats', str(tmp_path))
+    placeholder = {'era': 4.5, 'source': 'not-found'}
+
+    assert cache.set_negative('pitcher_era_x', placeholder) == 1
+    assert cache.get('pitcher_era_x') is None
+    assert cache.get_negative('pitcher_era_x') == (placeholder, 1)
+
+    assert cache.set_negative('pitcher_era_x', placeholder) == 2
+    assert [cache.negative_ttl(misses) for misses in (1, 2, 3, 4)] == [60, 120, 200, 200]
+
+    # Due for a re-check once the interval for the recorded misses has passed
+    old = time.time() - 130
+    os.utime(tmp_path / '_negative_pitcher_era_x.json', (old, old))
+    cache.engine.memory_clear(cache.cache_dir)
+    assert cache.get_negative('pitcher_era_x') is None
+    assert cache.backend.keys() == []
+
+    # A real value resets the backoff
+    cache.set('pitcher_era_x', {'era': 3.1})
+    cache.clear_negative('pitcher_era_x')
+    assert cache.set_negative('pitcher_era_x', placeholder) == 1
+
+
+def test_purge_reclaims_expired_and_retired_sqlite_rows(tmp_path):
+    """Rows past expiry plus the grace period go, as do never-expiring rows past retention"""
+    engine = CacheEngine(backend='sqlite', db_path=str(tmp_path / 'cache.sqlite3'))
+    cache = engine.namespace('mlb_stats', str(tmp_path / 'mlb_stats'))
+    now = time.time()
+    cache.load({
+        'games_2020-06-01': ([{'status': 'Final'}], now - 100 * 86400),
+        'games_2020-06-02': ([{'status': 'Final'}], now - 86400),
+        'team_stats_BOS': ({'team_era': 4.1}, now - 3 * 86400),
+        'team_stats_NYY': ({'team_era': 3.5}, now - 3600)
+    })
+
+    assert engine.purge_expired(grace=3600, retention=30 * 86400) == 2
+    assert sorted(cache.backend.keys()) == ['games_2020-06-02', 'team_stats_NYY']
+    assert CacheEngine().purge_expired() == 0
@@ -0,0 +1,148 @@
+import os
+import time
+import pytest
+from cache_engine import CacheEngine
+from cache_snapshot import export_snapshot, import_snapshot
+
+
+def test_snapshot_round_trip_keeps_store_times(tmp_path):
+    """A snapshot restores every carried namespace on an empty disk, with the original store times"""
+    source = CacheEngine()
+    stats = source.namespace('mlb_stats', str(tmp_path / 'old' / 'mlb_stats'))
+    predictions = source.namespace('predictions', str(tmp_path / 'old' / 'predictions'))
+    source.namespace('scheduler', str(tmp_path / 'old' / 'scheduler')).set('job_games', {'runs': 3})
+    stats.set('games_2025-06-01', [{'game_id': 1}])
+    predictions.set('all_predictions_v2_2025-06-01', {'games': [{'game_id': 1}]})
+    stored_at = stats.peek('games_2025-06-01')[1]
+
+    content = export_snapshot(source)
+
+    target = CacheEngine()
+    fresh_stats = target.namespace('mlb_stats', str(tmp_path / 'new' / 'mlb_stats'))
+    fresh_predictions = target.namespace('predictions', str(tmp_path / 'new' / 'predictions'))
+    scheduler = target.namespace('scheduler', str(tmp_path / 'new' / 'scheduler'))
+
+    assert import_snapshot(content, target)['imported'] == 2
+    assert fresh_stats.get('games_2025-06-01') == [{'game_id': 1}]
+    assert fresh_predictions.get('all_predictions_v2_2025-06-01') == {'games': [{'game_id': 1}]}
+    assert scheduler.get('job_games') is None
+
+    # Store times survive a trip through disk
+    assert abs(CacheEngine().namespace('mlb_stats', fresh_stats.cache_dir).peek('games_2025-06-01')[1] - stored_at) < 0.01
+
+
+def test_import_never_replaces_fresher_or_keeps_old_entries(tmp_path):
+    """Entries already cached more recently, or older than max_age, are skipped"""
+    source = CacheEngine()
+    old = source.namespace('mlb_stats', str(tmp_path / 'old'))
+    old.load({'games_2025-06-01': ([{'game_id': 1}], time.time() - 60), 'team_stats_NYY': ({'team_era': 3.5}, time.time() - 7200)})
+    content = export_snapshot(source)
+
+    target = CacheEngine()
+    cache = target.namespace('mlb_stats', str(tmp_path / 'new'))
+    cache.set('games_2025-06-01', [{'game_id': 2}])
+
+    result = import_snapshot(content, target, max_age=3600)
+    assert result == {'imported': 0, 'skipped': 2, 'created_at': result['created_at']}
+    assert cache.get('games_2025-06-01') == [{'game_id': 2}]
+
+
+def test_sqlite_backend_round_trip(tmp_path):
+    """Snapshots move entries between file and SQLite backends"""
+    source = CacheEngine()
+    source.namespace('predictions', str(tmp_path / 'files')).set('game_predictions_v2_2025-06-01_1', {'game_id': 1})
+
+    target = CacheEngine(backend='sqlite', db_path=str(tmp_path / 'cache.sqlite3'))
+    cache = target.namespace('predictions', str(tmp_path / 'db'))
+    import_snapshot(export_snapshot(source), target)
+
+    target.memory_clear(cache.cache_dir)
+    assert cache.get('game_predictions_v2_2025-06-01_1') == {'game_id': 1}
+    assert cache.backend.keys() == ['game_predictions_v2_2025-06-01_1']
+
+
+
+def test_imported_entries_keep_their_dependencies(tmp_path):
+    """Predictions restored from a snapshot are still invalidated when their inputs change"""
+    source = CacheEngine()
+    stats = source.namespace('mlb_stats', str(tmp_path / 'old' / 'mlb_stats'))
+    predictions = source.namespace('predictions', str(tmp_path / 'old' / 'predictions'))
+    stats.set('team_stats_NYY', {'team_era': 3.5})
+    predictions.set('game_predictions_v2_2025-06-01_1', {'game_id': 1}, depends_on=[stats.dependency_id('team_stats_NYY')])
+
+    target = CacheEngine()
+    fresh_stats = target.namespace('mlb_stats', str(tmp_path / 'new' / 'mlb_stats'))
+    fresh_predictions = target.namespace('predictions', str(tmp_path / 'new' / 'predictions'))
+    import_snapshot(export_snapshot(source), target)
+
+    fresh_stats.set('team_stats_NYY', {'team_era': 4.2})
+    assert fresh_predictions.get('game_predictions_v2_2025-06-01_1') is None
+
+
+def test_unknown_snapshots_are_rejected():
+    """Archives in another format or version are not loaded"""
+    import gzip
+    with pytest.raises(ValueError):
+        import_snapshot(gzip.compress(b'{"format": "mlb-cache-snapshot", "version": 99}'), CacheEngine())
+
+
+
+def test_malformed_snapshots_are_rejected_with_400(monkeypatch):
+    """Rows of the wrong shape are a bad request, and nothing from the snapshot is loaded"""
+    import gzip
+    import json
+    os.environ.setdefault('MLB_DISABLE_SCHEDULER', 'true')
+    import app as web_app
+    monkeypatch.setattr(web_app, 'SNAPSHOT_TOKEN', 'secret')
+
+    snapshot = {'format': 'mlb-cache-snapshot', 'version': 2, 'namespaces': {'mlb_stats': [
+        ['team_stats_NYY', time.time(), {'team_era': 3.5}, []],
+        ['team_stats_BOS', 'yesterday']
+    ]}}
+    response = web_app.app.test_client().post('/api/cache/snapshot', headers={'X-Snapshot-Token': 'secret'},
+                                               data=gzip.compress(json.dumps(snapshot).encode('utf-8')))
+    assert response.status_code == 400
+    with pytest.raises(ValueError):
+        import_snapshot(gzip.compress(b'[]'), CacheEngine())
+
+
+def test_snapshot_endpoints_are_disabled_without_a_token(monkeypatch):
+    """Without MLB_SNAPSHOT_TOKEN nobody can download or upload the cache"""
+    os.environ.setdefault('MLB_DISABLE_SCHEDULER', 'true')
+    import app as web_app
+    client = web_app.app.test_client()
+
+    monkeypatch.setattr(web_app, 'SNAPSHOT_TOKEN', None)
+    assert client.get('/api/cache/snapshot').status_code == 403
+    assert client.post('/api/cache/snapshot', data=b'').status_code == 403
+
+    monkeypatch.setattr(web_app, 'SNAPSHOT_TOKEN', 'secret')
+    assert client.get('/api/cache/snapshot', headers={'X-Snapshot-Token': 'wrong'}).status_code == 403
+    response = client.get('/api/cache/snapshot', headers={'X-Snapshot-Token': 'secret'})
+    assert response.status_code == 200
+    assert response.mimetype == 'application/gzip'
+
+
+
+def test_debug_endpoint_hides_the_snapshot_token(monkeypatch):
+    """/api/debug only lists the app's settings, and never the token's value"""
+    os.environ.setdefault('MLB_DISABLE_SCHEDULER', 'true')
+    import app as web_app
+    monkeypatch.setenv('MLB_SNAPSHOT_TOKEN', 'secret')
+    monkeypatch.setenv('DATABASE_PASSWORD', 'hunter2')
+
+    environment = web_app.app.test_client().get('/api/debug').get_json()['environment']
+    assert environment['MLB_SNAPSHOT_TOKEN'] == '<redacted>'
+    assert 'DATABASE_PASSWORD' not in environment
+    assert 'secret' not in environment.values()
+
+
+def test_negative_results_stay_out_of_sqlite_snapshots(tmp_path):
+    """Internal records such as negative results are never exported as data"""
+    source = CacheEngine(backend='sqlite', db_path=str(tmp_path / 'cache.sqlite3'))
+    cache = source.namespace('mlb_stats', str(tmp_path / 'mlb_stats'))
+    cache.set('team_stats_BOS', {'team_era': 4.1})
+    cache.set_negative('pitcher_era_BOS_Nobody', {'era': 4.5})
+
+    assert cache.backend.keys() == ['team_stats_BOS']
+    assert list(cache.entries()) == ['team_stats_BOS']
@@ -0,0 +1,89 @@
+import time
+import threading
+from cache_warmer import CacheWarmer
+
+DATES = ['2025-06-01', '2025-06-02', '2025-06-03', '2025-06-04', '2025-06-05']
+
+
+class FakePredictionAPI:
+    def __init__(self, delay=0.05, failing=()):
+        self.delay = delay
+        self.failing = failing
+        self.built = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def get_available_dates(self):
+        return [{'date': date, 'display': date} for date in DATES]
+
+    def get_all_predictions(self, force_refresh=False, target_date=None):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+            self.built.append(target_date)
+        if target_date in self.failing:
+            raise RuntimeError('upstream down')
+        return {'games': [{'game_id': 1}]}
+
+
+def test_warm_builds_every_advertised_date_with_bounded_concurrency():
+    """Every advertised date is built, at most `concurrency` at a time, and the worker turns ready"""
+    api = FakePredictionAPI(failing=('2025-06-03',))
+    warmer = CacheWarmer(api, concurrency=2)
+    assert not warmer.is_ready()
+
+    assert warmer.warm() is False
+
+    status = warmer.get_status()
+    assert sorted(api.built) == DATES
+    assert api.max_active == 2
+    assert warmer.is_ready()
+    assert status['dates']['2025-06-01']['state'] == 'warm'
+    assert status['dates']['2025-06-01']['game_count'] == 1
+    assert status['dates']['2025-06-03']['state'] == 'failed'
+    assert status['dates']['2025-06-03']['error'] == 'upstream down'
+    assert status['state'] == 'partial'
+    assert status['failed_dates'] == ['2025-06-03']
+
+
+def test_readiness_follows_todays_slate():
+    """The worker turns ready once today's slate is warm, and not at all while it fails"""
+    class SlowLaterDates(FakePredictionAPI):
+        def get_all_predictions(self, force_refresh=False, target_date=None):
+            if target_date != DATES[0]:
+                time.sleep(0.3)
+            return super().get_all_predictions(force_refresh, target_date)
+
+    warmer = CacheWarmer(SlowLaterDates(delay=0), concurrency=5)
+    warmer.start()
+    deadline = time.time() + 2
+    while not warmer.is_ready() and time.time() < deadline:
+        time.sleep(0.01)
+    assert warmer.is_ready()
+    assert warmer.get_status()['state'] == 'warming'
+
+    failing = CacheWarmer(FakePredictionAPI(delay=0, failing=(DATES[0],)), concurrency=5)
+    assert failing.warm() is False
+    assert not failing.is_ready()
+    assert failing.get_status()['failed_dates'] == [DATES[0]]
+
+
+def test_overlapping_warm_ups_run_once():
+    """A warm-up requested while one is running doesn't start a second pass"""
+    api = FakePredictionAPI(delay=0.2)
+    warmer = CacheWarmer(api, concurrency=5)
+
+    warmer.start()
+    time.sleep(0.05)
+    assert warmer.get_status()['state'] == 'warming'
+    assert warmer.warm() is False
+
+    deadline = time.time() + 2
+    while not warmer.is_ready() and time.time() < deadline:
+        time.sleep(0.01)
+    assert warmer.get_status()['passes'] == 1
+    assert len(api.built) == len(DATES)
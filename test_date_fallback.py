@@ -0,0 +1,53 @@
+import time
+import threading
+import mlb_prediction_api
+from mlb_prediction_api import MLBPredictionAPI
+
+SLATES = {'2025-06-02': [{'game_id': 7}], '2025-06-04': [{'game_id': 9}]}
+
+
+def fake_api(tmp_path, schedule, delay=0):
+    api = MLBPredictionAPI(cache_dir=str(tmp_path))
+    built = []
+    lock = threading.Lock()
+
+    def get_all_predictions(force_refresh=False, target_date=None):
+        with lock:
+            built.append(target_date)
+        time.sleep(delay)
+        return {'games': SLATES.get(target_date, []), 'metadata': {'date': target_date}}
+
+    api.get_all_predictions = get_all_predictions
+    api.mlb_stats_api.get_schedule_index = lambda start_date, end_date, force_refresh=False: schedule
+    return api, built
+
+
+def test_schedule_index_picks_the_fallback_date(tmp_path):
+    """Only the requested date and the indexed neighbour with games are built"""
+    api, built = fake_api(tmp_path, {'2025-06-02': 0, '2025-06-03': 0, '2025-06-04': 15})
+
+    predictions = api.get_predictions_with_fallback('2025-06-03')
+
+    assert predictions['metadata']['date'] == '2025-06-04'
+    assert built == ['2025-06-03', '2025-06-04']
+
+
+def test_candidates_are_built_concurrently_without_an_index(tmp_path):
+    """Without a schedule index both neighbours are built at once, preferring yesterday"""
+    api, built = fake_api(tmp_path, None, delay=0.3)
+
+    start = time.time()
+    predictions = api.get_predictions_with_fallback('2025-06-03')
+    elapsed = time.time() - start
+
+    assert predictions['metadata']['date'] == '2025-06-02'
+    assert sorted(built) == ['2025-06-02', '2025-06-03', '2025-06-04']
+    assert elapsed < 0.9
+
+
+def test_no_fallback_past_the_deadline(tmp_path, monkeypatch):
+    """Candidates still building at the deadline are skipped"""
+    monkeypatch.setattr(mlb_prediction_api, 'FALLBACK_DEADLINE', 0.05)
+    api, _ = fake_api(tmp_path, None, delay=0.2)
+
+    assert api.get_predictions_with_fallback('2025-06-10') is None
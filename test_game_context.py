@@ -0,0 +1,142 @@
+from mlb_prediction_api import MLBPredictionAPI
+from game_context import GAME_MARKET_KEYS, market_entries
+
+GAMES = [
+    {'game_id': 1, 'home_team': 'New York Yankees', 'away_team': 'Boston Red Sox', 'venue': 'Yankee Stadium',
+     'game_time': '19:05', 'home_pitcher': 'Gerrit Cole', 'away_pitcher': 'Chris Sale',
+     'home_era': 2.63, 'away_era': 3.84, 'home_era_source': 'MLB Stats API', 'away_era_source': 'MLB Stats API'},
+    {'game_id': 2, 'home_team': 'Los Angeles Dodgers', 'away_team': 'San Francisco Giants', 'venue': 'Dodger Stadium',
+     'game_time': '22:10', 'home_pitcher': 'Tyler Glasnow', 'away_pitcher': 'Logan Webb',
+     'home_era': 3.32, 'away_era': 3.25, 'home_era_source': 'MLB Stats API', 'away_era_source': 'MLB Stats API'}
+]
+
+TEAM_STATS = {name: {'team_name': name, 'team_era': 4.0} for game in GAMES for name in (game['home_team'], game['away_team'])}
+
+
+def test_game_entry_holds_every_market_once(tmp_path):
+    """Each game is serialized once, with its team stats and factors shared by all markets"""
+    api = MLBPredictionAPI(cache_dir=str(tmp_path))
+    game = api.build_game_predictions(GAMES[0], team_stats=TEAM_STATS)
+
+    assert game['home_team'] == 'New York Yankees'
+    assert game['stats_comparison']['teams']['home'] == TEAM_STATS['New York Yankees']
+    assert len(game['factors']) == 12
+    assert set(game['predictions']) == set(GAME_MARKET_KEYS.values())
+
+    nrfi = game['predictions']['under_1_run_first_inning']
+    assert nrfi['probability'] == api.calculate_first_inning_no_run_probability(2.63, 3.84, 'NYY', 'BOS')
+    assert nrfi['recommendation'] == nrfi['rating'] == api.get_rating(nrfi['probability'])
+    assert game['predictions']['over_2_5_runs_first_three_innings']['factor_direction'] == -1
+
+
+def test_market_entries_reference_games_by_id(tmp_path):
+    """Market lists rank games by probability and point back to them by game_id"""
+    api = MLBPredictionAPI(cache_dir=str(tmp_path))
+    games = [api.build_game_predictions(game, team_stats=TEAM_STATS) for game in GAMES]
+
+    entries = market_entries(games)
+    nrfi = entries['under_1_run_first_inning']
+
+    assert [entry['game_id'] for entry in nrfi] == [1, 2]
+    assert set(nrfi[0]) == {'game_id', 'probability', 'rating'}
+    assert nrfi[0]['probability'] >= nrfi[1]['probability']
+
+
+def test_factor_scores_are_reproducible(tmp_path):
+    """The same game gets the same factor breakdown on every cache miss and in every process"""
+    first = MLBPredictionAPI(cache_dir=str(tmp_path / 'a')).build_game_predictions(GAMES[0], team_stats=TEAM_STATS)
+    second = MLBPredictionAPI(cache_dir=str(tmp_path / 'b')).build_game_predictions(GAMES[0], team_stats=TEAM_STATS)
+
+    assert first['factors'] == second['factors']
+
+
+def test_pitcher_performance_scores_each_starter(tmp_path):
+    """Two 3.75 ERA starters score as 3.75 ERA pitchers, not as one 7.50 ERA pitcher"""
+    api = MLBPredictionAPI(cache_dir=str(tmp_path))
+    inputs = dict(api.factor_inputs({}, {}), home_pitcher_era=3.75, away_pitcher_era=3.75)
+    mixed = dict(inputs, home_pitcher_era=2.50, away_pitcher_era=5.00)
+
+    assert api.calculate_factor_scores(inputs)['pitcher_performance'] == 62.5
+    assert api.calculate_factor_scores(mixed)['pitcher_performance'] == (75 + 50) / 2
+
+
+def test_factor_scores_follow_their_inputs(tmp_path):
+    """Factor scores are derived from the venue and team stats, and cached per input version"""
+    api = MLBPredictionAPI(cache_dir=str(tmp_path))
+    hitters_park = api.factor_inputs({}, {}, venue='Coors Field')
+    pitchers_park = api.factor_inputs({}, {}, venue='Oracle Park')
+
+    assert api.calculate_factor_scores(hitters_park)['ballpark_factors'] < 50
+    assert api.calculate_factor_scores(pitchers_park)['ballpark_factors'] > 50
+    assert api.factor_inputs_version(hitters_park) != api.factor_inputs_version(pitchers_park)
+
+    weak_bullpens = {name: dict(stats, bullpen_era=6.0) for name, stats in TEAM_STATS.items()}
+    strong_bullpens = {name: dict(stats, bullpen_era=3.0) for name, stats in TEAM_STATS.items()}
+    weak = api.build_game_predictions(GAMES[0], team_stats=weak_bullpens)
+    strong = api.build_game_predictions(GAMES[0], team_stats=strong_bullpens)
+
+    def bullpen_score(game):
+        return next(factor['score'] for factor in game['factors'] if factor['factor'] == 'Bullpen Performance')
+
+    assert bullpen_score(strong) > bullpen_score(weak)
+
+
+def test_game_lookup_uses_the_game_index(tmp_path):
+    """Games of a built slate are found by ID (string or int) without rebuilding any slate"""
+    api = MLBPredictionAPI(cache_dir=str(tmp_path))
+    api.mlb_stats_api.get_games_for_date = lambda target_date, force_refresh=False: GAMES
+    api.get_slate_team_stats = lambda target_date, games, force_refresh=False: TEAM_STATS
+    api.get_all_predictions(target_date='2025-06-01')
+
+    built = []
+    api.get_all_predictions = lambda force_refresh=False, target_date=None: built.append(target_date) or {'games': []}
+
+    assert api.get_prediction_for_game_id('2')['home_team'] == 'Los Angeles Dodgers'
+    assert api.get_prediction_for_game_id(1)['game_id'] == 1
+    assert built == []
+
+    # An unknown game only looks at today's slate
+    assert api.get_prediction_for_game_id('999') is None
+    assert len(built) == 1
+
+    # A forced refresh rebuilds the game's own date
+    api.get_prediction_for_game_id('2', force_refresh=True)
+    assert built[-1] == '2025-06-01'
+
+
+def test_game_lookup_sees_invalidated_predictions(tmp_path):
+    """A pitcher ERA change evicts the game's predictions, and the lookup rebuilds them"""
+    api = MLBPredictionAPI(cache_dir=str(tmp_path))
+    slate = [dict(game) for game in GAMES]
+    api.mlb_stats_api.get_games_for_date = lambda target_date, force_refresh=False: slate
+    api.get_slate_team_stats = lambda target_date, games, force_refresh=False: TEAM_STATS
+    api.get_all_predictions(target_date='2025-06-01')
+    assert api.get_prediction_for_game_id('1')['home_pitcher'] == slate[0]['home_pitcher']
+
+    # The starter is scratched: the new ERA invalidates the game's predictions
+    stats_cache = api.mlb_stats_api.cache
+    era_key = api.mlb_stats_api.pitcher_era_cache_key(slate[0]['home_team'], slate[0]['home_pitcher'])
+    stats_cache.set(era_key, {'era': 1.0})
+    stats_cache.set(era_key, {'era': 9.0})
+    slate[0] = dict(slate[0], home_pitcher='Luis Gil', home_era=3.5)
+
+    assert api.get_prediction_for_game_id('1')['home_pitcher'] == 'Luis Gil'
+
+
+def test_stale_predictions_are_marked_on_a_copy(tmp_path):
+    """Marking a stale slate leaves the entry shared through the memory tier untouched"""
+    api = MLBPredictionAPI(cache_dir=str(tmp_path))
+    # Unfinished games, so the past slate keeps expiring
+    slate = [dict(game, status='Preview') for game in GAMES]
+    api.mlb_stats_api.get_games_for_date = lambda target_date, force_refresh=False: slate
+    api.get_slate_team_stats = lambda target_date, games, force_refresh=False: TEAM_STATS
+    api.get_all_predictions(target_date='2025-06-01')
+
+    cache_key = api.slate_cache_key('2025-06-01')
+    cached, stored_at = api.cache.peek(cache_key)
+    api.cache.backend.write(cache_key, cached, stored_at - 2 * api.cache.ttl)
+    api.cache.engine.memory_put(api.cache._memory_key(cache_key), cached, stored_at - 2 * api.cache.ttl)
+
+    served = api.get_all_predictions(target_date='2025-06-01')
+    assert served['metadata']['stale'] is True
+    assert cached['metadata']['stale'] is False
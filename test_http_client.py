@@ -0,0 +1,58 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from http_client import HTTPClient
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """Fails the first request to /flaky with a 503, then succeeds"""
+    protocol_version = 'HTTP/1.1'
+    calls = {}
+
+    def do_GET(self):
+        FlakyHandler.calls[self.path] = FlakyHandler.calls.get(self.path, 0) + 1
+        status = 503 if self.path == '/flaky' and FlakyHandler.calls[self.path] == 1 else 200
+        body = b'{"ok": true}'
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FlakyHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_client_records_per_host_stats():
+    """Every call is counted against its host with a latency histogram"""
+    server, base_url = start_server()
+    try:
+        client = HTTPClient(backoff=0)
+        for _ in range(3):
+            assert client.get(f"{base_url}/ok").json() == {'ok': True}
+
+        stats = client.get_stats()[base_url.split('//')[1]]
+        assert stats['requests'] == 3
+        assert stats['status_codes'] == {'200': 3}
+        assert sum(stats['latency_histogram'].values()) == 3
+    finally:
+        server.shutdown()
+
+
+def test_client_retries_transient_errors():
+    """A 503 is retried and the retry is reported in the host stats"""
+    server, base_url = start_server()
+    try:
+        client = HTTPClient(backoff=0)
+        response = client.get(f"{base_url}/flaky")
+
+        assert response.status_code == 200
+        assert FlakyHandler.calls['/flaky'] == 2
+        assert client.get_stats()[base_url.split('//')[1]]['retries'] == 1
+    finally:
+        server.shutdown()
@@ -0,0 +1,131 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from mlb_prediction_api import MLBPredictionAPI
+from inning_simulator import event_probabilities, simulate_slate, simulate_games, threshold_probabilities
+
+
+def test_event_probabilities_follow_era_and_ops():
+    """Rows sum to one, and worse pitchers or better lineups allow more baserunners"""
+    probabilities = event_probabilities([2.0, 4.2, 6.5, float('nan')], [0.720, 0.720, 0.720, 0.800])
+
+    assert np.allclose(probabilities.sum(axis=1), 1)
+    outs = probabilities[:, 0]
+    assert outs[0] > outs[1] > outs[2]
+    assert outs[3] < outs[1]
+
+
+def test_simulation_is_reproducible_and_independent_of_the_slate():
+    """A fixed seed gives the same result, whichever other games are simulated alongside"""
+    first = simulate_slate([3.1, 4.5], [4.0, 5.2], game_keys=[11, 12], trials=2000, seed=5)
+    second = simulate_slate([4.5], [5.2], game_keys=[12], trials=2000, seed=5)
+    reseeded = simulate_slate([4.5], [5.2], game_keys=[12], trials=2000, seed=6)
+
+    assert first.run_distribution(1) == second.run_distribution(0)
+    assert first.run_distribution(1) != reseeded.run_distribution(0)
+
+
+def test_any_threshold_is_priced_from_one_simulation():
+    """No-run and over probabilities come from the same distributions and move with pitcher quality"""
+    games = [
+        {'game_id': 1, 'home_team': 'A', 'away_team': 'B', 'home_era': 2.0, 'away_era': 2.2},
+        {'game_id': 2, 'home_team': 'C', 'away_team': 'D', 'home_era': 6.5, 'away_era': 6.0}
+    ]
+    simulation = simulate_games(games, trials=5000)
+
+    assert simulation.trials == 5000
+    assert abs(sum(simulation.run_distribution(0)) - 1) < 1e-9
+
+    nrfi = simulation.no_run_probabilities()
+    assert nrfi[0] > nrfi[1]
+
+    over_1_5 = simulation.over_probabilities(1.5)
+    over_2_5 = simulation.over_probabilities(2.5)
+    over_3_5 = simulation.over_probabilities(3.5)
+    assert np.all(over_1_5 >= over_2_5) and np.all(over_2_5 >= over_3_5)
+    assert over_2_5[1] > over_2_5[0]
+
+
+def test_threshold_lines_from_an_at_least_curve():
+    """Half-run lines split into over/under; whole-run lines can push"""
+    at_least = [1.0, 0.6, 0.3, 0.1, 0.0]
+
+    assert threshold_probabilities(at_least, 1.5) == {'over': 30.0, 'under': 70.0, 'push': 0.0}
+    assert threshold_probabilities(at_least, 2) == {'over': 10.0, 'under': 70.0, 'push': 20.0}
+    assert threshold_probabilities(at_least, 0.5)['under'] == 40.0
+    assert threshold_probabilities(at_least, 9.5) == {'over': 0.0, 'under': 100.0, 'push': 0.0}
+
+
+def test_markets_reuse_one_simulation_per_game(tmp_path, monkeypatch):
+    """Any thresholds and windows are answered from each game's cached distributions"""
+    api = MLBPredictionAPI(cache_dir=str(tmp_path))
+    games = [
+        {'game_id': 1, 'home_team': 'New York Yankees', 'away_team': 'Boston Red Sox', 'home_era': 2.63, 'away_era': 3.84},
+        {'game_id': 2, 'home_team': 'Colorado Rockies', 'away_team': 'Texas Rangers', 'home_era': 5.90, 'away_era': 4.70}
+    ]
+    api.mlb_stats_api.get_games_for_date = lambda target_date, force_refresh=False: games
+    api.mlb_stats_api.get_team_stats_bulk = lambda team_names, force_refresh=False: {}
+
+    simulated = []
+    monkeypatch.setattr('mlb_prediction_api.simulate_games',
+                        lambda slate, **kwargs: simulated.extend(slate) or simulate_games(slate, trials=2000, **kwargs))
+
+    markets = api.get_markets('2025-06-01', [0.5, 2.5], ['first_inning', 'full_game'])
+    again = api.get_markets('2025-06-01', [3.5, 8.5], ['first_3_innings', 'first_5_innings'])
+
+    assert len(simulated) == 2
+    assert set(markets['games'][0]['markets']) == {'first_inning', 'full_game'}
+    assert set(again['games'][1]['markets']['first_3_innings']) == {'3.5', '8.5'}
+    first_inning = markets['games'][0]['markets']['first_inning']['0.5']
+    assert abs(first_inning['over'] + first_inning['under'] - 100) < 0.01
+    assert markets['games'][1]['markets']['full_game']['2.5']['over'] > markets['games'][1]['markets']['first_inning']['2.5']['over']
+
+
+def test_concurrent_requests_share_one_simulation(tmp_path, monkeypatch):
+    """Requests arriving during a cold simulation wait for it instead of repeating it"""
+    api = MLBPredictionAPI(cache_dir=str(tmp_path))
+    games = [{'game_id': 1, 'home_team': 'New York Yankees', 'away_team': 'Boston Red Sox', 'home_era': 2.63, 'away_era': 3.84}]
+    api.mlb_stats_api.get_games_for_date = lambda target_date, force_refresh=False: games
+    api.mlb_stats_api.get_team_stats_bulk = lambda team_names, force_refresh=False: {}
+
+    simulated = []
+
+    def slow_simulation(slate, **kwargs):
+        simulated.extend(slate)
+        time.sleep(0.2)
+        return simulate_games(slate, trials=2000, **kwargs)
+
+    monkeypatch.setattr('mlb_prediction_api.simulate_games', slow_simulation)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: api.get_run_distributions('2025-06-01'), range(4)))
+
+    assert len(simulated) == 1
+    assert all(result == results[0] for result in results)
+
+
+def test_predictions_price_run_lines_from_one_batch(tmp_path, monkeypatch):
+    """Missing games are simulated together, and the over markets match /api/markets"""
+    api = MLBPredictionAPI(cache_dir=str(tmp_path))
+    games = [
+        {'game_id': 1, 'home_team': 'New York Yankees', 'away_team': 'Boston Red Sox', 'home_era': 2.63, 'away_era': 3.84},
+        {'game_id': 2, 'home_team': 'Colorado Rockies', 'away_team': 'Texas Rangers', 'home_era': 5.90, 'away_era': 4.70},
+        {'game_id': 3, 'home_team': 'Seattle Mariners', 'away_team': 'Houston Astros', 'home_era': 3.10, 'away_era': 3.40}
+    ]
+    api.mlb_stats_api.get_games_for_date = lambda target_date, force_refresh=False: games
+    api.mlb_stats_api.get_team_stats_bulk = lambda team_names, force_refresh=False: {}
+    api.get_slate_team_stats = lambda target_date, games, force_refresh=False: {}
+
+    batches = []
+    monkeypatch.setattr('mlb_prediction_api.simulate_games',
+                        lambda slate, **kwargs: batches.append(len(slate)) or simulate_games(slate, trials=2000, **kwargs))
+
+    # One game is already cached; the other two are simulated in one batch
+    api.get_game_run_distributions(games[:1], {})
+    predictions = api.build_predictions('2025-06-01')
+    markets = api.get_markets('2025-06-01', [2.5, 3.5], ['first_3_innings'])
+
+    assert batches == [1, 2]
+    for game, priced in zip(predictions['games'], markets['games']):
+        lines = priced['markets']['first_3_innings']
+        assert game['predictions']['over_2_5_runs_first_three_innings']['probability'] == lines['2.5']['over']
+        assert game['predictions']['over_3_5_runs_first_three_innings']['probability'] == lines['3.5']['over']
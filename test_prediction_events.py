@@ -0,0 +1,146 @@
+from mlb_prediction_api import MLBPredictionAPI
+from prediction_events import PredictionBroadcaster, SharedEventLog, stream_events
+
+GAMES = [
+    {'game_id': 1, 'home_team': 'New York Yankees', 'away_team': 'Boston Red Sox', 'venue': 'Yankee Stadium',
+     'home_pitcher': 'Gerrit Cole', 'away_pitcher': 'Chris Sale', 'home_era': 2.63, 'away_era': 3.84},
+    {'game_id': 2, 'home_team': 'Los Angeles Dodgers', 'away_team': 'San Francisco Giants', 'venue': 'Dodger Stadium',
+     'home_pitcher': 'Tyler Glasnow', 'away_pitcher': 'Logan Webb', 'home_era': 3.32, 'away_era': 3.25}
+]
+
+
+def test_subscribers_get_their_date_and_missed_events():
+    """Events are filtered by date, and reconnecting clients receive what they missed"""
+    broadcaster = PredictionBroadcaster()
+    today = broadcaster.subscribe('2025-06-01')
+    first = broadcaster.publish('predictions', {'date': '2025-06-01', 'games': []})
+    broadcaster.publish('predictions', {'date': '2025-06-02', 'games': []})
+
+    assert today.next_event(0.1)['id'] == first
+    assert today.next_event(0.01) is None
+
+    reconnected = broadcaster.subscribe(last_event_id=first)
+    assert reconnected.next_event(0.1)['data']['date'] == '2025-06-02'
+
+
+def test_stream_is_sse_formatted():
+    """The stream opens with a retry hint, then sends events with id, name and JSON data"""
+    broadcaster = PredictionBroadcaster()
+    subscription = broadcaster.subscribe()
+    broadcaster.publish('predictions', {'date': '2025-06-01', 'games': [{'game_id': 1}]})
+
+    chunks = stream_events(subscription, heartbeat=0.01)
+    assert next(chunks).startswith('retry:')
+    assert next(chunks) == 'id: 1\nevent: predictions\ndata: {"date": "2025-06-01", "games": [{"game_id": 1}]}\n\n'
+    assert next(chunks) == ': keep-alive\n\n'
+    chunks.close()
+    assert broadcaster.get_stats()['subscribers'] == 0
+
+
+def test_rebuilds_publish_only_changed_games(tmp_path):
+    """A slate rebuild pushes the games whose predictions changed, and nothing when none did"""
+    api = MLBPredictionAPI(cache_dir=str(tmp_path))
+    api.events = PredictionBroadcaster()
+    slate = [dict(game) for game in GAMES]
+    api.mlb_stats_api.get_games_for_date = lambda target_date, force_refresh=False: slate
+    api.get_slate_team_stats = lambda target_date, games, force_refresh=False: {
+        game[side]: {'team_name': game[side]} for game in games for side in ('home_team', 'away_team')
+    }
+    subscription = api.events.subscribe('2025-06-01')
+
+    api.build_predictions('2025-06-01')
+    assert [game['game_id'] for game in subscription.next_event(0.1)['data']['games']] == [1, 2]
+
+    api.build_predictions('2025-06-01', force_refresh=True)
+    assert subscription.next_event(0.01) is None
+
+    # A pitcher change only touches that game
+    slate[1] = dict(slate[1], home_pitcher='Clayton Kershaw', home_era=2.10)
+    api.build_predictions('2025-06-01', force_refresh=True)
+    changed = subscription.next_event(0.1)['data']['games']
+    assert [game['game_id'] for game in changed] == [2]
+    assert changed[0]['fields']['home_pitcher'] == 'Clayton Kershaw'
+    assert 'away_pitcher' not in changed[0]['fields']
+    assert 'stats_comparison' not in changed[0]['fields']
+
+    # So does a game going final, with just its status
+    slate[0] = dict(slate[0], status='Final')
+    api.build_predictions('2025-06-01', force_refresh=True)
+    changed = subscription.next_event(0.1)['data']['games']
+    assert [(game['game_id'], game['fields']) for game in changed] == [(1, {'status': 'Final'})]
+
+
+def test_reconnect_after_more_missed_events_than_the_buffer_holds():
+    """A long replay is trimmed to the newest events instead of blocking the broadcaster"""
+    broadcaster = PredictionBroadcaster(replay_events=100)
+    for i in range(80):
+        broadcaster.publish('predictions', {'date': '2025-06-01', 'games': [], 'n': i})
+
+    subscription = broadcaster.subscribe(last_event_id=0)
+    assert subscription.next_event(0.1)['data']['n'] == 30
+
+    # Publishing still works, and reaches the reconnected client
+    broadcaster.publish('predictions', {'date': '2025-06-01', 'games': [], 'n': 80})
+    assert not subscription.closed
+    assert broadcaster.get_stats()['subscribers'] == 1
+    assert broadcaster.get_stats()['last_event_id'] == 81
+
+
+def test_events_reach_subscribers_on_other_workers(tmp_path):
+    """Broadcasters sharing a log deliver each other's events, with IDs that agree across workers"""
+    first = PredictionBroadcaster(log=SharedEventLog(str(tmp_path)), poll_interval=0.01)
+    second = PredictionBroadcaster(log=SharedEventLog(str(tmp_path)), poll_interval=0.01)
+    subscription = second.subscribe('2025-06-01')
+
+    event_id = first.publish('predictions', {'date': '2025-06-01', 'games': [{'game_id': 1}]})
+    second.publish('predictions', {'date': '2025-06-01', 'games': [{'game_id': 2}]})
+
+    assert subscription.next_event(1)['id'] == event_id
+    assert subscription.next_event(1)['id'] == event_id + 1
+
+    # A client reconnecting to the first worker resumes after the second worker's event
+    resumed = first.subscribe(last_event_id=event_id)
+    assert resumed.next_event(0.1)['data']['games'] == [{'game_id': 2}]
+
+
+
+def test_idle_polls_skip_reading_the_log(tmp_path):
+    """Polling reads only the log's head until another worker appends"""
+    log = SharedEventLog(str(tmp_path))
+    broadcaster = PredictionBroadcaster(log=log, poll_interval=60)
+    subscription = broadcaster.subscribe('2025-06-01')
+    reads = []
+    read = log.read
+    log.read = lambda: reads.append(1) or read()
+
+    broadcaster.sync()
+    assert reads == []
+
+    SharedEventLog(str(tmp_path)).append('predictions', {'date': '2025-06-01', 'games': []})
+    broadcaster.sync()
+    assert len(reads) == 1
+    assert subscription.next_event(0.1)['id'] == 1
+
+
+def test_subscribers_are_capped_per_worker():
+    """Streams beyond max_subscribers are refused so request threads stay available"""
+    broadcaster = PredictionBroadcaster(max_subscribers=2)
+    first = broadcaster.subscribe()
+    broadcaster.subscribe()
+
+    assert broadcaster.subscribe() is None
+    first.close()
+    assert broadcaster.subscribe() is not None
+
+
+def test_full_worker_sends_a_retry_hint(monkeypatch):
+    """A client turned away gets a stream telling it when to reconnect, not an error EventSource gives up on"""
+    import os
+    os.environ.setdefault('MLB_DISABLE_SCHEDULER', 'true')
+    import app as web_app
+    monkeypatch.setattr(web_app, 'get_prediction_broadcaster', lambda: PredictionBroadcaster(max_subscribers=0))
+
+    response = web_app.app.test_client().get('/api/predictions/stream')
+    assert response.status_code == 200
+    assert response.mimetype == 'text/event-stream'
+    assert response.get_data(as_text=True) == 'retry: 60000\nevent: busy\ndata: {"retry": 60}\n\n'
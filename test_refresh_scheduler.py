@@ -0,0 +1,142 @@
+import os
+import time
+import threading
+from refresh_scheduler import RefreshScheduler, REFRESH_RETENTION
+
+
+def test_run_job_records_status(tmp_path):
+    """Running a job records its run count, duration and errors"""
+    scheduler = RefreshScheduler(str(tmp_path))
+    calls = []
+    scheduler.add_job('games', 60, lambda: calls.append(1))
+
+    def fail():
+        raise RuntimeError('upstream down')
+    scheduler.add_job('team_stats', 60, fail)
+
+    assert scheduler.run_all() == {'games': True, 'team_stats': False}
+
+    status = scheduler.get_status()['jobs']
+    assert calls == [1]
+    assert status['games']['runs'] == 1
+    assert status['games']['last_error'] is None
+    assert status['team_stats']['failures'] == 1
+    assert status['team_stats']['last_error'] == 'upstream down'
+
+
+def test_job_runs_once_per_cadence_across_workers(tmp_path):
+    """A second scheduler sharing the state directory skips a job that just ran"""
+    calls = []
+    first = RefreshScheduler(str(tmp_path))
+    second = RefreshScheduler(str(tmp_path))
+    first.add_job('games', 60, lambda: calls.append('first'))
+    second.add_job('games', 60, lambda: calls.append('second'))
+
+    assert first.run_job('games')
+    assert not second.run_job('games')
+    assert calls == ['first']
+    assert second.jobs['games'].next_run > time.time()
+
+
+def test_background_thread_runs_due_jobs(tmp_path):
+    """Started schedulers run every job without being asked"""
+    scheduler = RefreshScheduler(str(tmp_path))
+    calls = []
+    scheduler.add_job('predictions', 60, lambda: calls.append(1))
+
+    scheduler.start()
+    deadline = time.time() + 2
+    while not calls and time.time() < deadline:
+        time.sleep(0.01)
+    scheduler.stop()
+
+    assert calls == [1]
+    assert scheduler.get_status()['jobs']['predictions']['runs'] == 1
+
+
+def wait_for_refresh(scheduler, job_id, timeout=2):
+    deadline = time.time() + timeout
+    status = scheduler.get_refresh(job_id)
+    while status['state'] in ('queued', 'running') and time.time() < deadline:
+        time.sleep(0.01)
+        status = scheduler.get_refresh(job_id)
+    return status
+
+
+def test_refresh_runs_in_background_with_stage_progress(tmp_path):
+    """A refresh returns a job ID at once and reports each stage's outcome and timing"""
+    scheduler = RefreshScheduler(str(tmp_path))
+    release = threading.Event()
+    scheduler.add_job('games', 60, release.wait)
+
+    def fail():
+        raise RuntimeError('upstream down')
+    scheduler.add_job('team_stats', 60, fail)
+
+    job = scheduler.submit_refresh()
+    assert job['state'] in ('queued', 'running')
+    assert [stage['name'] for stage in job['stages']] == ['games', 'team_stats']
+
+    release.set()
+    status = wait_for_refresh(scheduler, job['job_id'])
+    assert status['state'] == 'failed'
+    assert status['progress'] == {'completed': 2, 'total': 2}
+    assert status['stages'][0]['state'] == 'succeeded'
+    assert status['stages'][0]['duration'] is not None
+    assert status['stages'][1]['error'] == 'upstream down'
+
+
+def test_duplicate_refreshes_collapse_across_workers(tmp_path):
+    """Refresh requests made while one is running join it, even from another worker"""
+    release = threading.Event()
+    first = RefreshScheduler(str(tmp_path))
+    second = RefreshScheduler(str(tmp_path))
+    calls = []
+    first.add_job('games', 60, lambda: calls.append(1) or release.wait())
+    second.add_job('games', 60, lambda: calls.append(2))
+
+    job = first.submit_refresh()
+    assert first.submit_refresh()['job_id'] == job['job_id']
+    assert second.submit_refresh()['job_id'] == job['job_id']
+
+    release.set()
+    assert wait_for_refresh(second, job['job_id'])['state'] == 'succeeded'
+    assert calls == [1]
+    assert first.submit_refresh()['job_id'] != job['job_id']
+
+
+def test_refresh_joins_a_job_already_running(tmp_path):
+    """A refresh stage waits for the periodic run of its job instead of failing"""
+    scheduler = RefreshScheduler(str(tmp_path))
+    started, release = threading.Event(), threading.Event()
+    calls = []
+    scheduler.add_job('games', 60, lambda: calls.append(1) or started.set() or release.wait())
+
+    periodic = threading.Thread(target=scheduler.run_job, args=('games',))
+    periodic.start()
+    started.wait(1)
+
+    job = scheduler.submit_refresh()
+    time.sleep(0.2)
+    release.set()
+    periodic.join()
+
+    status = wait_for_refresh(scheduler, job['job_id'])
+    assert status['state'] == 'succeeded'
+    assert status['stages'][0]['state'] == 'joined'
+    assert calls == [1]
+
+
+def test_old_refresh_statuses_are_pruned(tmp_path):
+    scheduler = RefreshScheduler(str(tmp_path))
+    scheduler.add_job('games', 60, lambda: None)
+    old = scheduler.submit_refresh()
+    wait_for_refresh(scheduler, old['job_id'])
+
+    scheduler.cache.engine.memory_clear(scheduler.cache.cache_dir)
+    stale = time.time() - REFRESH_RETENTION - 60
+    os.utime(tmp_path / f"refresh_{old['job_id']}.json", (stale, stale))
+
+    new = scheduler.submit_refresh()
+    assert scheduler.cache.peek(f"refresh_{old['job_id']}") is None
+    assert scheduler.cache.peek(f"refresh_{new['job_id']}") is not None
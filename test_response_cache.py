@@ -0,0 +1,81 @@
+import os
+import gzip
+import json
+
+os.environ.setdefault('MLB_DISABLE_SCHEDULER', 'true')
+
+import app as web_app
+from mlb_prediction_api import PAYLOAD_VERSION
+from response_cache import ResponseCache, brotli, serialize
+
+PAYLOAD = {'games': [{'game_id': i, 'home_team': 'New York Yankees', 'away_team': 'Boston Red Sox'} for i in range(40)],
+           'metadata': {'date': '2025-06-01', 'timestamp': 1748736000.0}}
+
+
+def test_payload_is_encoded_once_per_content():
+    """Copies of a payload reuse its encodings; a changed payload is encoded again"""
+    cache = ResponseCache()
+    first = cache.get(('predictions', '2025-06-01'), PAYLOAD)
+
+    assert cache.get(('predictions', '2025-06-01'), json.loads(json.dumps(PAYLOAD))) is first
+    assert json.loads(first.body) == PAYLOAD
+    assert json.loads(gzip.decompress(first.encodings['gzip'])) == PAYLOAD
+    if brotli is not None:
+        assert brotli.decompress(first.encodings['br']) == first.body
+        assert first.negotiate(['gzip', 'br'])[1] == 'br'
+
+    changed = dict(PAYLOAD, games=PAYLOAD['games'][:10])
+    rebuilt = cache.get(('predictions', '2025-06-01'), changed)
+    assert rebuilt is not first
+    assert rebuilt.etag != first.etag
+    assert cache.get_stats()['encodes'] == 2
+
+
+def test_versioned_payloads_skip_serialization():
+    """A payload carrying the version of the encoded one is served without re-encoding"""
+    cache = ResponseCache()
+    first = cache.get(('predictions', '2025-06-01'), PAYLOAD, version=(1748736000.0, False))
+
+    assert cache.get(('predictions', '2025-06-01'), object(), version=(1748736000.0, False)) is first
+    assert cache.get(('predictions', '2025-06-01'), PAYLOAD, version=(1748736000.0, True)) is not first
+    assert cache.get_stats()['encodes'] == 2
+
+
+def test_predictions_endpoint_answers_revalidation_with_304(monkeypatch):
+    """Responses carry validators and caching headers, and a matching If-None-Match gets no body"""
+    monkeypatch.setattr(web_app.mlb_prediction_api, 'get_predictions_with_fallback',
+                        lambda target_date, force_refresh=False: PAYLOAD)
+    client = web_app.app.test_client()
+
+    response = client.get('/api/predictions?date=2025-06-01', headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert json.loads(gzip.decompress(response.data)) == PAYLOAD
+    assert 'max-age' in response.headers['Cache-Control']
+    assert response.headers['Last-Modified'] == 'Sun, 01 Jun 2025 00:00:00 GMT'
+    etag = response.headers['ETag']
+
+    revalidated = client.get('/api/predictions?date=2025-06-01', headers={'If-None-Match': etag})
+    assert revalidated.status_code == 304
+    assert revalidated.data == b''
+
+
+def test_game_endpoint_is_versioned_by_its_cache_entry(tmp_path, monkeypatch):
+    """A cached game is served by its entry's store time, without serializing it per request"""
+    api = web_app.MLBPredictionAPI(cache_dir=str(tmp_path))
+    api.game_index.set(api.game_index_key(7), {'date': '2025-06-01'})
+    api.cache.set(api.game_predictions_cache_key('2025-06-01', 7), PAYLOAD['games'][7])
+    monkeypatch.setattr(web_app, 'mlb_prediction_api', api)
+    serialized = []
+    monkeypatch.setattr('response_cache.serialize', lambda data: serialized.append(data) or serialize(data))
+    client = web_app.app.test_client()
+
+    prediction, version = api.get_versioned_prediction('7')
+    assert prediction == PAYLOAD['games'][7]
+    assert version[0] == PAYLOAD_VERSION
+
+    first = client.get('/api/prediction/7')
+    again = client.get('/api/prediction/7')
+    assert json.loads(first.data) == PAYLOAD['games'][7]
+    assert again.headers['ETag'] == first.headers['ETag']
+    assert len(serialized) == 1
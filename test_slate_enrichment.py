@@ -0,0 +1,167 @@
+import time
+import threading
+from mlb_stats_api import MLBStatsAPI
+
+
+def test_team_stats_bulk_dedupes_and_runs_concurrently(tmp_path):
+    """Each distinct team is fetched once, and fetches overlap"""
+    api = MLBStatsAPI(cache_dir=str(tmp_path))
+    calls = []
+    lock = threading.Lock()
+
+    def get_team_stats(team_name, force_refresh=False):
+        with lock:
+            calls.append(team_name)
+        time.sleep(0.2)
+        return {'team_name': team_name}
+
+    api.get_team_stats = get_team_stats
+    teams = ['Team %d' % (i % 6) for i in range(12)]
+
+    start = time.time()
+    stats = api.get_team_stats_bulk(teams)
+    elapsed = time.time() - start
+
+    assert sorted(calls) == sorted(set(teams))
+    assert stats['Team 3'] == {'team_name': 'Team 3'}
+    assert elapsed < 0.6
+
+
+def test_pitcher_eras_keyed_by_team_and_pitcher(tmp_path):
+    """Pitcher ERA lookups are deduplicated per (team, pitcher) pair"""
+    api = MLBStatsAPI(cache_dir=str(tmp_path))
+    calls = []
+    api.get_pitcher_era = lambda team, pitcher, force_refresh=False: calls.append((team, pitcher)) or {'era': 3.0}
+
+    eras = api.get_pitcher_eras([('NYY', 'Cole'), ('BOS', 'Sale'), ('NYY', 'Cole')])
+
+    assert len(calls) == 2
+    assert eras[('BOS', 'Sale')] == {'era': 3.0}
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    def json(self):
+        return self.payload
+
+
+def test_pitcher_eras_use_one_bulk_people_request(tmp_path):
+    """Pitchers with IDs are fetched in one /people call and cached individually"""
+    api = MLBStatsAPI(cache_dir=str(tmp_path))
+    urls = []
+
+    class FakeHTTP:
+        def get(self, url, **kwargs):
+            urls.append(url)
+            return FakeResponse({'people': [
+                {'id': 543037, 'stats': [{'splits': [{'stat': {'era': '2.63'}}]}]},
+                {'id': 519242, 'stats': [{'splits': [{'stat': {'era': '3.84'}}]}]}
+            ]})
+
+    api.http = FakeHTTP()
+    eras = api.get_pitcher_eras(
+        [('New York Yankees', 'Gerrit Cole'), ('Boston Red Sox', 'Chris Sale')],
+        pitcher_ids={('New York Yankees', 'Gerrit Cole'): 543037, ('Boston Red Sox', 'Chris Sale'): 519242},
+        season='2025'
+    )
+
+    assert len(urls) == 1
+    assert 'personIds=543037,519242' in urls[0]
+    assert eras[('New York Yankees', 'Gerrit Cole')]['era'] == 2.63
+    assert api.get_pitcher_era('Boston Red Sox', 'Chris Sale') == {
+        'era': 3.84, 'source': 'MLB Stats API', 'method': 'bulk-people'
+    }
+
+
+def test_team_stats_served_from_one_league_snapshot(tmp_path):
+    """Every team's stats come from a single /teams/stats request"""
+    api = MLBStatsAPI(cache_dir=str(tmp_path))
+    urls = []
+
+    class FakeHTTP:
+        def get(self, url, **kwargs):
+            urls.append(url)
+            return FakeResponse({'stats': [
+                {'group': {'displayName': 'pitching'}, 'splits': [
+                    {'team': {'id': 147}, 'stat': {'era': '3.50', 'whip': '1.20', 'strikeOuts': 600, 'baseOnBalls': 180}},
+                    {'team': {'id': 111}, 'stat': {'era': '4.10', 'whip': '1.31', 'strikeOuts': 550, 'baseOnBalls': 210}}
+                ]},
+                {'group': {'displayName': 'hitting'}, 'splits': [
+                    {'team': {'id': 147}, 'stat': {'runs': 400, 'ops': '.760', 'gamesPlayed': 90}}
+                ]}
+            ]})
+
+    api.http = FakeHTTP()
+    stats = api.get_team_stats_bulk(['New York Yankees', 'Boston Red Sox', 'New York Yankees'])
+
+    assert len(urls) == 1
+    assert '/teams/stats?' in urls[0]
+    assert stats['New York Yankees']['team_era'] == 3.5
+    assert stats['New York Yankees']['team_ops'] == 0.76
+    assert stats['Boston Red Sox']['bullpen_era'] == 4.6
+    assert len(api.get_league_team_stats()['version']) == 12
+
+
+def test_unknown_pitcher_is_not_searched_again_until_rechecked(tmp_path):
+    """A pitcher the API can't find gets a negative result instead of a cached default ERA"""
+    api = MLBStatsAPI(cache_dir=str(tmp_path))
+    urls = []
+
+    class FakeHTTP:
+        def get(self, url, **kwargs):
+            urls.append(url)
+            return FakeResponse({'people': []})
+
+    api.http = FakeHTTP()
+    first = api.get_pitcher_era('New York Yankees', 'Nobody Known')
+    eras = api.get_pitcher_eras([('New York Yankees', 'Nobody Known')])
+
+    assert len(urls) == 1
+    assert first['method'] == 'default-value'
+    assert eras[('New York Yankees', 'Nobody Known')] == first
+    assert api.get_cached_data(api.pitcher_era_cache_key('New York Yankees', 'Nobody Known')) is None
+
+    # A forced refresh searches again and counts another miss
+    api.get_pitcher_era('New York Yankees', 'Nobody Known', force_refresh=True)
+    assert len(urls) == 2
+    assert api.cache.get_negative(api.pitcher_era_cache_key('New York Yankees', 'Nobody Known'))[1] == 2
+
+
+
+def test_scheduled_refresh_keeps_the_negative_result_backoff(tmp_path):
+    """The periodic ERA refresh skips pitchers not due for a re-check; a forced lookup doesn't"""
+    api = MLBStatsAPI(cache_dir=str(tmp_path))
+    urls = []
+
+    class FakeHTTP:
+        def get(self, url, **kwargs):
+            urls.append(url)
+            return FakeResponse({'people': []})
+
+    api.http = FakeHTTP()
+    api.get_games = lambda date_str, force_refresh=False: [
+        {'game_id': 1, 'home_team': 'New York Yankees', 'away_team': 'Boston Red Sox',
+         'home_pitcher': 'Nobody Known', 'away_pitcher': 'TBD'}
+    ]
+    api.get_pitcher_era('New York Yankees', 'Nobody Known')
+
+    api.refresh_pitcher_eras('2025-06-01')
+    assert len(urls) == 1
+
+    api.get_pitcher_eras([('New York Yankees', 'Nobody Known')], force_refresh=True)
+    assert len(urls) == 2
+
+
+def test_sample_games_are_copied_per_date(tmp_path):
+    """Dating the sample games for one slate doesn't rewrite another slate's games"""
+    api = MLBStatsAPI(cache_dir=str(tmp_path))
+    first = api.get_sample_games_for_date('2025-06-01')
+    second = api.get_sample_games_for_date('2025-06-02')
+
+    assert {game['date'] for game in first} == {'2025-06-01'}
+    assert {game['date'] for game in second} == {'2025-06-02'}
+    assert all('date' not in game for game in api.sample_games)
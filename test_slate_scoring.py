@@ -0,0 +1,50 @@
+import random
+from mlb_prediction_api import MLBPredictionAPI
+from slate_scoring import score_slate, to_float_array, pitcher_performance_scores
+
+
+def scalar_api():
+    # The scalar calculators don't touch instance state
+    return MLBPredictionAPI.__new__(MLBPredictionAPI)
+
+
+def test_vectorized_markets_match_scalar_functions():
+    """The pitcher-score market's probability and rating match the per-game scalar code"""
+    api = scalar_api()
+    rng = random.Random(7)
+    eras = [round(rng.uniform(0, 12), 2) for _ in range(200)] + [None, 'N/A', '3.45', 'bad', 0, 10.0]
+    home = eras
+    away = list(reversed(eras))
+
+    results = score_slate(home, away)
+
+    for i, (home_era, away_era) in enumerate(zip(home, away)):
+        nrfi = api.calculate_first_inning_no_run_probability(home_era, away_era, 'H', 'A')
+
+        assert results['under_1_run_first_inning']['probability'][i] == nrfi
+        assert results['under_1_run_first_inning']['rating'][i] == api.get_rating(nrfi)
+
+    # Run lines are priced from the simulator, not scored here
+    assert set(results) == {'under_1_run_first_inning'}
+
+
+def test_vectorized_pitcher_score_with_extra_stats():
+    """WHIP, strikeouts and innings are used only when all are present, as in the scalar code"""
+    api = scalar_api()
+    rows = [
+        (3.2, 1.1, 180, 170.1),
+        (4.5, '1.35', '150', '160'),
+        (2.9, None, 200, 180),
+        (5.1, 1.4, 0, 100),
+        ('N/A', 1.2, 100, 90),
+        (3.8, 'bad', 120, 110),
+        (3.0, 1.0, 90, '0')
+    ]
+
+    scores = pitcher_performance_scores(
+        to_float_array([row[0] for row in rows]),
+        *(to_float_array([row[j] for row in rows], falsy_missing=True) for j in (1, 2, 3))
+    )
+
+    for score, row in zip(scores, rows):
+        assert score == api.calculate_pitcher_performance_score(*row)
@@ -0,0 +1,25 @@
+from team_registry import TEAMS, get_team
+
+
+def test_every_identifier_resolves_to_one_record():
+    """Names, abbreviations, source IDs and aliases all map to the same team"""
+    yankees = get_team('New York Yankees')
+    for key in ('NYY', 'nyy', 147, '147', 'Yankees', 'NY Yankees'):
+        assert get_team(key) is yankees
+
+    assert get_team('KCR') is get_team('Kansas City Royals')
+    assert get_team('St Louis Cardinals') is get_team('St. Louis Cardinals')
+    assert get_team('Athletics').mlb_id == 133
+
+
+def test_ambiguous_and_unknown_keys_are_not_matched():
+    """Shared cities and unknown names return None instead of a guess"""
+    assert get_team('Chicago') is None
+    assert get_team('New York') is None
+    assert get_team('Springfield Isotopes') is None
+    assert get_team(None) is None
+
+
+def test_registry_covers_the_league():
+    assert len(TEAMS) == 30
+    assert len({team.mlb_id for team in TEAMS}) == 30
@@ -0,0 +1,78 @@
+import os
+import time
+from datetime import date, timedelta
+from cache_engine import CacheEngine
+from ttl_policy import TTLPolicy, game_state, key_date, SEASON_TTL, UPCOMING_TTL
+
+TODAY = date(2025, 6, 15)
+
+
+def test_game_state_of_records_and_slates():
+    """A slate is only final once every game on it is"""
+    assert game_state({'game_id': 1, 'status': 'Final'}) == 'final'
+    assert game_state([{'status': 'Final'}, {'status': 'Live'}]) == 'live'
+    assert game_state([{'status': 'Final'}, {'status': 'Preview'}]) == 'pregame'
+    assert game_state({'games': [{'status': 'Game Over'}]}) == 'final'
+    assert game_state({'games': [{'game_id': 1}]}) is None
+    assert game_state([]) is None
+
+
+def test_key_date_uses_the_last_date_in_the_key():
+    assert key_date('games_2025-06-01') == date(2025, 6, 1)
+    assert key_date('schedule_index_2025-06-01_2025-06-07') == date(2025, 6, 7)
+    assert key_date('team_stats_New York Yankees') is None
+
+
+def test_classify_by_date_and_game_state():
+    """Final games and settled past dates are final; other dates follow the calendar"""
+    policy = TTLPolicy(season_prefixes=('team_stats_',))
+
+    assert policy.classify('game_2025-06-15_1', {'status': 'Final'}, TODAY) == 'final'
+    assert policy.classify('games_2025-06-15', [{'status': 'Preview'}], TODAY) == 'current'
+    assert policy.classify('games_2025-06-10', [{'status': 'Final'}], TODAY) == 'final'
+    assert policy.classify('all_predictions_v2_2025-06-10', {'games': [{'game_id': 1}]}, TODAY) == 'final'
+    # A past date still holding unfinished games (e.g. a sample-data fallback) is retried
+    assert policy.classify('games_2025-06-10', [{'status': 'Preview'}], TODAY) == 'current'
+    # Late games run past midnight, so yesterday isn't settled yet
+    assert policy.classify('all_predictions_v2_2025-06-14', {'games': []}, TODAY) == 'current'
+    assert policy.classify('games_2025-06-16', [{'status': 'Preview'}], TODAY) == 'upcoming'
+    assert policy.classify('team_stats_league_2025', {}, TODAY) == 'season'
+    assert policy.classify('game_weather_1', {}, TODAY) is None
+
+
+def test_ttl_for_each_kind():
+    policy = TTLPolicy(season_prefixes=('team_stats_',))
+    today = date.today()
+    future = (today + timedelta(days=1)).isoformat()
+
+    assert policy.ttl_for('game_2020-06-01_1', {'status': 'Final'}, 900) is None
+    assert policy.ttl_for(f'games_{today.isoformat()}', [{'status': 'Preview'}], 900) == 900
+    assert policy.ttl_for(f'games_{future}', [{'status': 'Preview'}], 900) == UPCOMING_TTL
+    assert policy.ttl_for('team_stats_Boston Red Sox', {'team_era': 4.1}, 900) == SEASON_TTL
+    assert policy.ttl_for('game_weather_1', {}, 900) == 900
+
+
+def test_namespace_policy_keeps_final_games(tmp_path):
+    """Under the default mlb_stats policy, final games outlive the namespace TTL and current games don't"""
+    cache = CacheEngine().namespace('mlb_stats', str(tmp_path))
+    today = date.today().isoformat()
+    cache.set('game_2020-06-01_1', {'game_id': 1, 'status': 'Final'})
+    cache.set(f'game_{today}_2', {'game_id': 2, 'status': 'Preview'})
+
+    old = time.time() - 2 * cache.ttl
+    for key in ('game_2020-06-01_1', f'game_{today}_2'):
+        os.utime(tmp_path / f'{key}.json', (old, old))
+    cache.engine.memory_clear(cache.cache_dir)
+
+    assert cache.get_many(['game_2020-06-01_1', f'game_{today}_2']) == {'game_2020-06-01_1': {'game_id': 1, 'status': 'Final'}}
+    assert cache.get(f'game_{today}_2') is None
+
+
+def test_sqlite_backend_stores_policy_expiry(tmp_path):
+    """Never-expiring entries have no expiry column, so purges keep them"""
+    engine = CacheEngine(backend='sqlite', db_path=str(tmp_path / 'cache.sqlite3'))
+    cache = engine.namespace('mlb_stats', str(tmp_path / 'mlb_stats'))
+    cache.set_many({'games_2020-06-01': [{'status': 'Final'}], 'team_stats_Boston Red Sox': {'team_era': 4.1}})
+
+    rows = dict(engine._store.connection().execute('SELECT cache_key, expires_at - stored_at FROM cache_entries'))
+    assert rows == {'games_2020-06-01': None, 'team_stats_Boston Red Sox': SEASON_TTL}
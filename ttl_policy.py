@@ -0,0 +1,175 @@
+import re
+from datetime import date, timedelta
+
+# Lifetime (in seconds) of each kind of entry a TTL policy recognizes.
+# Entries of no recognized kind keep their namespace's TTL.
+UPCOMING_TTL = 3600 * 1
+SEASON_TTL = 3600 * 24
+
+# Dates embedded in cache keys (e.g. games_2025-06-01, game_2025-06-01_745123)
+DATE_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+
+def key_date(cache_key):
+    """
+    Latest date embedded in a cache key
+
+    Keys covering a range (e.g. schedule_index_{start}_{end}) are dated by
+    their last day.
+
+    Args:
+        cache_key: Cache key
+
+    Returns:
+        datetime.date, or None if the key holds no date
+    """
+    dates = []
+    for match in DATE_PATTERN.findall(cache_key):
+        try:
+            dates.append(date.fromisoformat(match))
+        except ValueError:
+            continue
+    return max(dates) if dates else None
+
+
+def status_state(status):
+    """
+    Normalize a game status to 'final', 'live' or 'pregame'
+
+    Args:
+        status: MLB abstractGameState ('Preview', 'Live', 'Final') or a
+            detailed state such as 'In Progress' or 'Game Over'
+
+    Returns:
+        Normalized state, or None if status is missing
+    """
+    if not isinstance(status, str) or not status:
+        return None
+    status = status.lower()
+    if status.startswith(('final', 'game over', 'completed')):
+        return 'final'
+    if status in ('live', 'in progress') or status.startswith(('manager challenge', 'delayed')):
+        return 'live'
+    return 'pregame'
+
+
+def game_state(data):
+    """
+    State of the games an entry describes
+
+    Accepts a single game record, a list of game records or a payload with a
+    'games' list. A list is only 'final' once every game in it is.
+
+    Args:
+        data: Cached data
+
+    Returns:
+        'final', 'live', 'pregame', or None if the data carries no game status
+    """
+    if isinstance(data, dict):
+        if 'status' in data:
+            return status_state(data['status'])
+        data = data.get('games')
+    if not isinstance(data, list) or not data:
+        return None
+
+    states = {status_state(game.get('status')) if isinstance(game, dict) else None for game in data}
+    if None in states:
+        return None
+    if states == {'final'}:
+        return 'final'
+    return 'live' if 'live' in states else 'pregame'
+
+
+class TTLPolicy:
+    """
+    Picks each entry's TTL from its key and the game state in its data
+
+    - Games that are final, and dates before yesterday, never expire (a date's
+      slate is only settled once every game on it is final, so a stale
+      sample-data fallback for a past date is still retried)
+    - Today's and yesterday's entries keep the namespace TTL
+    - Future dates refresh every UPCOMING_TTL seconds (or the namespace TTL
+      if that is longer)
+    - Keys with one of the season prefixes (season aggregates such as pitcher
+      ERAs and team stats) refresh every SEASON_TTL seconds
+
+    Yesterday stays on the namespace TTL because late games run past
+    midnight on the server clock.
+    """
+
+    def __init__(self, season_prefixes=()):
+        """
+        Initialize the TTL policy
+
+        Args:
+            season_prefixes: Cache key prefixes of season aggregate entries
+        """
+        self.season_prefixes = tuple(season_prefixes)
+
+    def classify(self, cache_key, data, today=None):
+        """
+        Kind of an entry, as far as its lifetime is concerned
+
+        Args:
+            cache_key: Cache key
+            data: Cached data
+            today: Date to classify against (defaults to date.today())
+
+        Returns:
+            'final', 'upcoming', 'season', 'current', or None if the entry is
+            of no recognized kind
+        """
+        if self.season_prefixes and cache_key.startswith(self.season_prefixes):
+            return 'season'
+
+        state = game_state(data)
+        if state == 'final':
+            return 'final'
+
+        entry_date = key_date(cache_key)
+        if entry_date is None:
+            return None
+
+        today = today or date.today()
+        if entry_date < today - timedelta(days=1):
+            # Past dates are settled unless their games say otherwise
+            return 'final' if state is None else 'current'
+        if entry_date > today:
+            return 'upcoming'
+        return 'current'
+
+    def ttl_for(self, cache_key, data, default_ttl):
+        """
+        TTL of an entry
+
+        Args:
+            cache_key: Cache key
+            data: Cached data
+            default_ttl: Namespace TTL, used for current and unrecognized entries
+
+        Returns:
+            Time-to-live in seconds, or None if the entry never expires
+        """
+        kind = self.classify(cache_key, data)
+        if kind == 'final':
+            return None
+        if kind == 'upcoming':
+            return max(UPCOMING_TTL, default_ttl)
+        if kind == 'season':
+            return SEASON_TTL
+        return default_ttl
+
+
+# Default TTL policy of every namespace holding dated or season data. The
+# season prefixes are the per-team and per-pitcher stat lookups of each source.
+NAMESPACE_POLICIES = {
+    'mlb_stats': TTLPolicy(season_prefixes=('pitcher_era_', 'team_stats_')),
+    'predictions': TTLPolicy(),
+    'mlb_data': TTLPolicy(),
+    'espn': TTLPolicy(season_prefixes=('espn_team_', 'espn_pitcher_', 'espn_era_')),
+    'espn_direct': TTLPolicy(season_prefixes=('espn_era_',)),
+    'bbref': TTLPolicy(season_prefixes=('bbref_pitcher_',)),
+    'mlb_direct': TTLPolicy(season_prefixes=('mlb_direct_pitcher_', 'multi_source_pitcher_')),
+    'first_inning': TTLPolicy(season_prefixes=('first_inning_',))
+}
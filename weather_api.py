@@ -1,7 +1,8 @@
-import requests
 import json
 import os
 from datetime import datetime
+from cache_engine import get_cache_engine
+from http_client import get_http_client
 
 class WeatherAPI:
     """
@@ -12,42 +13,17 @@ class WeatherAPI:
         """Initialize the weather API client"""
         self.api_key = "4da2a5f907a8f5bcf9d0ef8c58e9aa12"  # OpenWeatherMap API key
         self.cache_dir = 'cache/weather'
-        self.cache_expiry = 3600 * 3  # Cache expiry in seconds (3 hours)
-        os.makedirs(self.cache_dir, exist_ok=True)
+        self.cache = get_cache_engine().namespace('weather', self.cache_dir, layout='envelope')
+        self.http = get_http_client()
+        self.cache_expiry = self.cache.ttl  # Cache expiry in seconds
     
     def get_cached_data(self, city):
         """Get weather data from cache if available and not expired"""
-        cache_file = os.path.join(self.cache_dir, f"{city.replace(',', '_')}.json")
-        
-        if os.path.exists(cache_file):
-            try:
-                with open(cache_file, 'r') as f:
-                    cached_data = json.load(f)
-                
-                # Check if cache is expired
-                cache_time = cached_data.get('cache_time', 0)
-                if (datetime.now() - datetime.fromtimestamp(cache_time)).total_seconds() < self.cache_expiry:
-                    return cached_data.get('data')
-            except Exception as e:
-                print(f"Error reading weather cache: {e}")
-        
-        return None
+        return self.cache.get(city.replace(',', '_'))
     
     def save_to_cache(self, city, data):
         """Save weather data to cache"""
-        cache_file = os.path.join(self.cache_dir, f"{city.replace(',', '_')}.json")
-        
-        try:
-            with open(cache_file, 'w') as f:
-                json.dump({
-                    'data': data,
-                    'cache_time': datetime.now().timestamp()
-                }, f)
-            
-            return True
-        except Exception as e:
-            print(f"Error saving weather to cache: {e}")
-            return False
+        return self.cache.set(city.replace(',', '_'), data)
     
     def get_weather(self, city):
         """
@@ -60,7 +36,7 @@ class WeatherAPI:
         
         try:
             url = f"https://api.openweathermap.org/data/2.5/weather?q={city}&appid={self.api_key}&units=imperial"
-            response = requests.get(url)
+            response = self.http.get(url)
             data = response.json()
             
             if data.get('cod') != 200: